@@ -0,0 +1,69 @@
+"""Compare batch block decoding with decoding each register on its own.
+
+The block is the live sensor block of the real register map, so this needs
+Home Assistant installed (requirements.txt), since const.py imports it.
+Run from the repository root:
+
+    python benchmarks/decode_block.py
+"""
+
+import importlib
+from pathlib import Path
+import random
+import sys
+import timeit
+import types
+
+COMPONENT_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "sabiana_energy_smart"
+)
+PACKAGE = "sabiana_energy_smart_standalone"
+
+
+def load(name: str):
+    """Import an integration module without running its __init__."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(COMPONENT_DIR)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+def main() -> None:
+    try:
+        import homeassistant  # noqa: F401
+    except ImportError:
+        sys.exit("Home Assistant is not installed: pip install -r requirements.txt")
+
+    catalog = load("catalog").get_catalog()
+    layout = catalog.block_layouts[0]
+    codecs = [catalog.codecs[key] for key in layout.keys]
+
+    rng = random.Random(0)
+    registers = [rng.randrange(0x10000) for _ in range(layout.count)]
+    data = {layout.start + offset: raw for offset, raw in enumerate(registers)}
+
+    per_register = {c.key: c.decode(data) for c in codecs}
+    batch = layout.decode_mapping(data)
+    assert per_register.keys() == batch.keys()
+    assert all(
+        per_register[key] == batch[key] or per_register[key] != per_register[key]
+        for key in batch
+    ), "batch and per-register decoding disagree"
+
+    runs = 20000
+    cases = {
+        "per-register codecs": lambda: {c.key: c.decode(data) for c in codecs},
+        "batch decode": lambda: layout.decode(registers),
+        "batch from mapping": lambda: layout.decode_mapping(data),
+    }
+    print(f"{len(codecs)} values over {layout.count} registers, {runs} runs")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=runs, repeat=5))
+        print(f"  {name:<24} {best / runs * 1e6:8.2f} µs per block")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measure what importing the register map costs, and what the catalog adds.
+
+Each measurement runs in a fresh interpreter, so module caches do not hide
+the import work. Needs Home Assistant installed (requirements.txt), since
+const.py imports it. Run from the repository root:
+
+    python benchmarks/import_time.py
+"""
+
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+COMPONENT_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "sabiana_energy_smart"
+)
+PACKAGE = "sabiana_energy_smart_standalone"
+
+# Loads the integration modules without running its __init__
+_PRELUDE = f"""
+import importlib, json, sys, time, tracemalloc, types
+package = types.ModuleType({PACKAGE!r})
+package.__path__ = [{str(COMPONENT_DIR)!r}]
+sys.modules[{PACKAGE!r}] = package
+import homeassistant.helpers.entity
+def load(name):
+    return importlib.import_module({PACKAGE!r} + "." + name)
+"""
+
+_MEASURE = """
+tracemalloc.start()
+started = time.perf_counter()
+load("const")
+load("catalog")
+imported = time.perf_counter()
+import_mem = tracemalloc.get_traced_memory()[0]
+catalog = load("catalog").get_catalog()
+built = time.perf_counter()
+build_mem = tracemalloc.get_traced_memory()[0] - import_mem
+load("catalog").get_catalog()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "import_kib": import_mem / 1024,
+    "build_ms": (built - imported) * 1000,
+    "build_kib": build_mem / 1024,
+    "cached_us": (time.perf_counter() - built) * 1e6,
+    "codecs": len(catalog.codecs),
+}))
+"""
+
+
+def measure() -> dict[str, float]:
+    """Run one measurement in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PRELUDE + _MEASURE],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    try:
+        import homeassistant  # noqa: F401
+    except ImportError:
+        sys.exit("Home Assistant is not installed: pip install -r requirements.txt")
+
+    runs = [measure() for _ in range(7)]
+    print(f"{runs[0]['codecs']} codecs, median of {len(runs)} fresh interpreters")
+    for name, label, unit in (
+        ("import_ms", "import const + catalog", "ms"),
+        ("import_kib", "  memory after import", "KiB"),
+        ("build_ms", "first get_catalog()", "ms"),
+        ("build_kib", "  memory of the catalog", "KiB"),
+        ("cached_us", "later get_catalog()", "µs"),
+    ):
+        value = statistics.median(run[name] for run in runs)
+        print(f"  {label:<26} {value:9.2f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,11 @@ from homeassistant.const import (
     # EVENT_HOMEASSISTANT_STOP,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN, LOGGER
+from .identity import SabianaIdentityStore
 from .modbus_coordinator import SabianaModbusCoordinator
 
 # from .info_sensor import SabianaInfoCoordinator
@@ -35,21 +37,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sabiana Energy Smart from a config entry."""
     LOGGER.debug("Initializing Sabiana integration")
 
-    coordinator = SabianaModbusCoordinator(hass, entry.data)
-    await coordinator.async_setup()
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-
+    # Options set after setup override the values given when adding the unit
+    coordinator = SabianaModbusCoordinator(
+        hass, {**entry.data, **entry.options}, entry.entry_id
+    )
     # info_coordinator = SabianaInfoCoordinator(hass, entry)
     # info = await info_coordinator._async_update_data()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Entities start from the identity saved on disk and the platforms are
+    # set up without touching the bus. The identity block and the first poll
+    # of the registers the entities subscribed to then run side by side.
+    try:
+        await coordinator.async_setup()
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        coordinator.async_refresh_identity()
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        # Give back the shared connection so a retry starts clean
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        await coordinator.async_close()
+        raise
+
+    # Entities show unknown until this first poll lands
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first poll {entry.entry_id}"
+    )
 
     LOGGER.info("Sabiana Energy Smart integration initialized successfully")
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate a config entry created by an older version."""
+    if entry.version > 1:
+        # Downgraded from a future version
+        return False
+
+    if entry.minor_version < 2:
+        # Unique IDs used to be global ("sabiana_sensor_<key>"), so a second
+        # unit could not add any entity; prefix them with the entry ID
+        @callback
+        def _scope_unique_id(
+            entity_entry: er.RegistryEntry,
+        ) -> dict[str, str] | None:
+            if not entity_entry.unique_id.startswith("sabiana_"):
+                return None
+            suffix = entity_entry.unique_id.removeprefix("sabiana_")
+            return {"new_unique_id": f"{entry.entry_id}_{suffix}"}
+
+        await er.async_migrate_entries(hass, entry.entry_id, _scope_unique_id)
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+        LOGGER.debug("Migrated %s to config entry version 1.2", entry.title)
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator = hass.data[DOMAIN].pop(entry.entry_id)
@@ -57,3 +99,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Ensure Modbus client is closed
     await coordinator.async_close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the identity saved for a removed config entry."""
+    await SabianaIdentityStore(hass, entry.entry_id).async_remove()
@@ -9,11 +9,18 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DIAGNOSTIC_DEFINITIONS, DOMAIN, get_device_info
+from .catalog import KIND_BINARY_SENSOR
+from .const import (
+    DIAGNOSTIC_DEFINITIONS,
+    DOMAIN,
+    POLL_SLOW,
+)
+from .entity import SabianaEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 INVERSION_FLAG_ADDRESS = 0x0104  # CFG_Inverted
+INVERSION_FLAG_KEY = DIAGNOSTIC_DEFINITIONS[INVERSION_FLAG_ADDRESS]["bits"][0]["key"]
 
 
 async def async_setup_entry(
@@ -25,29 +32,27 @@ async def async_setup_entry(
     sensors = []
 
     # Always register the inversion flag address
-    coordinator.register_address(INVERSION_FLAG_ADDRESS)
-
-    for addr, reg in DIAGNOSTIC_DEFINITIONS.items():
-        entity_category = reg.get("entity_category", None)
-        for bit_num, bit_def in reg.get("bits", {}).items():
-            coordinator.register_address(addr)
-            sensors.append(
-                SabianaBinarySensor(
-                    coordinator=coordinator,
-                    address=addr,
-                    bit_num=bit_num,
-                    key=bit_def["key"],
-                    name=bit_def["name"],
-                    entry_id=entry.entry_id,
-                    entity_category=entity_category,
-                )
+    coordinator.register_address(INVERSION_FLAG_ADDRESS, POLL_SLOW)
+
+    for record in coordinator.catalog.kind(KIND_BINARY_SENSOR):
+        coordinator.register_address(record.address, record.poll_class)
+        sensors.append(
+            SabianaBinarySensor(
+                coordinator=coordinator,
+                address=record.address,
+                bit_num=record.bit,
+                key=record.key,
+                name=record.name,
+                entry_id=entry.entry_id,
+                entity_category=record.entity_category,
             )
+        )
 
     _LOGGER.debug("Adding %d binary sensors with inversion logic", len(sensors))
     async_add_entities(sensors)
 
 
-class SabianaBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class SabianaBinarySensor(SabianaEntity, BinarySensorEntity):
     """Binary sensor with support for global inversion flag at 0x0104."""
 
     def __init__(
@@ -60,13 +65,17 @@ class SabianaBinarySensor(CoordinatorEntity, BinarySensorEntity):
         entry_id: str,
         entity_category=None,
     ):
-        super().__init__(coordinator)
+        # The global inversion flag affects every sensor's state
+        super().__init__(
+            coordinator, context=frozenset({address, INVERSION_FLAG_ADDRESS})
+        )
         self._address = address
         self._bit_num = bit_num
+        self._key = key
 
         self._attr_name = name
-        self._attr_unique_id = f"sabiana_bin_{key}"
-        self._attr_device_info = DeviceInfo(**get_device_info(entry_id))
+        self._attr_unique_id = f"{entry_id}_bin_{key}"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info())
         self._attr_entity_category = entity_category
         _LOGGER.debug(
             "Initialized binary sensor %s (bit %d @ 0x%04X)", name, bit_num, address
@@ -74,43 +83,15 @@ class SabianaBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        raw = self.coordinator.data.get(self._address)
-
-        if raw is None:
-            _LOGGER.debug("No data at 0x%04X for %s", self._address, self.name)
+        bit_value = self.coordinator.values.get(self._key)
+        if bit_value is None:
             return None
 
-        bit_value = bool((raw >> self._bit_num) & 1)
-
         # ✅ Skip inversion logic if this sensor is the inversion flag itself
-        if self._address == INVERSION_FLAG_ADDRESS and self._bit_num == 0:
-            _LOGGER.debug(
-                "%s: raw=0x%04X → bit[%d]=%s (inversion flag, no flip)",
-                self.name,
-                raw,
-                self._bit_num,
-                bit_value,
-            )
+        if self._key == INVERSION_FLAG_KEY:
             return bit_value
 
         # Apply global inversion if flag is set
-        inversion = self.coordinator.data.get(INVERSION_FLAG_ADDRESS)
-        if inversion is not None and (inversion & 0x01):
-            bit_value = not bit_value
-            _LOGGER.debug(
-                "%s: raw=0x%04X → bit[%d]=%s (inverted)",
-                self.name,
-                raw,
-                self._bit_num,
-                bit_value,
-            )
-        else:
-            _LOGGER.debug(
-                "%s: raw=0x%04X → bit[%d]=%s (normal)",
-                self.name,
-                raw,
-                self._bit_num,
-                bit_value,
-            )
-
+        if self.coordinator.values.get(INVERSION_FLAG_KEY):
+            return not bit_value
         return bit_value
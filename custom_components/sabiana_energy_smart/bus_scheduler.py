@@ -0,0 +1,170 @@
+"""Poll timeline shared by the devices behind one Modbus gateway."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+import time
+from typing import Any
+
+# Shortest poll turn a device gets, however many share the bus
+MIN_POLL_BUDGET = 0.2
+# Seconds of history the utilization figure covers
+UTILIZATION_WINDOW = 60.0
+
+
+class PollTurn:
+    """A device's exclusive window for polling the bus."""
+
+    __slots__ = ("owner", "started", "deadline")
+
+    def __init__(self, owner: Hashable, started: float, budget: float) -> None:
+        self.owner = owner
+        self.started = started
+        self.deadline = started + budget
+
+    @property
+    def expired(self) -> bool:
+        """Return True once the turn has used up its bus time budget."""
+        return time.monotonic() >= self.deadline
+
+
+class BusScheduler:
+    """Hand out poll turns to the devices sharing a bus, one at a time.
+
+    Each coordinator polls inside a turn, so the poll cycles of
+    daisy-chained units are staggered instead of colliding at the gateway.
+    Turns are granted in request order and limited to an equal share of
+    the poll cycle, the shortest poll interval any device currently
+    uses; a device that runs out of budget defers the rest of its plan
+    to its next turn. Writes never wait for a turn: they go
+    straight to the connection's request queue ahead of queued polls, so
+    their latency is bounded by the transactions already on the wire.
+    """
+
+    def __init__(self, cycle: float) -> None:
+        # Cycle used until the devices report their poll interval
+        self.default_cycle = cycle
+        self._turn_lock = asyncio.Lock()
+        self._owners: dict[Hashable, dict[str, Any]] = {}
+        # (start, end) of the recent turns, for the utilization figure
+        self._busy: deque[tuple[float, float]] = deque()
+
+    @property
+    def cycle(self) -> float:
+        """Return the shortest poll interval of the devices on the bus."""
+        return min(
+            (
+                metrics["interval"]
+                for metrics in self._owners.values()
+                if metrics["interval"] is not None
+            ),
+            default=self.default_cycle,
+        )
+
+    @property
+    def budget(self) -> float:
+        """Return the bus time each device may poll for per turn."""
+        return max(MIN_POLL_BUDGET, self.cycle / max(1, len(self._owners)))
+
+    @property
+    def utilization(self) -> float:
+        """Return the share of the last UTILIZATION_WINDOW spent in poll turns."""
+        now = time.monotonic()
+        self._prune(now)
+        since = now - UTILIZATION_WINDOW
+        busy = sum(end - max(start, since) for start, end in self._busy)
+        return min(1.0, busy / UTILIZATION_WINDOW)
+
+    def register(self, owner: Hashable) -> None:
+        """Add a device to the bus timeline."""
+        self._owners.setdefault(
+            owner,
+            {
+                "interval": None,
+                "turns": 0,
+                "busy": 0.0,
+                "max_wait": 0.0,
+                "deferred_blocks": 0,
+                "last_write_latency": None,
+                "max_write_latency": 0.0,
+            },
+        )
+
+    def unregister(self, owner: Hashable) -> None:
+        """Remove a device from the bus timeline."""
+        self._owners.pop(owner, None)
+
+    @asynccontextmanager
+    async def poll_turn(self, owner: Hashable) -> AsyncIterator[PollTurn]:
+        """Wait for the bus, then hold it for one poll of ``owner``."""
+        queued_at = time.monotonic()
+        async with self._turn_lock:
+            turn = PollTurn(owner, time.monotonic(), self.budget)
+            try:
+                yield turn
+            finally:
+                self._record_turn(turn, turn.started - queued_at)
+
+    def set_interval(self, owner: Hashable, interval: float) -> None:
+        """Record the poll interval a device currently uses."""
+        if owner in self._owners:
+            self._owners[owner]["interval"] = interval
+
+    def record_deferred(self, owner: Hashable, blocks: int) -> None:
+        """Count block reads postponed because a turn ran out of budget."""
+        if owner in self._owners:
+            self._owners[owner]["deferred_blocks"] += blocks
+
+    def record_write(self, owner: Hashable, latency: float) -> None:
+        """Record how long a write took from request to completion."""
+        if owner in self._owners:
+            metrics = self._owners[owner]
+            metrics["last_write_latency"] = latency
+            metrics["max_write_latency"] = max(metrics["max_write_latency"], latency)
+
+    def stats(self) -> dict[str, Any]:
+        """Return bus utilization and per-device turn metrics."""
+        return {
+            "devices": len(self._owners),
+            "cycle_s": round(self.cycle, 2),
+            "poll_budget_ms": round(self.budget * 1000, 1),
+            "utilization": round(self.utilization, 3),
+            "per_device": {
+                owner: {
+                    "interval_s": metrics["interval"],
+                    "turns": metrics["turns"],
+                    "avg_turn_ms": round(
+                        metrics["busy"] / (metrics["turns"] or 1) * 1000, 1
+                    ),
+                    "max_wait_ms": round(metrics["max_wait"] * 1000, 1),
+                    "deferred_blocks": metrics["deferred_blocks"],
+                    "last_write_latency_ms": None
+                    if metrics["last_write_latency"] is None
+                    else round(metrics["last_write_latency"] * 1000, 1),
+                    "max_write_latency_ms": round(
+                        metrics["max_write_latency"] * 1000, 1
+                    ),
+                }
+                for owner, metrics in self._owners.items()
+            },
+        }
+
+    def _record_turn(self, turn: PollTurn, wait: float) -> None:
+        """Update the metrics after a turn ends."""
+        ended = time.monotonic()
+        self._busy.append((turn.started, ended))
+        self._prune(ended)
+        metrics = self._owners.get(turn.owner)
+        if metrics is None:
+            return
+        metrics["turns"] += 1
+        metrics["busy"] += ended - turn.started
+        metrics["max_wait"] = max(metrics["max_wait"], wait)
+
+    def _prune(self, now: float) -> None:
+        """Drop turns that ended before the utilization window."""
+        while self._busy and self._busy[0][1] < now - UTILIZATION_WINDOW:
+            self._busy.popleft()
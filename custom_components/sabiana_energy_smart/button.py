@@ -7,19 +7,21 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import BUTTON_DEFINITIONS, DOMAIN, LOGGER, get_device_info
+from .catalog import KIND_BUTTON, RegisterRecord
+from .const import DOMAIN, LOGGER
 
 
 class SabianaButton(CoordinatorEntity, ButtonEntity):
     """Modbus-based button entity for Sabiana."""
 
-    def __init__(self, coordinator, props: dict, entry_id: str):
-        super().__init__(coordinator)
-        self._address = props["address"]
-        self._key = props["key"]
-        self._attr_name = props["name"]
-        self._attr_unique_id = f"sabiana_button_{self._key}"
-        self._attr_device_info = DeviceInfo(**get_device_info(entry_id))
+    def __init__(self, coordinator, record: RegisterRecord, entry_id: str):
+        # Buttons show no register state; only availability changes matter
+        super().__init__(coordinator, context=frozenset())
+        self._address = record.address
+        self._key = record.key
+        self._attr_name = record.name
+        self._attr_unique_id = f"{entry_id}_button_{self._key}"
+        self._attr_device_info = DeviceInfo(**coordinator.device_info())
 
     async def async_press(self) -> None:
         try:
@@ -37,14 +39,10 @@ async def async_setup_entry(
 ):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     buttons = []
-    for address, props in BUTTON_DEFINITIONS.items():
-        if props.get("entity_type") == "button":
-            coordinator.register_address(address)
-            buttons.append(
-                SabianaButton(
-                    coordinator, {**props, "address": address}, entry.entry_id
-                )
-            )
+    for record in coordinator.catalog.kind(KIND_BUTTON):
+        # Buttons only trigger writes; there is nothing to poll
+        coordinator.register_write_address(record.address)
+        buttons.append(SabianaButton(coordinator, record, entry.entry_id))
 
     LOGGER.debug("Adding %d buttons", len(buttons))
     async_add_entities(buttons)
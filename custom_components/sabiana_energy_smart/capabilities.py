@@ -0,0 +1,85 @@
+"""Tell which optional hardware a unit has from its configuration bits."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from .catalog import RegisterRecord
+
+
+@dataclass(frozen=True, slots=True)
+class Capability:
+    """Optional feature announced by one bit of a configuration register."""
+
+    key: str
+    address: int
+    bit: int
+    # Registers that only exist when the feature is installed
+    registers: frozenset[int]
+
+    def detect(self, registers: Mapping[int, int | None]) -> bool | None:
+        """Return whether the feature is installed, None if not read yet."""
+        raw = registers.get(self.address)
+        if raw is None:
+            return None
+        return bool(raw >> self.bit & 1)
+
+
+def build_capabilities(
+    definitions: Mapping[str, Mapping[str, Any]],
+) -> tuple[Capability, ...]:
+    """Turn CAPABILITY_BITS into capabilities."""
+    return tuple(
+        Capability(key, cap["address"], cap["bit"], frozenset(cap["registers"]))
+        for key, cap in definitions.items()
+    )
+
+
+def capability_addresses(capabilities: Iterable[Capability]) -> frozenset[int]:
+    """Return the configuration registers announcing the capabilities."""
+    return frozenset(capability.address for capability in capabilities)
+
+
+def detect_capabilities(
+    capabilities: Iterable[Capability], registers: Mapping[int, int | None]
+) -> dict[str, bool]:
+    """Return the state of every capability whose register was read."""
+    detected = {
+        capability.key: capability.detect(registers) for capability in capabilities
+    }
+    return {key: present for key, present in detected.items() if present is not None}
+
+
+def absent_registers(
+    capabilities: Iterable[Capability], detected: Mapping[str, bool]
+) -> frozenset[int]:
+    """Return the registers of the features the unit reports as missing.
+
+    Features not read yet count as installed, so nothing is dropped before
+    the unit has been asked.
+    """
+    return frozenset(
+        addr
+        for capability in capabilities
+        if detected.get(capability.key) is False
+        for addr in capability.registers
+    )
+
+
+def prune_records(
+    records: Iterable[RegisterRecord], absent: frozenset[int]
+) -> list[RegisterRecord]:
+    """Return the records reading none of the absent registers."""
+    return [record for record in records if absent.isdisjoint(record.addresses)]
+
+
+@cache
+def get_capabilities() -> tuple[Capability, ...]:
+    """Return the capabilities of the built-in register map."""
+    # const needs Home Assistant; load it only when first asked
+    from .const import CAPABILITY_BITS
+
+    return build_capabilities(CAPABILITY_BITS)
@@ -0,0 +1,282 @@
+"""Typed register catalog shared by every platform, built on first use."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
+from typing import Any
+
+from .codec import RegisterCodec, compile_codec, index_by_address, register_count
+from .helpers import BlockLayout, compile_block_layout
+
+Definition = Mapping[str, Any]
+
+# Entity kinds a register record can back
+KIND_SENSOR = "sensor"
+KIND_NUMBER = "number"
+KIND_SWITCH = "switch"
+KIND_SELECT = "select"
+KIND_BUTTON = "button"
+KIND_BINARY_SENSOR = "binary_sensor"
+KIND_IDENTITY = "identity"
+
+_NO_DEFINITIONS: Mapping[int, Definition] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterRecord:
+    """One entity value in the register map.
+
+    ``type`` and the numeric fields are what the value is decoded with;
+    ``bit`` selects a single bit of a bitfield register. ``length`` is the
+    number of registers the value spans. Records that are not
+    ``readable`` are only ever written, e.g. command triggers and the
+    external sensor inputs.
+    """
+
+    key: str
+    address: int
+    kind: str
+    name: str = ""
+    type: str = "uint16"
+    data_length: int = 1
+    scale: float = 1
+    precision: int = 0
+    signed: bool = False
+    bit: int | None = None
+    minimum: float | None = None
+    maximum: float | None = None
+    unit: str | None = None
+    device_class: str | None = None
+    entity_category: Any = None
+    options: Mapping[int, str] | None = None
+    poll_class: str = "live"
+    readable: bool = True
+    writable: bool = False
+    length: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        length = (
+            1 if self.bit is not None else register_count(self.type, self.data_length)
+        )
+        object.__setattr__(self, "length", length)
+
+    @property
+    def addresses(self) -> range:
+        """Return the register addresses the value is read from."""
+        return range(self.address, self.address + self.length)
+
+    def compile(self) -> RegisterCodec:
+        """Build the decoder of the value."""
+        return compile_codec(
+            self.key,
+            self.address,
+            self.type,
+            scale=self.scale,
+            precision=self.precision,
+            data_length=self.data_length,
+            bit=self.bit,
+            signed=self.signed,
+        )
+
+
+def build_records(
+    *,
+    sensors: Mapping[int, Definition] = _NO_DEFINITIONS,
+    registers: Mapping[int, Definition] = _NO_DEFINITIONS,
+    switches: Mapping[int, Definition] = _NO_DEFINITIONS,
+    buttons: Mapping[int, Definition] = _NO_DEFINITIONS,
+    selects: Mapping[int, Definition] = _NO_DEFINITIONS,
+    diagnostics: Mapping[int, Definition] = _NO_DEFINITIONS,
+    firmware: Mapping[int, Definition] = _NO_DEFINITIONS,
+) -> Iterator[RegisterRecord]:
+    """Turn the definition tables of const.py into register records."""
+    for addr, reg in sensors.items():
+        if reg.get("entity_type") in ("switch", "button"):
+            continue
+        yield RegisterRecord(
+            reg["key"],
+            addr,
+            KIND_SENSOR,
+            name=reg["name"],
+            type=reg.get("type") or "uint16",
+            scale=reg.get("scale", 1),
+            precision=reg.get("precision", 0),
+            unit=reg.get("unit"),
+            device_class=reg.get("device_class"),
+            poll_class=reg["poll_class"],
+        )
+    for addr, reg in registers.items():
+        if not reg.get("writable"):
+            continue
+        minimum = reg.get("min", 0)
+        yield RegisterRecord(
+            reg["key"],
+            addr,
+            KIND_NUMBER,
+            name=reg["name"],
+            scale=reg.get("scale", 1),
+            precision=reg.get("precision", 0),
+            # Registers accepting negative values are two's complement
+            signed=minimum < 0,
+            minimum=minimum,
+            maximum=reg.get("max", 0),
+            unit=reg.get("unit", ""),
+            # Write-only inputs declare no poll class
+            poll_class=reg.get("poll_class", "live"),
+            readable=bool(reg.get("readable")),
+            writable=True,
+        )
+    for addr, reg in switches.items():
+        if reg.get("entity_type") != "switch":
+            continue
+        yield RegisterRecord(
+            reg["key"],
+            addr,
+            KIND_SWITCH,
+            name=reg["name"],
+            type="bool",
+            bit=reg.get("bit"),
+            poll_class=reg["poll_class"],
+            writable=True,
+        )
+    for addr, reg in buttons.items():
+        if reg.get("entity_type") != "button":
+            continue
+        yield RegisterRecord(
+            reg["key"],
+            addr,
+            KIND_BUTTON,
+            name=reg["name"],
+            readable=False,
+            writable=True,
+        )
+    for addr, reg in selects.items():
+        if not (reg.get("options") and reg.get("writable")):
+            continue
+        yield RegisterRecord(
+            reg["key"],
+            addr,
+            KIND_SELECT,
+            name=reg["name"],
+            options=MappingProxyType(dict(reg["options"])),
+            poll_class=reg["poll_class"],
+            writable=True,
+        )
+    for addr, reg in diagnostics.items():
+        for bit, bit_def in reg.get("bits", {}).items():
+            yield RegisterRecord(
+                bit_def["key"],
+                addr,
+                KIND_BINARY_SENSOR,
+                name=bit_def["name"],
+                bit=bit,
+                entity_category=reg.get("entity_category"),
+                poll_class=reg["poll_class"],
+            )
+    for addr, reg in firmware.items():
+        if not reg.get("readable"):
+            continue
+        yield RegisterRecord(
+            reg["key"],
+            addr,
+            KIND_IDENTITY,
+            name=reg["name"],
+            type=reg.get("type") or "uns16",
+            data_length=reg.get("dataLength", 1),
+            scale=reg.get("scale", 1),
+            precision=reg.get("precision", 0),
+            unit=reg.get("unit") or None,
+            device_class=reg.get("device_class"),
+            poll_class=reg["poll_class"],
+        )
+
+
+class RegisterCatalog:
+    """Read-only register map, indexed by address, key and entity kind.
+
+    Everything derived from the records (the value decoders, the block
+    layout of the live sensors and the identity addresses) is computed
+    once here and shared by the coordinator and every platform.
+    """
+
+    __slots__ = (
+        "records",
+        "by_key",
+        "by_address",
+        "by_kind",
+        "codecs",
+        "codecs_by_address",
+        "block_layouts",
+        "identity_codecs",
+        "identity_addresses",
+    )
+
+    def __init__(self, records: Iterable[RegisterRecord]) -> None:
+        self.records = tuple(records)
+        by_key = {record.key: record for record in self.records}
+        if len(by_key) != len(self.records):
+            raise ValueError("Register definitions contain duplicate keys")
+        self.by_key: Mapping[str, RegisterRecord] = MappingProxyType(by_key)
+
+        by_address: dict[int, list[RegisterRecord]] = {}
+        by_kind: dict[str, list[RegisterRecord]] = {}
+        for record in self.records:
+            for addr in record.addresses:
+                by_address.setdefault(addr, []).append(record)
+            by_kind.setdefault(record.kind, []).append(record)
+        self.by_address: Mapping[int, tuple[RegisterRecord, ...]] = MappingProxyType(
+            {addr: tuple(entries) for addr, entries in by_address.items()}
+        )
+        self.by_kind: Mapping[str, tuple[RegisterRecord, ...]] = MappingProxyType(
+            {kind: tuple(entries) for kind, entries in by_kind.items()}
+        )
+
+        # Buttons only trigger writes; they have no value to decode
+        codecs = {
+            record.key: record.compile()
+            for record in self.records
+            if record.kind != KIND_BUTTON
+        }
+        self.codecs: Mapping[str, RegisterCodec] = MappingProxyType(codecs)
+        self.codecs_by_address: Mapping[int, tuple[RegisterCodec, ...]] = (
+            MappingProxyType(index_by_address(codecs.values()))
+        )
+        # The live sensor block changes on nearly every poll and is decoded
+        # in one pass
+        sensors = self.kind(KIND_SENSOR)
+        self.block_layouts: tuple[BlockLayout, ...] = (
+            (compile_block_layout(sensors),) if sensors else ()
+        )
+        # Serial number, model and firmware releases
+        self.identity_codecs = tuple(
+            codecs[record.key] for record in self.kind(KIND_IDENTITY)
+        )
+        self.identity_addresses = frozenset(
+            addr for codec in self.identity_codecs for addr in codec.addresses
+        )
+
+    def kind(self, kind: str) -> tuple[RegisterRecord, ...]:
+        """Return the records backing entities of one kind."""
+        return self.by_kind.get(kind, ())
+
+
+@cache
+def get_catalog() -> RegisterCatalog:
+    """Return the catalog of the built-in register map, building it once."""
+    # const needs Home Assistant; load it only when the catalog is built
+    from . import const
+
+    return RegisterCatalog(
+        build_records(
+            sensors=const.SENSOR_DEFINITIONS_NEW,
+            registers=const.REGISTER_DEFINITIONS,
+            switches=const.SWITCH_DEFINITIONS,
+            buttons=const.BUTTON_DEFINITIONS,
+            selects=const.SELECT_DEFINITIONS,
+            diagnostics=const.DIAGNOSTIC_DEFINITIONS,
+            firmware=const.FIRMWARE_INFO,
+        )
+    )
@@ -0,0 +1,77 @@
+"""Circuit breaker guarding connection attempts to a Modbus gateway."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Seconds before the first retry, doubled per failure up to the maximum
+BACKOFF_INITIAL = 2.0
+BACKOFF_MAX = 60.0
+
+
+class CircuitBreaker:
+    """Stop retrying a dead connection until its backoff has passed.
+
+    closed
+        Connection attempts go through.
+    open
+        The last attempt failed; every caller fails fast until the retry
+        time, which backs off exponentially with jitter.
+    half_open
+        The retry time has passed and a single probe attempt is in
+        progress; other callers keep failing fast until it resolves.
+    """
+
+    def __init__(
+        self, initial: float = BACKOFF_INITIAL, maximum: float = BACKOFF_MAX
+    ) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next attempt is allowed."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if the caller may attempt to connect now."""
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN and time.monotonic() >= self._retry_at:
+            self.state = STATE_HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful attempt."""
+        self.state = STATE_CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> float:
+        """Open the circuit after a failed attempt; return the backoff."""
+        self.failures += 1
+        delay = min(self.maximum, self.initial * 2 ** (self.failures - 1))
+        # Equal jitter, so units behind one gateway do not retry in lockstep
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self.state = STATE_OPEN
+        self._retry_at = time.monotonic() + delay
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in_s": round(self.retry_in, 1),
+        }
@@ -0,0 +1,141 @@
+"""Precompiled decoders that turn raw Modbus registers into entity values."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+import struct
+from typing import Any
+
+_UINT16 = struct.Struct(">H")
+_INT16 = struct.Struct(">h")
+
+# struct format and register width of each numeric register type, shared
+# by the single-value codecs and the block layouts
+NUMERIC_FORMATS = {
+    "uint16": ("H", 1),
+    "uns16": ("H", 1),
+    "int16": ("h", 1),
+    "sig16": ("h", 1),
+    "uint32": ("I", 2),
+    "uns32": ("I", 2),
+    "float32": ("f", 2),
+}
+# Float registers carry engineering units already; scale is not applied
+UNSCALED_TYPES = ("float32",)
+
+
+class RegisterCodec:
+    """Decoder for one value spread over ``count`` registers at ``address``."""
+
+    __slots__ = ("key", "address", "count", "_decode")
+
+    def __init__(
+        self,
+        key: str,
+        address: int,
+        count: int,
+        decode: Callable[[Sequence[int]], Any],
+    ) -> None:
+        self.key = key
+        self.address = address
+        self.count = count
+        self._decode = decode
+
+    @property
+    def addresses(self) -> range:
+        """Return the register addresses the value is decoded from."""
+        return range(self.address, self.address + self.count)
+
+    def decode(self, data: Mapping[int, int | None]) -> Any:
+        """Decode the value from an address → raw register mapping."""
+        if self.count == 1:
+            raw = data.get(self.address)
+            return None if raw is None else self._decode((raw,))
+        registers = [data.get(addr) for addr in self.addresses]
+        if None in registers:
+            return None
+        return self._decode(registers)
+
+
+def register_count(type_: str, data_length: int = 1) -> int:
+    """Return how many registers a value of ``type_`` spans."""
+    if type_ == "char":
+        return max(1, data_length // 2)
+    return NUMERIC_FORMATS.get(type_, NUMERIC_FORMATS["uint16"])[1]
+
+
+def compile_codec(
+    key: str,
+    address: int,
+    type_: str = "uint16",
+    *,
+    scale: float = 1,
+    precision: int = 0,
+    data_length: int = 1,
+    bit: int | None = None,
+    signed: bool = False,
+) -> RegisterCodec:
+    """Build the decoder for a register definition.
+
+    ``bit`` selects a single bit of a bitfield register. ``signed`` forces
+    two's complement decoding for 16-bit registers that are not typed
+    int16, such as number entities with a negative minimum.
+    """
+    if bit is not None:
+        return RegisterCodec(key, address, 1, lambda regs: bool((regs[0] >> bit) & 1))
+
+    if type_ == "bool":
+        return RegisterCodec(key, address, 1, lambda regs: bool(regs[0]))
+
+    if type_ == "char":
+        count = register_count(type_, data_length)
+        # Each register holds two characters, low byte first
+        chars = struct.Struct(f"<{count}H")
+        return RegisterCodec(
+            key,
+            address,
+            count,
+            lambda regs: chars.pack(*regs[:count]).decode("latin-1").strip("\x00"),
+        )
+
+    code, count = NUMERIC_FORMATS.get(type_, NUMERIC_FORMATS["uint16"])
+    if type_ in UNSCALED_TYPES:
+        scale = 1
+    if count == 1 and signed:
+        code = "h"
+    if code == "H":
+        return RegisterCodec(
+            key, address, 1, lambda regs: round(regs[0] * scale, precision)
+        )
+    if code == "h":
+        return RegisterCodec(
+            key,
+            address,
+            1,
+            lambda regs: round(
+                _INT16.unpack(_UINT16.pack(regs[0]))[0] * scale, precision
+            ),
+        )
+
+    # Multi-register values, high word first
+    words = struct.Struct(f">{count}H")
+    value = struct.Struct(f">{code}")
+    return RegisterCodec(
+        key,
+        address,
+        count,
+        lambda regs: round(
+            value.unpack(words.pack(*regs[:count]))[0] * scale, precision
+        ),
+    )
+
+
+def index_by_address(
+    codecs: Iterable[RegisterCodec],
+) -> dict[int, tuple[RegisterCodec, ...]]:
+    """Map every register address to the codecs that read it."""
+    index: dict[int, list[RegisterCodec]] = {}
+    for codec in codecs:
+        for addr in codec.addresses:
+            index.setdefault(addr, []).append(codec)
+    return {addr: tuple(entries) for addr, entries in index.items()}
@@ -2,20 +2,44 @@ from __future__ import annotations
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import voluptuous as vol
 
-from .const import CONF_SLAVE, DOMAIN
+from .const import (
+    CONF_MAX_READ_GAP,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PIPELINE_WINDOW,
+    CONF_SLAVE,
+    CONF_STALE_TTL,
+    DEFAULT_MAX_READ_GAP,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_STALE_TTL,
+    DOMAIN,
+)
 
 
 class MyModbusDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for My Modbus Device."""
 
     VERSION = 1
+    # 2: entity unique IDs are scoped to the config entry
+    MINOR_VERSION = 2
 
     def __init__(self):
         self._errors = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SabianaOptionsFlow:
+        """Return the flow tuning how the unit is polled."""
+        return SabianaOptionsFlow()
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         if user_input is not None:
             existing = [
@@ -23,6 +47,8 @@ class MyModbusDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 for entry in self._async_current_entries()
                 if entry.data[CONF_HOST] == user_input[CONF_HOST]
                 and entry.data[CONF_PORT] == user_input[CONF_PORT]
+                # Several units may sit behind one gateway
+                and entry.data.get(CONF_SLAVE, 1) == user_input[CONF_SLAVE]
             ]
             if existing:
                 return self.async_abort(reason="already_configured")
@@ -40,3 +66,57 @@ class MyModbusDeviceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=self._errors,
         )
+
+
+class SabianaOptionsFlow(config_entries.OptionsFlowWithReload):
+    """Tune how a configured unit is polled; the entry reloads on save."""
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        errors = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_scan_interval"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    # Above 1, block reads use a second TCP connection
+                    vol.Required(
+                        CONF_PIPELINE_WINDOW,
+                        default=options.get(
+                            CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+                    # Undefined registers a block read may span; 0 never
+                    # reads across a hole
+                    vol.Required(
+                        CONF_MAX_READ_GAP,
+                        default=options.get(CONF_MAX_READ_GAP, DEFAULT_MAX_READ_GAP),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=16)),
+                    # Bounds in seconds of the adaptive poll interval
+                    vol.Required(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=300)),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=300)),
+                    # Seconds the last good values are served while the unit
+                    # does not answer; 0 marks entities unavailable at once
+                    vol.Required(
+                        CONF_STALE_TTL,
+                        default=options.get(CONF_STALE_TTL, DEFAULT_STALE_TTL),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+                }
+            ),
+            errors=errors,
+        )
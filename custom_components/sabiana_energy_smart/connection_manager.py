@@ -0,0 +1,84 @@
+"""Share one Modbus TCP connection between devices behind the same gateway."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+from homeassistant.core import HomeAssistant
+
+from .bus_scheduler import BusScheduler
+from .const import DATA_CONNECTIONS, LOGGER, SCAN_INTERVAL
+from .modbus_client import SabianaModbusClient
+
+
+class SabianaConnectionManager:
+    """Hand out one reference-counted client per (host, port).
+
+    Many sites put several units behind a single Modbus TCP-to-RTU gateway
+    that accepts only one or two connections. Config entries for different
+    slave IDs on the same gateway borrow the same client, whose request
+    queue interleaves their transactions fairly, and the same bus
+    scheduler, which staggers their poll cycles. The connection is closed
+    when the last entry releases it.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple[str, int], SabianaModbusClient] = {}
+        self._schedulers: dict[tuple[str, int], BusScheduler] = {}
+        self._users: dict[tuple[str, int], int] = {}
+
+    def acquire(
+        self, host: str, port: int, owner: Hashable, pipeline_window: int = 1
+    ) -> SabianaModbusClient:
+        """Borrow the client for a gateway, creating it on first use.
+
+        ``owner`` (the slave ID) joins the gateway's bus scheduler. The
+        pipeline window of the first entry to connect applies to the shared
+        connection.
+        """
+        key = (host, port)
+        client = self._clients.get(key)
+        if client is None:
+            client = SabianaModbusClient(host, port, pipeline_window=pipeline_window)
+            self._clients[key] = client
+            # The coordinators replace this cycle with their adaptive intervals
+            self._schedulers[key] = BusScheduler(SCAN_INTERVAL.total_seconds())
+        self._schedulers[key].register(owner)
+        self._users[key] = self._users.get(key, 0) + 1
+        LOGGER.debug(
+            "Connection to %s:%s now used by %d device(s)", host, port, self._users[key]
+        )
+        return client
+
+    def scheduler(self, host: str, port: int) -> BusScheduler:
+        """Return the bus scheduler of an acquired gateway connection."""
+        return self._schedulers[(host, port)]
+
+    def users(self, host: str, port: int) -> int:
+        """Return how many devices currently share a gateway connection."""
+        return self._users.get((host, port), 0)
+
+    async def release(self, host: str, port: int, owner: Hashable) -> None:
+        """Return a borrowed client, closing it after its last user."""
+        key = (host, port)
+        if key in self._schedulers:
+            self._schedulers[key].unregister(owner)
+        remaining = self._users.get(key, 0) - 1
+        if remaining > 0:
+            self._users[key] = remaining
+            return
+
+        self._users.pop(key, None)
+        self._schedulers.pop(key, None)
+        client = self._clients.pop(key, None)
+        if client is None:
+            return
+        try:
+            await client.close()
+        except Exception as err:
+            LOGGER.debug("Error closing Modbus client: %s", err)
+
+
+def get_connection_manager(hass: HomeAssistant) -> SabianaConnectionManager:
+    """Return the connection manager shared by every config entry."""
+    return hass.data.setdefault(DATA_CONNECTIONS, SabianaConnectionManager())
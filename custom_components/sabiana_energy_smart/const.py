@@ -1,12 +1,56 @@
+from collections.abc import Mapping
+from datetime import timedelta
 import logging
+from typing import Any
 
 from homeassistant.helpers.entity import EntityCategory
 
 DOMAIN = "sabiana_energy_smart"
 CONF_SLAVE = "slave"
+CONF_MAX_READ_GAP = "max_read_gap"
+
+CONF_PIPELINE_WINDOW = "pipeline_window"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_STALE_TTL = "stale_ttl"
+
+# hass.data key of the connections shared between entries on one gateway
+DATA_CONNECTIONS = f"{DOMAIN}_connections"
+# hass.data key of the device profiles, loaded once for every entry
+DATA_PROFILES = f"{DOMAIN}_profiles"
+
+# Largest hole of undefined registers bridged by a single block read
+DEFAULT_MAX_READ_GAP = 2
+# Block reads kept in flight at once. Above 1 they use a second TCP
+# connection, which many gateways refuse, so pipelining is opt-in
+DEFAULT_PIPELINE_WINDOW = 1
+# Bounds in seconds of the adaptive poll interval
+DEFAULT_MIN_SCAN_INTERVAL = 1.0
+DEFAULT_MAX_SCAN_INTERVAL = 30.0
+# Seconds a register's last good value is served after its reads fail
+DEFAULT_STALE_TTL = 60.0
 
 LOGGER = logging.getLogger(__package__)
 
+# Poll classes: how often the coordinator re-reads a register
+POLL_LIVE = "live"  # every refresh cycle
+POLL_SLOW = "slow"  # configuration registers, every SLOW_POLL_INTERVAL
+POLL_STATIC = "static"  # identity registers, read once
+
+# Initial poll interval; the coordinator adapts it to the bus and the data
+SCAN_INTERVAL = timedelta(seconds=3)
+SLOW_POLL_INTERVAL = timedelta(minutes=1)
+
+# Seconds writes are buffered so rapid changes to a register go out once
+WRITE_COALESCE_DELAY = 0.25
+# Mode command registers: each write triggers an action, so they are sent
+# one at a time in the order requested instead of coalesced by address
+COMMAND_ADDRESSES = range(0x0301, 0x0308)
+# Seconds from a write request to its completion before a warning is logged
+MAX_WRITE_LATENCY = 1.0
+# Seconds after a write before the written registers are read back
+WRITE_VERIFY_DELAY = 1.0
+
 SENSOR_DEFINITIONS_NEW = {
     0x0100: {
         "key": "probe_temp1",
@@ -17,6 +61,7 @@ SENSOR_DEFINITIONS_NEW = {
         "device_class": "temperature",
         "type": "int16",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0101: {
         "key": "probe_temp2",
@@ -27,6 +72,7 @@ SENSOR_DEFINITIONS_NEW = {
         "device_class": "temperature",
         "type": "int16",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0102: {
         "key": "probe_temp3",
@@ -37,6 +83,7 @@ SENSOR_DEFINITIONS_NEW = {
         "device_class": "temperature",
         "type": "int16",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0103: {
         "key": "probe_temp4",
@@ -47,6 +94,7 @@ SENSOR_DEFINITIONS_NEW = {
         "device_class": "temperature",
         "type": "int16",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0106: {
         "key": "humidity_setpoint",
@@ -56,23 +104,27 @@ SENSOR_DEFINITIONS_NEW = {
         "precision": 1,
         "device_class": "humidity",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0107: {
         "key": "filter_alarm",
         "name": "Filter counter",
         "readable": True,
+        "poll_class": POLL_SLOW,
     },
     0x010B: {
         "key": "fan1_speed_rpm",
         "name": "Fan 1 Speed RPM (rd2)",
         "unit": "rpm",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x010C: {
         "key": "fan2_speed_rpm",
         "name": "Fan 2 Speed RPM (rd2)",
         "unit": "rpm",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x010D: {
         "key": "fan1_speed_percent",
@@ -81,6 +133,7 @@ SENSOR_DEFINITIONS_NEW = {
         "scale": 0.01,
         "precision": 1,
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x010E: {
         "key": "fan2_speed_percent",
@@ -89,12 +142,14 @@ SENSOR_DEFINITIONS_NEW = {
         "scale": 0.01,
         "precision": 1,
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x010F: {
         "key": "preheater_percent",
         "name": "Preheater Duty %",
         "unit": "%",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0111: {
         "key": "PressDiffSensor1",
@@ -104,6 +159,7 @@ SENSOR_DEFINITIONS_NEW = {
         "precision": 2,
         # "device_class": "carbon_dioxide",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0112: {
         "key": "PressDiffSensor2",
@@ -113,6 +169,7 @@ SENSOR_DEFINITIONS_NEW = {
         "precision": 2,
         # "device_class": "carbon_dioxide",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0113: {
         "key": "co2_level",
@@ -122,6 +179,7 @@ SENSOR_DEFINITIONS_NEW = {
         "precision": 2,
         "device_class": "carbon_dioxide",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0115: {
         "key": "Rho1",
@@ -132,6 +190,7 @@ SENSOR_DEFINITIONS_NEW = {
         "type": "float32",
         # "device_class": "humidity",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0117: {
         "key": "Rho2",
@@ -142,6 +201,7 @@ SENSOR_DEFINITIONS_NEW = {
         "type": "float32",
         # "device_class": "humidity",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0119: {
         "key": "Rho3",
@@ -152,6 +212,7 @@ SENSOR_DEFINITIONS_NEW = {
         "type": "float32",
         # "device_class": "humidity",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x011B: {
         "key": "Rho4",
@@ -162,16 +223,19 @@ SENSOR_DEFINITIONS_NEW = {
         "type": "float32",
         # "device_class": "humidity",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x011D: {
         "key": "SpeedCoeff1",
         "name": "Speed coeff. 1",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x011E: {
         "key": "SpeedCoeff2",
         "name": "Speed coeff. 2",
         "readable": True,
+        "poll_class": POLL_LIVE,
     },
     0x0120: {
         "key": "FanOnHrs",
@@ -180,6 +244,7 @@ SENSOR_DEFINITIONS_NEW = {
         "scale": 1,
         "precision": 0,
         "readable": True,
+        "poll_class": POLL_SLOW,
     },
 }
 
@@ -265,6 +330,7 @@ REGISTER_DEFINITIONS = {
         "max": 40,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0202: {
         "key": "TempProbe2Ofst",
@@ -277,6 +343,7 @@ REGISTER_DEFINITIONS = {
         "max": 40,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0203: {
         "key": "TempProbe3Ofst",
@@ -289,6 +356,7 @@ REGISTER_DEFINITIONS = {
         "max": 40,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0204: {
         "key": "TempProbe4Ofst",
@@ -301,6 +369,7 @@ REGISTER_DEFINITIONS = {
         "max": 40,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0205: {
         "key": "FanVoltageMin",
@@ -313,6 +382,7 @@ REGISTER_DEFINITIONS = {
         "max": 1000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0206: {
         "key": "FanVoltageMax",
@@ -325,6 +395,7 @@ REGISTER_DEFINITIONS = {
         "max": 1000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0207: {
         "key": "Fan1VoltageNom",
@@ -337,6 +408,7 @@ REGISTER_DEFINITIONS = {
         "max": 1000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0208: {
         "key": "Fan2VoltageNom",
@@ -349,6 +421,7 @@ REGISTER_DEFINITIONS = {
         "max": 1000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0209: {
         "key": "FanMinSpeed",
@@ -361,6 +434,7 @@ REGISTER_DEFINITIONS = {
         "max": 4000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x020A: {
         "key": "FanMaxSpeed",
@@ -373,6 +447,7 @@ REGISTER_DEFINITIONS = {
         "max": 4000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x020B: {
         "key": "Fan1SpeedSet",
@@ -385,6 +460,7 @@ REGISTER_DEFINITIONS = {
         "max": 4000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x020C: {
         "key": "Fan2SpeedSet",
@@ -397,6 +473,7 @@ REGISTER_DEFINITIONS = {
         "max": 4000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x020D: {
         "key": "Fan1SpeedStd",
@@ -409,6 +486,7 @@ REGISTER_DEFINITIONS = {
         "max": 4000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x020E: {
         "key": "KCoeff1",
@@ -419,6 +497,7 @@ REGISTER_DEFINITIONS = {
         "max": 9000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x020F: {
         "key": "KCoeff2",
@@ -429,6 +508,7 @@ REGISTER_DEFINITIONS = {
         "max": 9000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0210: {
         "key": "AirFlow1",
@@ -439,6 +519,7 @@ REGISTER_DEFINITIONS = {
         "max": 500,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0211: {
         "key": "AirFlow2",
@@ -449,6 +530,7 @@ REGISTER_DEFINITIONS = {
         "max": 500,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0213: {
         "key": "speed_1_pct",
@@ -461,6 +543,7 @@ REGISTER_DEFINITIONS = {
         "max": 35,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0214: {
         "key": "speed_2_pct",
@@ -473,6 +556,7 @@ REGISTER_DEFINITIONS = {
         "max": 70,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0215: {
         "key": "speed_3_pct",
@@ -485,6 +569,7 @@ REGISTER_DEFINITIONS = {
         "max": 100,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0216: {
         "key": "speed_4_pct",
@@ -497,6 +582,7 @@ REGISTER_DEFINITIONS = {
         "max": 110,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0217: {
         "key": "speed_boost_pct",
@@ -509,6 +595,7 @@ REGISTER_DEFINITIONS = {
         "max": 130,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0218: {
         "key": "temp_summer_set",
@@ -522,6 +609,7 @@ REGISTER_DEFINITIONS = {
         "readable": True,
         "writable": True,
         # TODO: Should be multiplid with the scale factor, which is 0.1?
+        "poll_class": POLL_SLOW,
     },
     0x0219: {
         "key": "temp_winter_set",
@@ -534,6 +622,7 @@ REGISTER_DEFINITIONS = {
         "max": 30,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x021A: {
         "key": "air_coeff_recalc_interval",
@@ -545,6 +634,7 @@ REGISTER_DEFINITIONS = {
         "max": 15,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x021B: {
         "key": "temp_free_cooling",
@@ -557,6 +647,7 @@ REGISTER_DEFINITIONS = {
         "max": 30,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x021C: {
         "key": "temp_free_heating",
@@ -569,6 +660,7 @@ REGISTER_DEFINITIONS = {
         "max": 30,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x021D: {
         "key": "fan2_unbalance_pct",
@@ -580,6 +672,7 @@ REGISTER_DEFINITIONS = {
         "max": 20,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x021E: {
         "key": "humidity_samples",
@@ -591,6 +684,7 @@ REGISTER_DEFINITIONS = {
         "max": 96,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x021F: {
         "key": "boost_time",
@@ -602,6 +696,7 @@ REGISTER_DEFINITIONS = {
         "max": 240,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0220: {
         "key": "hum_reg_p_const",
@@ -613,6 +708,7 @@ REGISTER_DEFINITIONS = {
         "max": 50,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0221: {
         "key": "filter_life",
@@ -624,6 +720,7 @@ REGISTER_DEFINITIONS = {
         "max": 400,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0222: {
         "key": "co2_min_set",
@@ -635,6 +732,7 @@ REGISTER_DEFINITIONS = {
         "max": 30000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0223: {
         "key": "co2_nom_set",
@@ -646,6 +744,7 @@ REGISTER_DEFINITIONS = {
         "max": 30000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0224: {
         "key": "co2_max_set",
@@ -657,6 +756,7 @@ REGISTER_DEFINITIONS = {
         "max": 30000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0225: {
         "key": "co2_prop_const",
@@ -668,6 +768,7 @@ REGISTER_DEFINITIONS = {
         "max": 40,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     # TODO: Bit Mod for 0x226
     # Its a range... how is this set up? TODO: See and fix.
@@ -680,6 +781,7 @@ REGISTER_DEFINITIONS = {
         "max": 30000,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0228: {
         "key": "BoilerBoostTime",
@@ -691,6 +793,7 @@ REGISTER_DEFINITIONS = {
         "max": 20,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x0229: {
         "key": "RelHumLowSet",
@@ -704,6 +807,7 @@ REGISTER_DEFINITIONS = {
         "max": 30,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x022A: {
         "key": "RelHumStdSet",
@@ -717,6 +821,7 @@ REGISTER_DEFINITIONS = {
         "max": 60,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x022B: {
         "key": "RelHumHiSet",
@@ -730,6 +835,7 @@ REGISTER_DEFINITIONS = {
         "max": 80,
         "readable": True,
         "writable": True,
+        "poll_class": POLL_SLOW,
     },
     0x030B: {
         "key": "CO2SensExt",
@@ -773,8 +879,10 @@ SWITCH_DEFINITIONS = {
         "readable": True,
         "writable": True,
         "entity_type": "switch",
+        "poll_class": POLL_LIVE,
     },
 }
+# Mode command triggers: written, never polled
 BUTTON_DEFINITIONS = {
     0x0301: {
         "key": "CMD_Manual",
@@ -822,22 +930,6 @@ BUTTON_DEFINITIONS = {
         "entity_type": "button",
     },
 }
-# Number definitions, generated from REGISTER_DEFINITIONS
-NUMBER_DEFINITIONS = [
-    {
-        "address": addr,
-        "key": reg["key"],
-        "name": reg["name"],
-        "min": reg.get("min", 0),
-        "max": reg.get("max", 0),
-        "unit": reg.get("unit", ""),
-        "scale": reg.get("scale", 1),
-        "precision": reg.get("precision", 0),
-        "unique_id": f"sabiana_number_{reg['key']}",
-    }
-    for addr, reg in REGISTER_DEFINITIONS.items()
-    if reg.get("writable")
-]
 
 # Example for select definitions (fill as needed)
 SELECT_DEFINITIONS = {
@@ -849,6 +941,7 @@ SELECT_DEFINITIONS = {
         "readable": True,
         "writable": True,
         "options": {0: "Speed 1", 1: "Speed 2", 2: "Speed 3", 3: "Speed 4"},
+        "poll_class": POLL_LIVE,
     },
     0x0306: {
         "key": "timer_program",
@@ -867,6 +960,7 @@ SELECT_DEFINITIONS = {
             7: "Program 7 (Manual)",
             8: "Program 8 (Manual)",
         },
+        "poll_class": POLL_SLOW,
     },
     0x0307: {
         "key": "mode_selection",
@@ -876,6 +970,7 @@ SELECT_DEFINITIONS = {
         "readable": True,
         "writable": True,
         "options": {0: "Holiday", 1: "Auto", 2: "Program", 3: "Manual", 4: "Party"},
+        "poll_class": POLL_LIVE,
     },
 }
 
@@ -898,6 +993,7 @@ DIAGNOSTIC_DEFINITIONS = {
             9: {"key": "cfg_uart_highspd", "name": "UART High Speed"},
             10: {"key": "cfg_post_treatment_T3/T2", "name": "Post treatment T3/T2"},
         },
+        "poll_class": POLL_SLOW,
     },
     0x0105: {
         "type": "uint16",
@@ -914,6 +1010,7 @@ DIAGNOSTIC_DEFINITIONS = {
             8: {"key": "on_status", "name": "Unit ON"},
             11: {"key": "winter_setting", "name": "Winter Setting"},
         },
+        "poll_class": POLL_LIVE,
     },
     0x0108: {
         "type": "uint16",
@@ -923,6 +1020,7 @@ DIAGNOSTIC_DEFINITIONS = {
             2: {"key": "OUT_Damper_CW", "name": "Damper CW output"},
             3: {"key": "OUT_Damper_CCW", "name": "Damper CCW output"},
         },
+        "poll_class": POLL_LIVE,
     },
     0x0109: {
         "type": "uint8",
@@ -935,6 +1033,7 @@ DIAGNOSTIC_DEFINITIONS = {
             3: {"key": "relay_fans", "name": "Fans Relay ON"},
             4: {"key": "relay_postcool", "name": "Postcool/Heat2 Relay ON"},
         },
+        "poll_class": POLL_LIVE,
     },
     0x010A: {
         "type": "uint8",
@@ -946,6 +1045,7 @@ DIAGNOSTIC_DEFINITIONS = {
             3: {"key": "DIN_C3", "name": "Input C3 status"},
             4: {"key": "DIN_C4", "name": "Input C4 status"},
         },
+        "poll_class": POLL_LIVE,
     },
     0x0110: {
         "type": "uint16",
@@ -967,6 +1067,7 @@ DIAGNOSTIC_DEFINITIONS = {
             14: {"key": "ALM_PreHeating", "name": "Pre Heating alarm"},
             15: {"key": "ALM_PreFrost_T2", "name": "Pre frost alarm (T2)"},
         },
+        "poll_class": POLL_LIVE,
     },
     0x011F: {
         "type": "uint16",
@@ -984,6 +1085,7 @@ DIAGNOSTIC_DEFINITIONS = {
             14: {"key": "OPT_RHSensor", "name": "RH sensor present"},
             15: {"key": "OPT_ReverseMount", "name": "Reverse mounting"},
         },
+        "poll_class": POLL_SLOW,
     },
     # is read write but maybe we should not touch it.
     0x0200: {
@@ -993,9 +1095,33 @@ DIAGNOSTIC_DEFINITIONS = {
             1: {"key": "S_PRM_StopFanOn", "name": "Stop Mode Fan status"},
             2: {"key": "S_PRM_FlushFanOn", "name": "Flush Fan status"},
         },
+        "poll_class": POLL_SLOW,
     },
 }
 
+# Optional hardware announced by the unit: the configuration bit that is
+# set when the feature is installed, and the registers that only carry
+# meaningful values with it
+CAPABILITY_BITS = {
+    "boiler_boost": {"address": 0x011F, "bit": 11, "registers": (0x0228,)},
+    "co2_sensor": {
+        "address": 0x011F,
+        "bit": 12,
+        "registers": (0x0113, 0x0222, 0x0223, 0x0224, 0x0225, 0x0227),
+    },
+    "diff_press_sensor": {
+        "address": 0x011F,
+        "bit": 13,
+        "registers": (0x0111, 0x0112),
+    },
+    "rh_sensor": {
+        "address": 0x011F,
+        "bit": 14,
+        "registers": (0x0229, 0x022A, 0x022B),
+    },
+    "preheating": {"address": 0x0104, "bit": 1, "registers": (0x010F,)},
+}
+
 FIRMWARE_INFO = {
     0x0000: {
         "key": "device_serial_number",
@@ -1007,6 +1133,7 @@ FIRMWARE_INFO = {
         "dataLength": 20,
         "readable": True,
         "writable": False,
+        "poll_class": POLL_STATIC,
     },
     0x000A: {
         "key": "controller_model",
@@ -1018,6 +1145,7 @@ FIRMWARE_INFO = {
         "dataLength": 2,
         "readable": True,
         "writable": False,
+        "poll_class": POLL_STATIC,
     },
     0x000B: {
         "key": "firmware_release",
@@ -1029,6 +1157,7 @@ FIRMWARE_INFO = {
         "dataLength": 2,
         "readable": True,
         "writable": False,
+        "poll_class": POLL_STATIC,
     },
     0x000C: {
         "key": "protocol_release",
@@ -1040,6 +1169,7 @@ FIRMWARE_INFO = {
         "dataLength": 2,
         "readable": True,
         "writable": False,
+        "poll_class": POLL_STATIC,
     },
     0x000D: {
         "key": "tep_release",
@@ -1051,14 +1181,32 @@ FIRMWARE_INFO = {
         "dataLength": 2,
         "readable": True,
         "writable": False,
+        "poll_class": POLL_STATIC,
     },
 }
 
 
-def get_device_info(entry_id: str):
+def get_device_info(
+    entry_id: str,
+    identity: Mapping[str, Any] | None = None,
+    model: str = "Smart Pro",
+):
     return {
         "identifiers": {(DOMAIN, entry_id)},
         "name": "Sabiana RVU",
         "manufacturer": "Sabiana",
-        "model": "Smart Pro",
+        "model": model,
+        **identity_device_fields(identity or {}),
     }
+
+
+def identity_device_fields(identity: Mapping[str, Any]) -> dict[str, str]:
+    """Return the device registry fields known from the identity registers."""
+    fields = {}
+    if identity.get("controller_model") is not None:
+        fields["model_id"] = str(identity["controller_model"])
+    if identity.get("firmware_release") is not None:
+        fields["sw_version"] = str(identity["firmware_release"])
+    if identity.get("device_serial_number"):
+        fields["serial_number"] = identity["device_serial_number"]
+    return fields
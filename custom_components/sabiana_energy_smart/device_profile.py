@@ -0,0 +1,157 @@
+"""Pick the register map of a unit from its controller model and firmware.
+
+Each ``profiles/*.json`` file describes one RVU variant relative to the
+built-in register map::
+
+    {
+        "profile_version": 1,
+        "name": "Smart Pro",
+        "models": [1, 2],
+        "firmware": {"min": "0x0100", "max": "0x01FF"},
+        "exclude": {"keys": ["co2"], "addresses": ["0x0113"]}
+    }
+
+``models`` lists the controller_model codes the profile applies to (empty
+or missing: any model) and ``firmware`` bounds firmware_release
+inclusively. Registers under ``exclude`` do not exist on the variant: no
+entity is created for them, so they are never polled. Addresses and
+firmware releases may be written as ints or "0x..." strings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from .catalog import RegisterRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_DIR = Path(__file__).parent / "profiles"
+PROFILE_VERSION = 1
+DEFAULT_PROFILE_NAME = "Smart Pro"
+
+
+class ProfileError(ValueError):
+    """A device profile file is malformed."""
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceProfile:
+    """Register map variant for a range of controller models and firmware."""
+
+    name: str
+    source: str = ""
+    models: frozenset[int] = frozenset()
+    min_firmware: int | None = None
+    max_firmware: int | None = None
+    exclude_keys: frozenset[str] = frozenset()
+    exclude_addresses: frozenset[int] = frozenset()
+
+    @property
+    def specificity(self) -> int:
+        """Return how narrowly the profile is matched; higher wins."""
+        return (
+            2 * bool(self.models)
+            + (self.min_firmware is not None)
+            + (self.max_firmware is not None)
+        )
+
+    @property
+    def excludes(self) -> bool:
+        """Return True if the profile removes registers from the map."""
+        return bool(self.exclude_keys or self.exclude_addresses)
+
+    def matches(self, model: int | None, firmware: int | None) -> bool:
+        """Return True if the profile applies to the identified unit."""
+        if self.models and model not in self.models:
+            return False
+        if self.min_firmware is not None and (
+            firmware is None or firmware < self.min_firmware
+        ):
+            return False
+        if self.max_firmware is not None and (
+            firmware is None or firmware > self.max_firmware
+        ):
+            return False
+        return True
+
+    def select(self, records: Iterable[RegisterRecord]) -> list[RegisterRecord]:
+        """Return the records that exist on this variant."""
+        return [
+            record
+            for record in records
+            if record.key not in self.exclude_keys
+            and self.exclude_addresses.isdisjoint(record.addresses)
+        ]
+
+
+DEFAULT_PROFILE = DeviceProfile(DEFAULT_PROFILE_NAME)
+
+
+def _number(value: Any) -> int:
+    """Parse an address or release given as an int or a "0x..." string."""
+    return int(value, 0) if isinstance(value, str) else int(value)
+
+
+def parse_profile(data: Mapping[str, Any], source: str = "") -> DeviceProfile:
+    """Validate the JSON content of a profile file."""
+    version = data.get("profile_version")
+    if version != PROFILE_VERSION:
+        raise ProfileError(f"unsupported profile_version {version!r}")
+    try:
+        firmware = data.get("firmware") or {}
+        exclude = data.get("exclude") or {}
+        return DeviceProfile(
+            name=str(data["name"]),
+            source=source,
+            models=frozenset(int(model) for model in data.get("models") or ()),
+            min_firmware=None
+            if firmware.get("min") is None
+            else _number(firmware["min"]),
+            max_firmware=None
+            if firmware.get("max") is None
+            else _number(firmware["max"]),
+            exclude_keys=frozenset(str(key) for key in exclude.get("keys") or ()),
+            exclude_addresses=frozenset(
+                _number(addr) for addr in exclude.get("addresses") or ()
+            ),
+        )
+    except (KeyError, TypeError, ValueError, AttributeError) as err:
+        raise ProfileError(f"invalid profile: {err}") from err
+
+
+def load_profiles(directory: Path = PROFILE_DIR) -> tuple[DeviceProfile, ...]:
+    """Load every profile in ``directory``, sorted by file name.
+
+    Invalid files are logged and skipped. Does blocking I/O; run it in an
+    executor.
+    """
+    profiles = []
+    for path in sorted(directory.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            profiles.append(parse_profile(data, path.name))
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Skipping device profile %s: %s", path.name, err)
+    return tuple(profiles)
+
+
+def select_profile(
+    profiles: Iterable[DeviceProfile], model: int | None, firmware: int | None
+) -> DeviceProfile:
+    """Return the most specific profile matching the unit.
+
+    Ties go to the file that sorts first; DEFAULT_PROFILE applies when
+    nothing matches.
+    """
+    best = DEFAULT_PROFILE
+    best_score = -1
+    for profile in profiles:
+        if profile.matches(model, firmware) and profile.specificity > best_score:
+            best, best_score = profile, profile.specificity
+    return best
@@ -0,0 +1,19 @@
+"""Base entity shared by the Sabiana platforms."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class SabianaEntity(CoordinatorEntity):
+    """Entity whose registers are polled by the Sabiana coordinator.
+
+    The coordinator context holds the addresses the entity reads.
+    """
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the age of the value while it is served from the cache."""
+        return self.coordinator.cache_attributes(self.coordinator_context)
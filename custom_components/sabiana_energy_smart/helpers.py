@@ -1,24 +1,99 @@
-def decode_modbus_value(
-    *,
-    raw: list[int] | None,
-    type_: str = "uns16",
-    data_length: int = 1,
-    scale: float = 1.0,
-    precision: int = 0,
-) -> str | float | None:
-    if raw is None:
-        return None
-
-    if type_ == "char":
-        text = "".join(
-            chr(r & 0xFF) + chr((r >> 8) & 0xFF) for r in raw[: data_length // 2]
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from operator import attrgetter, itemgetter
+import struct
+from typing import TYPE_CHECKING, Any
+
+from .codec import NUMERIC_FORMATS, UNSCALED_TYPES
+
+if TYPE_CHECKING:
+    from .catalog import RegisterRecord
+
+
+class BlockLayout:
+    """Precomputed layout of the numeric values in a register block."""
+
+    __slots__ = (
+        "start",
+        "count",
+        "keys",
+        "addresses",
+        "_pick",
+        "_pack",
+        "_unpack",
+        "_scaling",
+    )
+
+    def __init__(
+        self,
+        start: int,
+        count: int,
+        fields: Sequence[tuple[str, int, str, float, int]],
+    ) -> None:
+        self.start = start
+        self.count = count
+        self.keys = tuple(key for key, *_ in fields)
+        addresses: list[int] = []
+        codes = ""
+        for key, address, type_, _scale, _precision in fields:
+            code, width = NUMERIC_FORMATS[type_]
+            if addresses and address <= addresses[-1]:
+                raise ValueError(f"Field {key} overlaps the previous field")
+            addresses.extend(range(address, address + width))
+            codes += code
+        if addresses[-1] >= start + count:
+            raise ValueError("Fields extend past the end of the block")
+        # Registers between values are skipped before packing, so one
+        # unpack of the packed value registers yields every value in order
+        self.addresses = tuple(addresses)
+        self._pick = itemgetter(*(addr - start for addr in addresses))
+        self._pack = struct.Struct(f">{len(addresses)}H")
+        self._unpack = struct.Struct(f">{codes}")
+        self._scaling = tuple(
+            (key, scale, precision) for key, _addr, _type, scale, precision in fields
         )
-        return text.strip("\x00")
 
-    if type_ == "uns32" and len(raw) >= 2:
-        value = (raw[0] << 16) | raw[1]
-        return round(value * scale, precision)
+    def decode(self, registers: Sequence[int]) -> dict[str, Any]:
+        """Decode every value of a block read starting at ``start``."""
+        picked = self._pick(registers)
+        return self._decode(picked if len(self.addresses) > 1 else (picked,))
+
+    def decode_mapping(self, data: Mapping[int, int | None]) -> dict[str, Any] | None:
+        """Decode every value from an address → raw register mapping.
+
+        Returns None when a register holding a value is missing.
+        """
+        registers = tuple(map(data.get, self.addresses))
+        if None in registers:
+            return None
+        return self._decode(registers)
+
+    def _decode(self, registers: Sequence[int]) -> dict[str, Any]:
+        """Unpack and scale the value registers in one pass."""
+        raw = self._unpack.unpack(self._pack.pack(*registers))
+        return {
+            key: round(value * scale, precision)
+            for (key, scale, precision), value in zip(self._scaling, raw, strict=True)
+        }
+
+
+def compile_block_layout(records: Iterable[RegisterRecord]) -> BlockLayout:
+    """Build the block layout for records of numeric values.
+
+    The block spans from the lowest to the highest record. Types are
+    decoded as by their single-value codecs; char or bitfield records are
+    not supported.
+    """
+    fields = []
+    for record in sorted(records, key=attrgetter("address")):
+        if record.bit is not None or record.type not in NUMERIC_FORMATS:
+            raise ValueError(f"Record {record.key} cannot be decoded in a block")
+        scale = 1 if record.type in UNSCALED_TYPES else record.scale
+        fields.append(
+            (record.key, record.address, record.type, scale, record.precision)
+        )
 
-    # Default: uns16
-    value = raw[0] if isinstance(raw, list) else raw
-    return round(value * scale, precision)
+    start = fields[0][1]
+    end = fields[-1][1] + NUMERIC_FORMATS[fields[-1][2]][1]
+    return BlockLayout(start, end - start, fields)
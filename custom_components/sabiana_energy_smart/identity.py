@@ -0,0 +1,70 @@
+"""Keep the static identity registers of a unit on disk between restarts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .catalog import get_catalog
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+
+def decode_identity(registers: Mapping[int, int | None]) -> dict[str, Any]:
+    """Decode the identity values present in a mapping of raw registers."""
+    values = {
+        codec.key: codec.decode(registers) for codec in get_catalog().identity_codecs
+    }
+    return {key: value for key, value in values.items() if value is not None}
+
+
+class SabianaIdentityStore:
+    """Identity of one config entry's unit, served from disk first.
+
+    The values saved by the last successful read are available as soon as
+    the store is loaded, so the device registry and the diagnostic sensors
+    never wait for the bus. Reading the unit again only rewrites the file,
+    and notifies listeners, when a value actually changed.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.identity.{entry_id}"
+        )
+        self.values: dict[str, Any] = {}
+        self._listeners: set[CALLBACK_TYPE] = set()
+
+    async def async_load(self) -> dict[str, Any]:
+        """Load the identity saved for this entry, if any."""
+        self.values = dict(await self._store.async_load() or {})
+        return self.values
+
+    async def async_update(self, values: Mapping[str, Any]) -> bool:
+        """Merge freshly read values; return True if anything changed."""
+        merged = {**self.values, **values}
+        if merged == self.values:
+            return False
+        self.values = merged
+        await self._store.async_save(merged)
+        for update_callback in list(self._listeners):
+            update_callback()
+        return True
+
+    async def async_remove(self) -> None:
+        """Delete the saved identity, e.g. when the entry is removed."""
+        await self._store.async_remove()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Call ``update_callback`` whenever the identity changes."""
+        self._listeners.add(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.discard(update_callback)
+
+        return _remove
@@ -1,89 +1,45 @@
 from __future__ import annotations
 
-import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 
-from .const import DOMAIN, FIRMWARE_INFO, get_device_info
-from .helpers import decode_modbus_value
+from .catalog import RegisterRecord
 
-_LOGGER = logging.getLogger(__name__)
 
-SENSOR_DEFINITIONS = [
-    {**reg, "address": addr}
-    for addr, reg in FIRMWARE_INFO.items()
-    if reg.get("readable")
-]
-
-
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = []
-
-    for definition in SENSOR_DEFINITIONS:
-        sensors.append(
-            SabianaFirmwareSensor(coordinator._client, definition, entry.entry_id)
-        )
-
-    _LOGGER.debug("Adding %d firmware diagnostic sensors", len(sensors))
-    async_add_entities(sensors)
+class SabianaFirmwareSensor(SensorEntity):
+    """Static diagnostic sensor for Sabiana RVU firmware info.
 
+    Values come from the identity store: the copy saved on disk at
+    startup, replaced once the background refresh has read the unit.
+    """
 
-class SabianaFirmwareSensor(SensorEntity):
-    """Static diagnostic sensor for Sabiana RVU firmware info."""
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
         self,
-        client: Any,  # SabianaModbusClient
-        reg: dict[str, Any],
+        coordinator: Any,  # SabianaModbusCoordinator
+        record: RegisterRecord,
         entry_id: str,
     ):
-        self._client = client
-        self._address = reg["address"]
-        self._scale = reg.get("scale", 1)
-        self._precision = reg.get("precision", 0)
-        self._type = reg.get("type", "uns16")
-        self._length = reg.get("dataLength", 1)
-        self._raw_value: list[int] | None = None
+        self._identity = coordinator.identity
+        self._address = record.address
+        self._key = record.key
 
-        self._attr_name = reg["name"]
-        self._attr_unique_id = f"sabiana_diag_{reg['key']}"
-        self._attr_native_unit_of_measurement = reg.get("unit", "")
-        self._attr_device_class = reg.get("device_class")
-        self._attr_entity_category = reg.get("entity_category")
-        self._attr_device_info = DeviceInfo(**get_device_info(entry_id))
+        self._attr_name = record.name
+        self._attr_unique_id = f"{entry_id}_diag_{record.key}"
+        self._attr_native_unit_of_measurement = record.unit
+        self._attr_device_class = record.device_class
+        self._attr_device_info = DeviceInfo(**coordinator.device_info())
 
     async def async_added_to_hass(self) -> None:
-        """Read the value only once when the entity is added."""
-        try:
-            result = await self._client.read_register(
-                address=self._address,
-                count=self._length,
-                slave=1,  # or from config if needed
-            )
-            self._raw_value = result if isinstance(result, list) else [result]
-            _LOGGER.debug(
-                "%s read at 0x%04X → %s", self.name, self._address, self._raw_value
-            )
-            self.async_write_ha_state()
-        except Exception as e:
-            _LOGGER.warning("Failed to read diagnostic sensor %s: %s", self.name, e)
+        """Update the state whenever the identity is re-read."""
+        self.async_on_remove(
+            self._identity.async_add_listener(self.async_write_ha_state)
+        )
 
     @property
     def native_value(self) -> str | float | None:
-        return decode_modbus_value(
-            raw=self._raw_value,
-            type_=self._type,
-            data_length=self._length,
-            scale=self._scale,
-            precision=self._precision,
-        )
+        return self._identity.values.get(self._key)
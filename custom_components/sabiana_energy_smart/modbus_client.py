@@ -1,64 +1,285 @@
 import logging
+from typing import Any
 
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
+from .circuit_breaker import STATE_CLOSED, CircuitBreaker
+from .modbus_pipeline import ModbusTcpPipeline, PipelineExceptionResponse
+from .request_queue import PRIORITY_POLL, PRIORITY_WRITE, RequestQueue
+
 _LOGGER = logging.getLogger(__name__)
 
+# Exception codes saying the request names registers the device does not
+# have (illegal data address or value). The others, such as slave device
+# busy (6) or device failure (4), are transient.
+ILLEGAL_ADDRESS_CODES = frozenset({0x02, 0x03})
+# Pipelined reads in a row the gateway must drop, while answering the same
+# read sent on its own, before the client stops pipelining
+PIPELINE_FALLBACK_AFTER = 3
+
+
+class SabianaExceptionResponse(ModbusException):
+    """The device rejected a request with a Modbus exception response."""
+
+    def __init__(self, address: int, count: int, code: int | None) -> None:
+        super().__init__(f"exception code {code} for 0x{address:04X}+{count}")
+        self.address = address
+        self.count = count
+        self.code = code
+
+    @property
+    def illegal_address(self) -> bool:
+        """Return True if the device does not have the requested registers."""
+        return self.code in ILLEGAL_ADDRESS_CODES
+
+
+class SabianaTransportError(ModbusException):
+    """A request was lost to a connection or transport failure."""
+
+    def __init__(self, address: int, reason: str) -> None:
+        super().__init__(f"read at 0x{address:04X} failed: {reason}")
+        self.address = address
+
 
 class SabianaModbusClient:
-    """Handles persistent async Modbus TCP communication for Sabiana devices."""
+    """Handles persistent async Modbus TCP communication for Sabiana devices.
+
+    With a pipeline window above 1 (an entry option), block reads go
+    through a second socket that keeps several requests in flight; writes
+    always use pymodbus. Many gateways accept only one or two connections,
+    so pipelining is off by default. A failed pipelined read is retried on
+    the primary connection. Once the gateway has answered
+    PIPELINE_FALLBACK_AFTER such retries in a row, it evidently refuses or
+    drops the second socket and the client falls back to one request at a
+    time for good. While the gateway is offline nothing is counted.
 
-    def __init__(self, host: str, port: int) -> None:
+    Every transaction (polls, entity reads and writes) waits for a slot in
+    the connection's request queue. Slots are granted by priority, so writes
+    go ahead of queued background polls, and fairly across the slave IDs
+    sharing the connection.
+
+    Connection attempts go through a circuit breaker: once the gateway is
+    known to be unreachable, every request fails fast until the backoff
+    has passed, instead of each waiting for its own connect timeout.
+    """
+
+    def __init__(self, host: str, port: int, pipeline_window: int = 1) -> None:
         self.host = host
         self.port = port
         self.client: AsyncModbusTcpClient | None = None
+        self.pipeline_window = max(1, pipeline_window)
+        self._pipeline: ModbusTcpPipeline | None = None
+        self._pipeline_failures = 0
+        self._queue = RequestQueue(self.pipeline_window)
+        self._breaker = CircuitBreaker()
+
+    @property
+    def queue_stats(self) -> dict[str, Any]:
+        """Return request queue depth and wait time statistics."""
+        return self._queue.stats()
+
+    @property
+    def connection_state(self) -> dict[str, Any]:
+        """Return the circuit breaker state."""
+        return self._breaker.as_dict()
 
     async def ensure_connected(self) -> bool:
-        """Ensure the Modbus client is connected, reconnect if needed."""
+        """Ensure the Modbus client is connected, reconnect if needed.
+
+        Returns False without trying while the circuit breaker is open.
+        """
         if self.client is None:
             self.client = AsyncModbusTcpClient(self.host, port=self.port)
 
-        if not self.client.connected:
-            try:
-                connected = await self.client.connect()
-                if not connected:
-                    _LOGGER.error(
-                        "Failed to connect to Modbus server at %s:%s",
-                        self.host,
-                        self.port,
-                    )
-                    return False
-            except Exception as e:
-                _LOGGER.error("Modbus connection error: %s", e)
-                return False
+        if self.client.connected:
+            return True
+        if not self._breaker.allow():
+            return False
+
+        try:
+            connected = await self.client.connect()
+        except Exception as e:
+            connected = False
+            error = str(e)
+        except BaseException:
+            # Cancelled mid-probe (entry unloading, identity task stopped):
+            # left half open, the breaker would refuse every later attempt
+            # of every entry sharing this gateway
+            self._breaker.record_failure()
+            raise
+        else:
+            error = "connection refused or timed out"
+
+        if connected:
+            if self._breaker.failures:
+                _LOGGER.info(
+                    "Reconnected to Modbus server at %s:%s", self.host, self.port
+                )
+            self._breaker.record_success()
+            return True
+
+        was_closed = self._breaker.state == STATE_CLOSED
+        delay = self._breaker.record_failure()
+        # Log the outage once; retries while it lasts are debug noise
+        _LOGGER.log(
+            logging.ERROR if was_closed else logging.DEBUG,
+            "Failed to connect to Modbus server at %s:%s (%s), retrying in %.0fs",
+            self.host,
+            self.port,
+            error,
+            delay,
+        )
+        return False
+
+    async def _read_pipelined(self, address: int, count: int, slave: int) -> list[int]:
+        """Read holding registers through the pipeline, connecting it first."""
+        if self._pipeline is None:
+            self._pipeline = ModbusTcpPipeline(
+                self.host, self.port, window=self.pipeline_window
+            )
+        if not self._pipeline.connected:
+            await self._pipeline.connect()
+        try:
+            registers = await self._pipeline.read_holding_registers(
+                address, count, slave
+            )
+        except PipelineExceptionResponse:
+            # The device answered, so the pipeline works
+            self._pipeline_failures = 0
+            raise
+        self._pipeline_failures = 0
+        return registers
+
+    async def _record_pipeline_failure(self, err: Exception) -> None:
+        """Count a pipelined read the gateway then answered on its own.
+
+        Pipelining stops for good after PIPELINE_FALLBACK_AFTER of them in
+        a row; a single lost frame on a lossy link is not enough.
+        """
+        self._pipeline_failures += 1
+        if self._pipeline_failures < PIPELINE_FALLBACK_AFTER:
+            return
+        _LOGGER.warning(
+            "Gateway %s:%s cannot pipeline requests (%s), "
+            "falling back to one request at a time",
+            self.host,
+            self.port,
+            err,
+        )
+        self.pipeline_window = 1
+        self._queue.resize(1)
+        if self._pipeline is not None:
+            pipeline, self._pipeline = self._pipeline, None
+            await pipeline.close()
 
-        return True
+    async def read_block(
+        self,
+        address: int,
+        count: int = 1,
+        slave: int = 1,
+        priority: int = PRIORITY_POLL,
+    ) -> list[int]:
+        """Read holding registers, raising when they cannot be returned.
+
+        Raises SabianaExceptionResponse when the device answered with an
+        exception code, e.g. for an undefined address, and
+        SabianaTransportError when the request could not be completed
+        (connection, timeout or protocol failure). Concurrent callers share
+        the pipeline window when it is enabled.
+        """
+        async with self._queue.slot(priority, owner=slave):
+            return await self._read_block(address, count, slave)
+
+    async def _read_block(self, address: int, count: int, slave: int) -> list[int]:
+        """Read holding registers once a queue slot is held."""
+        # Only a gateway answering on the primary connection can tell a
+        # refused or lossy pipeline apart from being offline altogether
+        if self.pipeline_window <= 1 or not await self.ensure_connected():
+            return await self._read_serialized(address, count, slave)
+
+        try:
+            return await self._read_pipelined(address, count, slave)
+        except PipelineExceptionResponse as err:
+            raise SabianaExceptionResponse(address, count, err.code) from err
+        except (OSError, TimeoutError) as err:
+            _LOGGER.debug("Pipelined read at 0x%04X failed: %s", address, err)
+            pipeline_err = err
+
+        # Retry on its own; an answer counts against the pipeline
+        try:
+            registers = await self._read_serialized(address, count, slave)
+        except SabianaExceptionResponse:
+            await self._record_pipeline_failure(pipeline_err)
+            raise
+        await self._record_pipeline_failure(pipeline_err)
+        return registers
 
-    async def read_register(
-        self, address: int, count: int = 1, slave: int = 1
-    ) -> list[int] | None:
-        """Read holding registers from Modbus server."""
+    async def _read_serialized(self, address: int, count: int, slave: int) -> list[int]:
+        """Read holding registers through pymodbus, one request at a time."""
         if not await self.ensure_connected():
-            return None
+            raise SabianaTransportError(address, "not connected")
 
         try:
             result = await self.client.read_holding_registers(
                 address=address, count=count, device_id=slave
             )
-            if result is None or result.isError():
-                _LOGGER.warning("Read failed at address 0x%04X", address)
-                return None
-            return result.registers
-        except ModbusException as me:
-            _LOGGER.error("Modbus protocol error at 0x%04X: %s", address, me)
         except Exception as e:
-            _LOGGER.error("Unexpected error reading 0x%04X: %s", address, e)
+            raise SabianaTransportError(address, str(e) or type(e).__name__) from e
 
-        return None
+        if result is None:
+            raise SabianaTransportError(address, "no response")
+        if result.isError():
+            raise SabianaExceptionResponse(
+                address, count, getattr(result, "exception_code", None)
+            )
+        return result.registers
 
     async def write_register(self, address: int, value: int, slave: int = 1) -> bool:
-        """Write a value to a Modbus register."""
+        """Write a value to a Modbus register ahead of queued reads."""
+        async with self._queue.slot(PRIORITY_WRITE, owner=slave):
+            return await self._write_single(address, value, slave)
+
+    async def write_registers(
+        self, address: int, values: list[int], slave: int = 1
+    ) -> bool:
+        """Write consecutive registers in one request ahead of queued reads.
+
+        A single value is sent as FC06. If the device rejects the FC16
+        request, the values are written one register at a time instead.
+        """
+        async with self._queue.slot(PRIORITY_WRITE, owner=slave):
+            if len(values) == 1:
+                return await self._write_single(address, values[0], slave)
+
+            if not await self.ensure_connected():
+                return False
+
+            try:
+                result = await self.client.write_registers(
+                    address=address, values=values, device_id=slave
+                )
+                if not result.isError():
+                    return True
+                _LOGGER.debug(
+                    "Write multiple at 0x%04X rejected (%s), writing one by one",
+                    address,
+                    result,
+                )
+            except ModbusException as me:
+                _LOGGER.error("Modbus write error at 0x%04X: %s", address, me)
+                return False
+            except Exception as e:
+                _LOGGER.error("Unexpected error writing 0x%04X: %s", address, e)
+                return False
+
+            ok = True
+            for offset, value in enumerate(values):
+                ok = await self._write_single(address + offset, value, slave) and ok
+            return ok
+
+    async def _write_single(self, address: int, value: int, slave: int) -> bool:
+        """Write one register once a queue slot is held."""
         if not await self.ensure_connected():
             return False
 
@@ -79,6 +300,9 @@ class SabianaModbusClient:
 
     async def close(self) -> None:
         """Close the Modbus connection gracefully."""
+        if self._pipeline is not None:
+            pipeline, self._pipeline = self._pipeline, None
+            await pipeline.close()
         if self.client:
             try:
                 await self.client.close()
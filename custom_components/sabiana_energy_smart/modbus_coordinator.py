@@ -1,84 +1,871 @@
 import asyncio
-from datetime import timedelta
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+import time
 from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import LOGGER
-from .modbus_client import SabianaModbusClient
+from .bus_scheduler import PollTurn
+from .capabilities import (
+    absent_registers,
+    capability_addresses,
+    detect_capabilities,
+    get_capabilities,
+    prune_records,
+)
+from .catalog import RegisterCatalog, get_catalog
+from .connection_manager import get_connection_manager
+from .const import (
+    COMMAND_ADDRESSES,
+    CONF_MAX_READ_GAP,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PIPELINE_WINDOW,
+    CONF_STALE_TTL,
+    DATA_PROFILES,
+    DEFAULT_MAX_READ_GAP,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_STALE_TTL,
+    DOMAIN,
+    LOGGER,
+    MAX_WRITE_LATENCY,
+    POLL_LIVE,
+    POLL_SLOW,
+    POLL_STATIC,
+    SCAN_INTERVAL,
+    SLOW_POLL_INTERVAL,
+    WRITE_COALESCE_DELAY,
+    WRITE_VERIFY_DELAY,
+    get_device_info,
+    identity_device_fields,
+)
+from .device_profile import (
+    DEFAULT_PROFILE,
+    PROFILE_DIR,
+    DeviceProfile,
+    load_profiles,
+    select_profile,
+)
+from .identity import SabianaIdentityStore, decode_identity
+from .modbus_client import SabianaExceptionResponse, SabianaTransportError
+from .poll_interval import AdaptivePollInterval
+from .read_planner import plan_reads, plan_writes, split_block
+from .register_image import RegisterImage, RegisterLayout
+from .request_queue import PRIORITY_POLL, PRIORITY_READ
+
+# Lower rank is polled more often
+_POLL_RANK = {POLL_LIVE: 0, POLL_SLOW: 1, POLL_STATIC: 2}
 
 
 class SabianaModbusCoordinator(DataUpdateCoordinator):
-    """Coordinator that polls only the Modbus addresses registered by entities."""
+    """Coordinator that polls only the Modbus addresses registered by entities.
+
+    Platforms declare each address and its poll class with register_address;
+    an address is only polled while at least one added entity subscribes to
+    it, so disabled or removed entities cost no bus time. Every refresh
+    reads the live registers; slow registers are added to the plan once per
+    SLOW_POLL_INTERVAL and static ones only until they have been read
+    successfully.
+    """
 
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+    def __init__(
+        self, hass: HomeAssistant, config: dict[str, Any], entry_id: str
+    ) -> None:
         super().__init__(
             hass,
             LOGGER,
             name="Sabiana Modbus Coordinator",
-            update_interval=timedelta(seconds=3),
+            update_interval=SCAN_INTERVAL,
         )
         self._host = config["host"]
         self._port = config["port"]
         self._slave = config["slave"]
-        self._client = SabianaModbusClient(self._host, self._port)
-        self._active_addresses: set[int] = set()
+        self._entry_id = entry_id
+        # Register map of the unit, narrowed on setup by its device profile
+        # and the optional hardware it reports
+        self.profile: DeviceProfile = DEFAULT_PROFILE
+        self.catalog: RegisterCatalog = get_catalog()
+        self._capabilities = get_capabilities()
+        # Registers of the features the unit reports as missing
+        self.absent: frozenset[int] = frozenset()
+        self._unsub_capabilities: CALLBACK_TYPE | None = None
+        # Serial number and firmware, loaded from disk before the first poll
+        self.identity = SabianaIdentityStore(hass, entry_id)
+        self._identity_task: asyncio.Task | None = None
+        # Entries for other slaves behind the same gateway share the client
+        self._connections = get_connection_manager(hass)
+        self._client = self._connections.acquire(
+            self._host,
+            self._port,
+            self._slave,
+            pipeline_window=config.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW),
+        )
+        self._scheduler = self._connections.scheduler(self._host, self._port)
+        # address → poll class declared by the platforms
+        self._poll_classes: dict[int, str] = {}
+        # address → update callbacks of the entities reading it
+        self._subscribers: dict[int, set[CALLBACK_TYPE]] = {}
+        # Layout of the register images, rebuilt when the subscriptions change
+        self._layout: RegisterLayout | None = None
+        self._slow_polled_at: float | None = None
+        # Addresses entities only ever write to; never part of the poll plan
+        self._write_only: set[int] = set()
+        # Written addresses to re-read on the next cycle regardless of class
+        self._force_read: set[int] = set()
+        # Buffered writes (address → raw value), the commands in call order,
+        # and the batch callers await
+        self._pending_writes: dict[int, int] = {}
+        self._pending_commands: list[tuple[int, int]] = []
+        self._write_batch: asyncio.Future[dict[int, bool]] | None = None
+        self._write_batch_started = 0.0
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        # Written addresses awaiting a verification read
+        self._pending_verify: set[int] = set()
+        self._unsub_verify: CALLBACK_TYPE | None = None
+        self._max_gap: int = config.get(CONF_MAX_READ_GAP, DEFAULT_MAX_READ_GAP)
+        # Addresses this device rejects, learned from exception responses
+        self._unreadable: set[int] = set()
+        # Addresses left unread when the last poll turn ran out of budget
+        self._deferred: set[int] = set()
+        # Set while coordinator.data holds the last values read before the
+        # connection failed
+        self.stale_since: datetime | None = None
+        # Last good read of each address (monotonic), and the addresses
+        # currently served from that cache because their reads failed
+        self._stale_ttl: float = config.get(CONF_STALE_TTL, DEFAULT_STALE_TTL)
+        self._read_at: dict[int, float] = {}
+        self._cached: set[int] = set()
+        # Addresses whose cache state changed since listeners were notified
+        self._cache_touched: set[int] = set()
+        self._interval = AdaptivePollInterval(
+            SCAN_INTERVAL.total_seconds(),
+            config.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            config.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+        )
+        self._scheduler.set_interval(self._slave, self._interval.interval)
+        # Decoded engineering values by entity key, refreshed once per update
+        self.values: dict[str, Any] = {}
+        # Snapshot and availability the listeners were last notified about
+        self._notified_data: RegisterImage | None = None
+        self._notified_success: bool | None = None
+
+    def register_address(self, address: int, poll_class: str = POLL_LIVE) -> None:
+        """Declare the poll class of a Modbus address entities may read.
+
+        When several entities share an address, the fastest class wins.
+        The address is polled while an entity subscribes to it.
+        """
+        current = self._poll_classes.get(address)
+        if current is None or _POLL_RANK[poll_class] < _POLL_RANK[current]:
+            self._poll_classes[address] = poll_class
+        LOGGER.debug(
+            "Registered address 0x%04X for %s polling",
+            address,
+            self._poll_classes[address],
+        )
+
+    def register_write_address(self, address: int) -> None:
+        """Register a Modbus address that is written to but never read.
+
+        Write-only addresses (command triggers, external sensor inputs) are
+        kept out of the poll plan and skip the post-write verification.
+        """
+        self._write_only.add(address)
+        LOGGER.debug("Registered write-only address 0x%04X", address)
+
+    @callback
+    def async_subscribe(
+        self, addresses: Iterable[int], update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Subscribe an entity's update callback to the addresses it reads.
+
+        Returns a callback that drops the subscription again; addresses
+        left without subscribers are removed from the poll plan.
+        """
+        addresses = frozenset(addresses)
+        for addr in addresses:
+            if addr not in self._subscribers:
+                self._layout = None
+            self._subscribers.setdefault(addr, set()).add(update_callback)
+
+        @callback
+        def _unsubscribe() -> None:
+            for addr in addresses:
+                subscribers = self._subscribers.get(addr)
+                if subscribers is None:
+                    continue
+                subscribers.discard(update_callback)
+                if not subscribers:
+                    del self._subscribers[addr]
+                    self._layout = None
+                    LOGGER.debug("No subscribers left for 0x%04X", addr)
+
+        return _unsubscribe
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates, subscribing to the addresses in the context.
+
+        CoordinatorEntity adds its listener when the entity is added to
+        Home Assistant and removes it when the entity is removed, so entity
+        lifecycles drive the subscriptions.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        if not context:
+            return remove_listener
+
+        unsubscribe = self.async_subscribe(context, update_callback)
+
+        @callback
+        def _remove() -> None:
+            unsubscribe()
+            remove_listener()
+
+        return _remove
+
+    def _polled_addresses(self) -> dict[int, str]:
+        """Return the subscribed readable addresses with their poll class."""
+        return {
+            addr: self._poll_classes.get(addr, POLL_LIVE)
+            for addr in self._subscribers
+            if addr not in self._write_only
+        }
+
+    def _due_addresses(self) -> set[int]:
+        """Return the registered addresses that need reading this cycle."""
+        now = time.monotonic()
+        slow_due = (
+            self._slow_polled_at is None
+            or now - self._slow_polled_at >= SLOW_POLL_INTERVAL.total_seconds()
+        )
+        if slow_due:
+            self._slow_polled_at = now
+
+        data = self.data or {}
+        forced, self._force_read = self._force_read, set()
+        return {
+            addr
+            for addr, poll_class in self._polled_addresses().items()
+            if poll_class == POLL_LIVE
+            or addr in forced
+            or (poll_class == POLL_SLOW and slow_due)
+            or data.get(addr) is None
+        }
 
-    def register_address(self, address: int) -> None:
-        """Register a Modbus address to be polled."""
-        self._active_addresses.add(address)
-        LOGGER.debug("Registered address 0x%04X for polling", address)
+    @callback
+    def async_update_listeners(self) -> None:
+        """Decode changed registers and notify only their listeners.
+
+        The new snapshot is diffed against the one listeners last saw. The
+        values depending on a changed address are decoded into self.values,
+        then only the callbacks subscribed to a changed address are called.
+        Listeners without a context, and every listener on an availability
+        change, are always called, as are the listeners of addresses served
+        from the cache so their age attribute stays current.
+        """
+        previous, self._notified_data = self._notified_data, self.data
+        touched, self._cache_touched = self._cache_touched, set()
+        success_changed = self._notified_success != self.last_update_success
+        self._notified_success = self.last_update_success
+        data = self.data if self.data is not None else {}
+        if previous is None or success_changed:
+            self.values = {
+                key: codec.decode(data) for key, codec in self.catalog.codecs.items()
+            }
+            super().async_update_listeners()
+            return
+
+        changed = self.data.diff(previous) if self.data is not None else set(previous)
+        callbacks = {
+            update_callback
+            for update_callback, context in self._listeners.values()
+            if context is None
+        }
+        decoded: set[str] = set()
+        for layout in self.catalog.block_layouts:
+            if changed.isdisjoint(layout.addresses):
+                continue
+            values = layout.decode_mapping(data)
+            if values is not None:
+                self.values.update(values)
+                decoded.update(layout.keys)
+        for addr in changed:
+            for codec in self.catalog.codecs_by_address.get(addr, ()):
+                if codec.key not in decoded:
+                    self.values[codec.key] = codec.decode(data)
+            callbacks.update(self._subscribers.get(addr, ()))
+        for addr in touched:
+            callbacks.update(self._subscribers.get(addr, ()))
+        for update_callback in callbacks:
+            update_callback()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return polling and request queue state for diagnostics."""
+        return {
+            "device_profile": {
+                "name": self.profile.name,
+                "source": self.profile.source,
+                "registers": len(self.catalog.records),
+            },
+            "capabilities": self.identity.values.get("capabilities", {}),
+            "absent_addresses": [f"0x{addr:04X}" for addr in sorted(self.absent)],
+            "registered_addresses": len(self._poll_classes),
+            "subscribed_addresses": {
+                f"0x{addr:04X}": len(callbacks)
+                for addr, callbacks in sorted(self._subscribers.items())
+            },
+            "write_only_addresses": [
+                f"0x{addr:04X}" for addr in sorted(self._write_only)
+            ],
+            "unreadable_addresses": [
+                f"0x{addr:04X}" for addr in sorted(self._unreadable)
+            ],
+            "pipeline_window": self._client.pipeline_window,
+            "devices_on_connection": self._connections.users(self._host, self._port),
+            "bus": self._scheduler.stats(),
+            "poll_interval": self._interval.as_dict(),
+            "request_queue": self._client.queue_stats,
+            "connection": self._client.connection_state,
+            "stale_since": self.stale_since.isoformat() if self.stale_since else None,
+            "stale_ttl_s": self._stale_ttl,
+            "cached_addresses": [f"0x{addr:04X}" for addr in sorted(self._cached)],
+        }
+
+    def cache_attributes(self, addresses: Iterable[int] | None) -> dict[str, Any]:
+        """Return the age attribute of an entity served from the cache.
+
+        Empty while every address the entity reads was read successfully
+        on its last poll, so healthy entities carry no changing attribute.
+        """
+        if not addresses or self._cached.isdisjoint(addresses):
+            return {}
+        now = time.monotonic()
+        age = max(
+            (
+                now - self._read_at[addr]
+                for addr in self._cached.intersection(addresses)
+                if addr in self._read_at
+            ),
+            default=0.0,
+        )
+        return {"data_age_s": round(age)}
+
+    def device_info(self) -> dict[str, Any]:
+        """Return the device registry fields of this unit."""
+        return get_device_info(self._entry_id, self.identity.values, self.profile.name)
 
     async def async_setup(self) -> None:
-        """Connect the Modbus client."""
-        await self._client.ensure_connected()
+        """Load the identity saved on disk and narrow the register map.
 
-    async def async_close(self) -> None:
-        """Close the Modbus client connection."""
+        The device profile and the optional hardware saved with the
+        identity decide which registers get entities; registers of missing
+        features are neither exposed nor polled. The Modbus client
+        connects on the first read, so a unit that is slow or offline does
+        not hold up the platform setup. Until the identity has been read
+        once, the full register map is used.
+        """
+        await self.identity.async_load()
+        self.profile = await self._async_select_profile()
+        self.absent = self._absent_registers()
+        records = self.catalog.records
+        if self.profile.excludes:
+            records = self.profile.select(records)
+        if self.absent:
+            records = prune_records(records, self.absent)
+        if len(records) != len(self.catalog.records):
+            self.catalog = RegisterCatalog(records)
+        LOGGER.debug(
+            "Using device profile %s (%d registers, %d absent)",
+            self.profile.name,
+            len(self.catalog.records),
+            len(self.absent),
+        )
+
+        # The configuration bits are watched even with their binary sensors
+        # disabled, so installed or removed hardware is noticed
+        addresses = capability_addresses(self._capabilities)
+        for addr in addresses:
+            self.register_address(addr, POLL_SLOW)
+        self._unsub_capabilities = self.async_add_listener(
+            self._async_check_capabilities, addresses
+        )
+
+    def _absent_registers(self) -> frozenset[int]:
+        """Return the registers of the features the saved identity lacks."""
+        return absent_registers(
+            self._capabilities, self.identity.values.get("capabilities") or {}
+        )
+
+    @callback
+    def _async_check_capabilities(self) -> None:
+        """Re-read the identity when the polled configuration bits change."""
+        detected = detect_capabilities(self._capabilities, self.data or {})
+        saved = self.identity.values.get("capabilities") or {}
+        if any(saved.get(key) != present for key, present in detected.items()):
+            self.async_refresh_identity()
+
+    async def _async_select_profile(self) -> DeviceProfile:
+        """Return the profile matching the identity read from the unit."""
+        profiles = self.hass.data.get(DATA_PROFILES)
+        if profiles is None:
+            profiles = await self.hass.async_add_executor_job(
+                load_profiles, PROFILE_DIR
+            )
+            self.hass.data[DATA_PROFILES] = profiles
+        return select_profile(
+            profiles,
+            self.identity.values.get("controller_model"),
+            self.identity.values.get("firmware_release"),
+        )
+
+    @callback
+    def async_refresh_identity(self) -> None:
+        """Re-read the identity registers in the background."""
+        if self._identity_task is None or self._identity_task.done():
+            self._identity_task = self.hass.async_create_background_task(
+                self._async_refresh_identity(),
+                f"{DOMAIN} identity refresh {self._entry_id}",
+            )
+
+    async def _async_refresh_identity(self) -> None:
+        """Read the identity and capability registers and store them.
+
+        The entry is reloaded when the values select another device
+        profile or report other optional hardware, since its entities were
+        created from a different register map.
+        """
+        wanted = set(self.catalog.identity_addresses)
+        wanted.update(capability_addresses(self._capabilities))
+        results: dict[int, int | None] = {}
         try:
-            await self._client.close()
-        except Exception as err:
-            LOGGER.debug("Error closing Modbus client: %s", err)
+            for start, count in self._plan(wanted):
+                values, _ok = await self._async_read_block(
+                    start, count, wanted, PRIORITY_READ
+                )
+                results.update(values)
+        except SabianaTransportError as err:
+            LOGGER.debug("Identity refresh failed, keeping the saved values: %s", err)
+            return
+
+        values = decode_identity(results)
+        if detected := detect_capabilities(self._capabilities, results):
+            values["capabilities"] = {
+                **(self.identity.values.get("capabilities") or {}),
+                **detected,
+            }
+        if not await self.identity.async_update(values):
+            return
+        LOGGER.debug("Device identity changed: %s", self.identity.values)
+        profile = await self._async_select_profile()
+        if profile != self.profile or self._absent_registers() != self.absent:
+            # Entities were created from another register map
+            LOGGER.info(
+                "Unit reports device profile %s with capabilities %s, "
+                "reloading with its register map",
+                profile.name,
+                self.identity.values.get("capabilities"),
+            )
+            self.hass.config_entries.async_schedule_reload(self._entry_id)
+            return
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(
+            identifiers={(DOMAIN, self._entry_id)}
+        )
+        if device is not None:
+            device_registry.async_update_device(
+                device.id,
+                model=self.profile.name,
+                **identity_device_fields(self.identity.values),
+            )
+
+    async def async_close(self) -> None:
+        """Send buffered writes, then release the shared Modbus connection."""
+        if self._unsub_capabilities is not None:
+            self._unsub_capabilities()
+            self._unsub_capabilities = None
+        if self._identity_task is not None:
+            self._identity_task.cancel()
+            self._identity_task = None
+        await self._async_flush_writes()
+        if self._unsub_verify is not None:
+            self._unsub_verify()
+            self._unsub_verify = None
+        await self._connections.release(self._host, self._port, self._slave)
 
     async def async_write_register(self, address: int, value: int) -> bool:
-        """Write a register and optimistically update coordinator data.
+        """Queue a register write and return whether the unit accepted it.
 
-        - Perform the Modbus write
-        - Immediately reflect the new raw value in coordinator.data
-        - Schedule a short delayed refresh to reconcile with device
+        - Buffer the write for WRITE_COALESCE_DELAY; a later write to the
+          same address replaces it, and adjacent addresses are sent as one
+          write-multiple-registers request, in address order
+        - Command registers (COMMAND_ADDRESSES) are never coalesced: they
+          are sent one by one after the settings, in the order requested
+        - Show each accepted value in coordinator.data as soon as the write
+          succeeds, then re-read the written registers shortly after to
+          reconcile with the device
         """
-        ok = await self._client.write_register(
-            address=address, value=value, slave=self._slave
+        if address in COMMAND_ADDRESSES:
+            self._pending_commands.append((address, value))
+        else:
+            self._pending_writes[address] = value
+
+        if self._write_batch is None:
+            self._write_batch = self.hass.loop.create_future()
+            self._write_batch_started = time.monotonic()
+            self._unsub_flush = async_call_later(
+                self.hass, WRITE_COALESCE_DELAY, self._async_flush_writes
+            )
+
+        # Shielded: the batch is shared with every caller in the window
+        results = await asyncio.shield(self._write_batch)
+        return results.get(address, False)
+
+    async def _async_flush_writes(self, _now: datetime | None = None) -> None:
+        """Send the buffered writes, grouping adjacent registers."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        writes, self._pending_writes = self._pending_writes, {}
+        commands, self._pending_commands = self._pending_commands, []
+        batch, self._write_batch = self._write_batch, None
+        if batch is None:
+            return
+
+        results: dict[int, bool] = {}
+        accepted: dict[int, int] = {}
+        try:
+            for start, count in plan_writes(writes):
+                values = [writes[addr] for addr in range(start, start + count)]
+                ok = await self._client.write_registers(
+                    address=start, values=values, slave=self._slave
+                )
+                results.update(dict.fromkeys(range(start, start + count), ok))
+                if ok:
+                    accepted.update(
+                        (addr, writes[addr]) for addr in range(start, start + count)
+                    )
+            for address, value in commands:
+                ok = await self._client.write_register(
+                    address=address, value=value, slave=self._slave
+                )
+                results[address] = ok
+                if ok:
+                    accepted[address] = value
+        finally:
+            batch.set_result(results)
+            # Only values the unit accepted are shown. Listeners are notified
+            # directly, so availability and the poll timer are left alone.
+            shown = {
+                addr: raw for addr, raw in accepted.items() if addr in self._subscribers
+            }
+            if shown:
+                self.data = self._image().evolve(shown)
+                self.async_update_listeners()
+
+        latency = time.monotonic() - self._write_batch_started
+        self._scheduler.record_write(self._slave, latency)
+        if latency > MAX_WRITE_LATENCY:
+            LOGGER.warning(
+                "Writes to %s took %.2fs, the bus may be overloaded",
+                self.name,
+                latency,
+            )
+
+        # Verify shortly after (device may clamp/adjust value); failed writes
+        # are re-read too, in case the unit applied them after all
+        self._schedule_verify(addr for addr in results if addr in self._subscribers)
+
+    def _schedule_verify(self, addresses: Iterable[int]) -> None:
+        """Re-read written addresses after WRITE_VERIFY_DELAY.
+
+        Verifications requested while one is pending join it, so a scene
+        setting several registers triggers a single targeted read.
+        """
+        self._pending_verify.update(
+            addr for addr in addresses if addr not in self._write_only
         )
-        if ok:
-            # Optimistic update for snappy UI
-            new_data = dict(self.data or {})
-            new_data[address] = value
-            self.async_set_updated_data(new_data)
+        if self._pending_verify and self._unsub_verify is None:
+            self._unsub_verify = async_call_later(
+                self.hass, WRITE_VERIFY_DELAY, self._async_verify_writes
+            )
+
+    async def _async_verify_writes(self, _now: datetime | None = None) -> None:
+        """Read back the written registers and merge them into the data."""
+        self._unsub_verify = None
+        wanted, self._pending_verify = self._pending_verify, set()
+
+        results: dict[int, int | None] = {}
+        try:
+            for start, count in self._plan(wanted):
+                values, _ok = await self._async_read_block(
+                    start, count, wanted, PRIORITY_READ
+                )
+                results.update(values)
+        except SabianaTransportError as err:
+            LOGGER.debug("Verifying writes failed: %s", err)
+
+        updates: dict[int, int] = {}
+        for addr in wanted:
+            if results.get(addr) is None:
+                # Keep the written value until the next poll reads it
+                self._force_read.add(addr)
+            else:
+                updates[addr] = results[addr]
+        if not updates:
+            return
+        # A verification is not a poll: availability and the poll timer
+        # stay as the last refresh left them
+        self.data = self._image().evolve(updates)
+        self.async_update_listeners()
 
-            # Verify shortly after (device may clamp/adjust value)
-            async def _verify():
-                await asyncio.sleep(1.0)
-                await self.async_request_refresh()
+    def _plan(self, addresses) -> list[tuple[int, int]]:
+        """Plan block reads, bridging small holes but never unreadable ones."""
+        return plan_reads(addresses, max_gap=self._max_gap, skip=self._unreadable)
+
+    async def _async_read_block(
+        self,
+        start: int,
+        count: int,
+        wanted: set[int],
+        priority: int = PRIORITY_POLL,
+    ) -> tuple[dict[int, int | None], bool]:
+        """Read one planned block, bisecting it on an illegal address.
+
+        Returns the values read and whether the device accepted the block
+        as a whole. Other exception responses (busy, device failure) leave
+        the block unread for this cycle without learning anything from it.
+        SabianaTransportError propagates, since the rest of the plan would
+        fail the same way. Reads someone waits on (identity, write
+        verification) pass PRIORITY_READ to go ahead of queued polls.
+        """
+        try:
+            values = await self._client.read_block(
+                address=start, count=count, slave=self._slave, priority=priority
+            )
+        except SabianaExceptionResponse as err:
+            if not err.illegal_address:
+                LOGGER.debug(
+                    "Block 0x%04X-0x%04X not read (%s), retrying next poll",
+                    start,
+                    start + count - 1,
+                    err,
+                )
+                return split_block(start, count, None), False
+            LOGGER.debug(
+                "Block 0x%04X-0x%04X rejected (%s), bisecting",
+                start,
+                start + count - 1,
+                err,
+            )
+            return (
+                await self._async_bisect_block(start, count, wanted, priority),
+                False,
+            )
 
-            self.hass.async_create_task(_verify())
+        LOGGER.debug("Read 0x%04X-0x%04X → %s", start, start + count - 1, values)
+        return split_block(start, count, values), True
 
-        return ok
+    async def _async_bisect_block(
+        self, start: int, count: int, wanted: set[int], priority: int
+    ) -> dict[int, int | None]:
+        """Re-read a rejected block in halves and learn what to avoid."""
+        if count == 1:
+            LOGGER.warning(
+                "Register 0x%04X is rejected by the device, excluding it from polling",
+                start,
+            )
+            self._unreadable.add(start)
+            return {start: None}
 
-    async def _async_update_data(self) -> dict[int, int | None]:
-        """Poll only the registered Modbus addresses."""
+        members = sorted(addr for addr in wanted if start <= addr < start + count)
+        mid = len(members) // 2
         results: dict[int, int | None] = {}
+        covered: set[int] = set()
+        halves_ok = True
 
-        for addr in self._active_addresses:
-            try:
-                value = await self._client.read_register(
-                    address=addr, count=1, slave=self._slave
+        for half in (members[:mid], members[mid:]):
+            for sub_start, sub_count in self._plan(half):
+                values, ok = await self._async_read_block(
+                    sub_start, sub_count, wanted, priority
                 )
-                results[addr] = value[0] if value else None
-                LOGGER.debug("Read 0x%04X → %s", addr, results[addr])
-            except Exception as err:
-                LOGGER.error("Error reading register 0x%04X: %s", addr, err)
-                results[addr] = None
+                results.update(values)
+                if ok:
+                    covered.update(range(sub_start, sub_start + sub_count))
+                halves_ok = halves_ok and ok
+
+        if halves_ok:
+            # Both halves read fine on their own, so the holes only the
+            # spanning read bridged are what the device refused.
+            holes = set(range(start, start + count)) - covered
+            LOGGER.info(
+                "Not bridging unreadable registers %s in block reads",
+                ", ".join(f"0x{addr:04X}" for addr in sorted(holes)),
+            )
+            self._unreadable.update(holes)
 
         return results
+
+    def _image(self) -> RegisterImage:
+        """Return the current snapshot laid out over the subscribed addresses."""
+        if self._layout is None:
+            self._layout = RegisterLayout(self._subscribers)
+        if self.data is not None and self.data.layout is self._layout:
+            return self.data
+        return RegisterImage.from_mapping(self._layout, self.data or {})
+
+    async def _async_update_data(self) -> RegisterImage:
+        """Poll the registers that are due, keeping the rest from last cycle.
+
+        The poll runs inside a turn of the bus scheduler shared with the
+        other devices on the gateway. Blocks not started before the turn's
+        budget runs out keep their previous values and go first next time.
+
+        The first transport error aborts the rest of the plan: the last
+        values are kept and served from the cache while they are younger
+        than the stale TTL; once none is, UpdateFailed makes the entities
+        unavailable after about one timeout instead of one per block.
+        """
+        wanted = self._due_addresses()
+        results: dict[int, int | None] = {}
+
+        try:
+            async with self._scheduler.poll_turn(self._slave) as turn:
+                deferred = await self._async_read_plan(wanted, turn, results)
+                duration = time.monotonic() - turn.started
+        except SabianaTransportError as err:
+            if self.stale_since is None:
+                self.stale_since = dt_util.utcnow()
+            # Read everything that was due once the connection is back
+            self._force_read.update(wanted)
+            image, served = self._serve_cached(wanted, results)
+            if not served:
+                raise UpdateFailed(f"Polling {self.name} aborted: {err}") from err
+            LOGGER.debug("Polling %s failed, serving cached values: %s", self.name, err)
+            return image
+
+        self.stale_since = None
+
+        if deferred:
+            LOGGER.debug(
+                "Poll budget used up, deferring %d registers to the next turn",
+                len(deferred),
+            )
+        self._deferred = deferred
+        self._force_read.update(deferred)
+        polled = wanted - deferred
+        image, _served = self._serve_cached(polled, results)
+        self._adapt_interval(duration, polled, image.diff(self.data))
+        return image
+
+    def _serve_cached(
+        self, polled: set[int], results: dict[int, int | None]
+    ) -> tuple[RegisterImage, bool]:
+        """Merge a poll's results, keeping last good values for failed reads.
+
+        A failed read keeps the previous value while it is younger than the
+        stale TTL and becomes None after. Also returns whether any polled
+        address was read or served from the cache.
+        """
+        now = time.monotonic()
+        current = self.data if self.data is not None else {}
+        updates: dict[int, int | None] = {}
+        served = False
+        for addr in polled:
+            raw = results.get(addr)
+            if raw is not None:
+                updates[addr] = raw
+                self._read_at[addr] = now
+                if addr in self._cached:
+                    self._cached.discard(addr)
+                    self._cache_touched.add(addr)
+                served = True
+            elif (
+                current.get(addr) is not None
+                and now - self._read_at.get(addr, now - self._stale_ttl)
+                < self._stale_ttl
+            ):
+                self._cached.add(addr)
+                self._cache_touched.add(addr)
+                served = True
+            else:
+                updates[addr] = None
+                if addr in self._cached:
+                    self._cached.discard(addr)
+                    self._cache_touched.add(addr)
+        return self._image().evolve(updates), served or not polled
+
+    def _adapt_interval(
+        self, duration: float, polled: set[int], changed: set[int]
+    ) -> None:
+        """Pick the next poll interval from this cycle's measurements."""
+        interval = self._interval.record_cycle(
+            duration, polled, changed, self._scheduler.utilization
+        )
+        if interval != self.update_interval.total_seconds():
+            LOGGER.debug(
+                "Poll interval of %s now %.2fs: %s",
+                self.name,
+                interval,
+                ", ".join(self._interval.reasons),
+            )
+            self.update_interval = timedelta(seconds=interval)
+            # Turn budgets on the shared bus follow the intervals in use
+            self._scheduler.set_interval(self._slave, interval)
+
+    async def _async_read_plan(
+        self, wanted: set[int], turn: PollTurn, results: dict[int, int | None]
+    ) -> set[int]:
+        """Read the planned blocks while the turn has budget left.
+
+        Returns the wanted addresses of the blocks that were not read, and
+        raises the first SabianaTransportError once the blocks already in
+        flight have finished; blocks not yet started are dropped.
+        """
+        plan = self._plan(wanted)
+        # Blocks deferred last turn go first, so a tight budget cannot
+        # starve the tail of the plan
+        plan.sort(
+            key=lambda block: self._deferred.isdisjoint(
+                range(block[0], block[0] + block[1])
+            )
+        )
+        window = asyncio.Semaphore(self._client.pipeline_window)
+        deferred: set[int] = set()
+        skipped = 0
+        failure: SabianaTransportError | None = None
+
+        async def _read(index: int, start: int, count: int) -> None:
+            nonlocal skipped, failure
+            async with window:
+                if failure is not None:
+                    return
+                # The first block is always read so every turn makes progress
+                if index and turn.expired:
+                    deferred.update(wanted.intersection(range(start, start + count)))
+                    skipped += 1
+                    return
+                try:
+                    values, _ok = await self._async_read_block(start, count, wanted)
+                except SabianaTransportError as err:
+                    failure = failure or err
+                    return
+                results.update(values)
+
+        # Up to a pipeline window of blocks are in flight at once
+        await asyncio.gather(
+            *(_read(index, start, count) for index, (start, count) in enumerate(plan))
+        )
+        if failure is not None:
+            raise failure
+        if skipped:
+            self._scheduler.record_deferred(self._slave, skipped)
+        return deferred
@@ -0,0 +1,135 @@
+"""Pipelined Modbus TCP reads for the Sabiana client.
+
+pymodbus executes one transaction at a time per client, so every read waits
+a full round trip before the next one is sent. Modbus TCP tags each frame
+with a transaction ID, which lets several requests share the socket: this
+transport keeps up to ``window`` holding-register reads in flight and
+matches the responses back by transaction ID.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import struct
+
+# Transaction ID, protocol ID, length, unit ID
+_MBAP = struct.Struct(">HHHB")
+_READ_REQUEST = struct.Struct(">BHH")
+_READ_HOLDING_REGISTERS = 0x03
+
+
+class PipelineExceptionResponse(Exception):
+    """The device answered a pipelined request with an exception code."""
+
+    def __init__(self, code: int) -> None:
+        super().__init__(f"exception code {code}")
+        self.code = code
+
+
+class ModbusTcpPipeline:
+    """Modbus TCP transport with a bounded window of in-flight reads."""
+
+    def __init__(
+        self, host: str, port: int, window: int = 4, timeout: float = 3.0
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.window = max(1, window)
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(self.window)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._receiver: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future[bytes]] = {}
+        self._next_tid = 0
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the socket is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests awaiting a response."""
+        return len(self._pending)
+
+    async def connect(self) -> None:
+        """Open the socket and start matching responses."""
+        if self.connected:
+            return
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        self._receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    async def read_holding_registers(
+        self, address: int, count: int, unit: int
+    ) -> list[int]:
+        """Read holding registers, sharing the socket with other reads.
+
+        Raises PipelineExceptionResponse for exception responses and
+        ConnectionError or TimeoutError when the transaction is lost.
+        """
+        async with self._slots:
+            if not self.connected:
+                raise ConnectionError("Pipeline is not connected")
+
+            tid = self._allocate_tid()
+            future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+            self._pending[tid] = future
+            pdu = _READ_REQUEST.pack(_READ_HOLDING_REGISTERS, address, count)
+            self._writer.write(_MBAP.pack(tid, 0, len(pdu) + 1, unit) + pdu)
+            try:
+                await self._writer.drain()
+                pdu = await asyncio.wait_for(future, self.timeout)
+            finally:
+                self._pending.pop(tid, None)
+
+        if pdu[0] & 0x80:
+            raise PipelineExceptionResponse(pdu[1] if len(pdu) > 1 else 0)
+        byte_count = pdu[1]
+        return list(struct.unpack_from(f">{byte_count // 2}H", pdu, 2))
+
+    async def close(self) -> None:
+        """Close the socket and fail every pending request."""
+        if self._receiver is not None:
+            self._receiver.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._receiver
+            self._receiver = None
+        if self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(Exception):
+                await self._writer.wait_closed()
+            self._writer = self._reader = None
+        self._fail_pending(ConnectionError("Pipeline closed"))
+
+    def _allocate_tid(self) -> int:
+        """Return the next transaction ID not currently in flight."""
+        while True:
+            self._next_tid = self._next_tid % 0xFFFF + 1
+            if self._next_tid not in self._pending:
+                return self._next_tid
+
+    async def _receive(self) -> None:
+        """Route each response frame to the request with its transaction ID."""
+        try:
+            while True:
+                header = await self._reader.readexactly(_MBAP.size)
+                tid, _protocol, length, _unit = _MBAP.unpack(header)
+                pdu = await self._reader.readexactly(length - 1)
+                future = self._pending.get(tid)
+                if future is not None and not future.done():
+                    future.set_result(pdu)
+        except (asyncio.IncompleteReadError, OSError) as err:
+            self._fail_pending(ConnectionError(f"Pipeline connection lost: {err}"))
+            if self._writer is not None:
+                self._writer.close()
+
+    def _fail_pending(self, err: Exception) -> None:
+        """Fail every request that is still waiting for a response."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+        self._pending.clear()
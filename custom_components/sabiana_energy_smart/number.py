@@ -7,40 +7,42 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, NUMBER_DEFINITIONS, get_device_info
+from .catalog import KIND_NUMBER, RegisterRecord
+from .const import DOMAIN, LOGGER
+from .entity import SabianaEntity
 
 
-class SabianaNumberEntity(CoordinatorEntity, NumberEntity):
+class SabianaNumberEntity(SabianaEntity, NumberEntity):
     """Number entity representing a writable Modbus register."""
 
-    def __init__(self, coordinator: CoordinatorEntity, reg: dict, entry_id: str):
-        super().__init__(coordinator)
-        self._reg = reg
-        self._address = reg["address"]
-        self._scale = reg.get("scale", 1.0)
-        self._precision = reg.get("precision", 0)
-
-        self._attr_name = reg["name"]
-        self._attr_unique_id = reg["unique_id"]
-        self._attr_native_min_value = reg["min"]
-        self._attr_native_max_value = reg["max"]
-        self._attr_native_unit_of_measurement = reg["unit"]
-        self._attr_device_info = DeviceInfo(**get_device_info(entry_id))
+    def __init__(
+        self, coordinator: CoordinatorEntity, record: RegisterRecord, entry_id: str
+    ):
+        # Write-only inputs subscribe to nothing, so they are never polled
+        super().__init__(
+            coordinator,
+            context=frozenset({record.address}) if record.readable else frozenset(),
+        )
+        self._key = record.key
+        self._address = record.address
+        self._scale = record.scale
+        self._readable = record.readable
+        # Last value written to a write-only input, which cannot be read back
+        self._written: float | None = None
+
+        self._attr_name = record.name
+        self._attr_unique_id = f"{entry_id}_number_{record.key}"
+        self._attr_native_min_value = record.minimum
+        self._attr_native_max_value = record.maximum
+        self._attr_native_unit_of_measurement = record.unit
+        self._attr_device_info = DeviceInfo(**coordinator.device_info())
 
     @property
     def native_value(self) -> float | None:
-        raw = self.coordinator.data.get(self._address)
-        if raw is None:
-            return None
-
-        # Handle signed 16-bit integers for temperature offsets
-        # Check if this register expects negative values (min < 0)
-        if self._attr_native_min_value < 0:
-            # Convert unsigned to signed if necessary (two's complement)
-            if raw > 0x7FFF:
-                raw = raw - 0x10000
-
-        return round(raw * self._scale, self._precision)
+        if not self._readable:
+            return self._written
+        # Registers with a negative minimum are decoded as two's complement
+        return self.coordinator.values.get(self._key)
 
     async def async_set_native_value(self, value: float) -> None:
         raw_value = round(value / self._scale)
@@ -56,6 +58,9 @@ class SabianaNumberEntity(CoordinatorEntity, NumberEntity):
                 LOGGER.debug(
                     "Wrote value %s (raw %d) to 0x%04X", value, raw_value, self._address
                 )
+                if not self._readable:
+                    self._written = value
+                    self.async_write_ha_state()
         except Exception as err:
             LOGGER.error(
                 "Failed to write value %s to 0x%04X: %s", value, self._address, err
@@ -70,8 +75,11 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[SabianaNumberEntity] = []
 
-    for reg in NUMBER_DEFINITIONS:
-        coordinator.register_address(reg["address"])
-        entities.append(SabianaNumberEntity(coordinator, reg, entry.entry_id))
+    for record in coordinator.catalog.kind(KIND_NUMBER):
+        if record.readable:
+            coordinator.register_address(record.address, record.poll_class)
+        else:
+            coordinator.register_write_address(record.address)
+        entities.append(SabianaNumberEntity(coordinator, record, entry.entry_id))
 
     async_add_entities(entities)
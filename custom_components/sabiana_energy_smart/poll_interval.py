@@ -0,0 +1,120 @@
+"""Choose the coordinator's poll interval from bus latency and volatility."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Any
+
+# Weight of the newest sample in the moving averages
+_SMOOTHING = 0.2
+# Never poll faster than this multiple of the measured cycle time
+CYCLE_HEADROOM = 2.0
+# Bus utilization above which polling backs off
+SATURATED_UTILIZATION = 0.8
+# Mean share of registers changing per cycle that shortens or lengthens
+# the interval
+VOLATILE_RATE = 0.2
+STABLE_RATE = 0.02
+# Factors applied to the interval per cycle
+BACKOFF_FACTOR = 1.5
+SPEEDUP_FACTOR = 0.8
+SLOWDOWN_FACTOR = 1.25
+
+
+class AdaptivePollInterval:
+    """Track cycle time and register volatility to pick the next interval.
+
+    After each poll the interval is re-evaluated:
+
+    - a saturated bus backs off, whatever the data does
+    - registers changing on many cycles shorten the interval
+    - registers that hardly ever change lengthen it
+
+    The result is clamped to the configured bounds and never drops below
+    twice the measured cycle time, so cycles cannot stack up on a slow
+    gateway. The reasons for the last decision are kept for diagnostics.
+    """
+
+    def __init__(self, initial: float, minimum: float, maximum: float) -> None:
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.interval = min(max(initial, self.minimum), self.maximum)
+        self.cycle_time: float | None = None
+        self.utilization = 0.0
+        self.reasons: list[str] = []
+        # address → moving share of cycles on which the register changed
+        self._change_rates: dict[int, float] = {}
+
+    @property
+    def volatility(self) -> float:
+        """Return the mean change rate of the polled registers."""
+        if not self._change_rates:
+            return 0.0
+        return sum(self._change_rates.values()) / len(self._change_rates)
+
+    def record_cycle(
+        self,
+        duration: float,
+        polled: Collection[int],
+        changed: Collection[int],
+        utilization: float,
+    ) -> float:
+        """Record one poll cycle and return the interval to use next."""
+        self.cycle_time = (
+            duration
+            if self.cycle_time is None
+            else self.cycle_time + (duration - self.cycle_time) * _SMOOTHING
+        )
+        self.utilization = utilization
+        for addr in polled:
+            rate = self._change_rates.get(addr, 0.0)
+            hit = 1.0 if addr in changed else 0.0
+            self._change_rates[addr] = rate + (hit - rate) * _SMOOTHING
+
+        volatility = self.volatility
+        interval = self.interval
+        reasons: list[str] = []
+        if utilization > SATURATED_UTILIZATION:
+            interval *= BACKOFF_FACTOR
+            reasons.append(f"bus saturated ({utilization:.0%} busy)")
+        elif volatility > VOLATILE_RATE:
+            interval *= SPEEDUP_FACTOR
+            reasons.append(f"values changing ({volatility:.0%} of registers/cycle)")
+        elif volatility < STABLE_RATE:
+            interval *= SLOWDOWN_FACTOR
+            reasons.append(f"values stable ({volatility:.1%} of registers/cycle)")
+
+        floor = max(self.minimum, self.cycle_time * CYCLE_HEADROOM)
+        if interval < floor:
+            interval = floor
+            reasons.append(
+                "limited by cycle time"
+                if floor > self.minimum
+                else "limited by minimum interval"
+            )
+        elif interval > self.maximum:
+            interval = self.maximum
+            reasons.append("limited by maximum interval")
+
+        self.interval = min(interval, max(self.maximum, floor))
+        self.reasons = reasons or ["holding"]
+        return self.interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the chosen interval and why, for diagnostics."""
+        most_volatile = sorted(
+            self._change_rates.items(), key=lambda item: item[1], reverse=True
+        )[:5]
+        return {
+            "interval_s": round(self.interval, 2),
+            "bounds_s": [self.minimum, self.maximum],
+            "cycle_time_ms": None
+            if self.cycle_time is None
+            else round(self.cycle_time * 1000, 1),
+            "bus_utilization": round(self.utilization, 3),
+            "volatility": round(self.volatility, 3),
+            "most_volatile": {
+                f"0x{addr:04X}": round(rate, 3) for addr, rate in most_volatile
+            },
+            "reasons": self.reasons,
+        }
@@ -0,0 +1,67 @@
+"""Plan Modbus block reads for the Sabiana coordinator."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+
+# Maximum number of holding registers a single FC03 request may return.
+MAX_READ_COUNT = 125
+# Maximum number of registers a single FC16 request may write.
+MAX_WRITE_COUNT = 123
+
+
+def plan_reads(
+    addresses: Iterable[int],
+    max_count: int = MAX_READ_COUNT,
+    max_gap: int = 0,
+    skip: Collection[int] = (),
+) -> list[tuple[int, int]]:
+    """Group addresses into (start, count) blocks.
+
+    Consecutive addresses are merged into a single block. Holes of up to
+    ``max_gap`` unrequested registers are bridged as long as none of the
+    bridged addresses is listed in ``skip``. Addresses in ``skip`` are never
+    read, and a block is split whenever it would exceed ``max_count``
+    registers.
+    """
+    blocks: list[tuple[int, int]] = []
+    start: int | None = None
+    prev = 0
+
+    for addr in sorted(set(addresses).difference(skip)):
+        if (
+            start is not None
+            and addr - prev - 1 <= max_gap
+            and addr - start < max_count
+            and not any(gap in skip for gap in range(prev + 1, addr))
+        ):
+            prev = addr
+            continue
+        if start is not None:
+            blocks.append((start, prev - start + 1))
+        start = prev = addr
+
+    if start is not None:
+        blocks.append((start, prev - start + 1))
+
+    return blocks
+
+
+def plan_writes(addresses: Iterable[int]) -> list[tuple[int, int]]:
+    """Group addresses into runs that one FC16 request can write.
+
+    Unlike reads, a write never bridges a hole: every register in a run
+    must have a value to write.
+    """
+    return plan_reads(addresses, max_count=MAX_WRITE_COUNT)
+
+
+def split_block(
+    start: int, count: int, registers: list[int] | None
+) -> dict[int, int | None]:
+    """Map the registers of a block read back to their addresses."""
+    registers = registers or []
+    return {
+        start + offset: registers[offset] if offset < len(registers) else None
+        for offset in range(count)
+    }
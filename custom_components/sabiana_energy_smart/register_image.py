@@ -0,0 +1,152 @@
+"""Compact snapshots of the raw registers polled from a Sabiana unit."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+
+
+class RegisterLayout:
+    """Addresses held by a register image, grouped into dense windows.
+
+    A layout is built once per set of polled addresses and shared by every
+    snapshot taken while that set does not change.
+    """
+
+    __slots__ = ("addresses", "windows", "_index")
+
+    def __init__(self, addresses: Iterable[int]) -> None:
+        self.addresses = tuple(sorted(set(addresses)))
+        self._index = {addr: offset for offset, addr in enumerate(self.addresses)}
+        # (offset, count) of every run of consecutive addresses
+        windows: list[tuple[int, int]] = []
+        for offset, addr in enumerate(self.addresses):
+            if windows and addr == self.addresses[offset - 1] + 1:
+                start, count = windows[-1]
+                windows[-1] = (start, count + 1)
+            else:
+                windows.append((offset, 1))
+        self.windows = tuple(windows)
+
+    def __contains__(self, address: object) -> bool:
+        return address in self._index
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+
+class RegisterImage(Mapping[int, int | None]):
+    """Immutable snapshot of raw register values.
+
+    Values live in one ``array('H')`` laid out by a shared RegisterLayout,
+    with an integer bitmap marking which registers hold a valid reading.
+    Reads behave like the ``dict[int, int | None]`` the entities used to
+    get, with None for registers that could not be read. Updates never
+    modify a snapshot: evolve copies the array once and returns a new
+    image, so the snapshot listeners last saw stays intact for diffing.
+    """
+
+    __slots__ = ("layout", "_values", "_valid")
+
+    def __init__(
+        self, layout: RegisterLayout, values: array | None = None, valid: int = 0
+    ) -> None:
+        self.layout = layout
+        self._values = (
+            values if values is not None else array("H", bytes(2 * len(layout)))
+        )
+        self._valid = valid
+
+    @classmethod
+    def from_mapping(
+        cls, layout: RegisterLayout, data: Mapping[int, int | None]
+    ) -> RegisterImage:
+        """Build an image of ``layout`` from an address → raw value mapping."""
+        values = array("H", bytes(2 * len(layout)))
+        valid = 0
+        for offset, addr in enumerate(layout.addresses):
+            raw = data.get(addr)
+            if raw is not None:
+                values[offset] = raw
+                valid |= 1 << offset
+        return cls(layout, values, valid)
+
+    def __getitem__(self, address: int) -> int | None:
+        offset = self.layout._index[address]
+        return self._values[offset] if self._valid >> offset & 1 else None
+
+    def get(self, address: int, default: int | None = None) -> int | None:
+        offset = self.layout._index.get(address)
+        if offset is None or not self._valid >> offset & 1:
+            return default
+        return self._values[offset]
+
+    def __contains__(self, address: object) -> bool:
+        return address in self.layout
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.layout.addresses)
+
+    def __len__(self) -> int:
+        return len(self.layout)
+
+    def __repr__(self) -> str:
+        return f"RegisterImage({dict(self.items())!r})"
+
+    def evolve(self, updates: Mapping[int, int | None]) -> RegisterImage:
+        """Return a copy of the image with some registers replaced.
+
+        Addresses outside the layout extend it, which rebuilds the layout.
+        """
+        index = self.layout._index
+        if not all(addr in index for addr in updates):
+            merged = {**self, **updates}
+            return RegisterImage.from_mapping(RegisterLayout(merged), merged)
+
+        values = self._values[:]
+        valid = self._valid
+        for addr, raw in updates.items():
+            offset = index[addr]
+            if raw is None:
+                values[offset] = 0
+                valid &= ~(1 << offset)
+            else:
+                values[offset] = raw
+                valid |= 1 << offset
+        return RegisterImage(self.layout, values, valid)
+
+    def diff(self, other: Mapping[int, int | None] | None) -> set[int]:
+        """Return the addresses whose value differs from ``other``.
+
+        Images sharing a layout are compared window by window on the raw
+        arrays; anything else falls back to comparing every address.
+        """
+        if other is None:
+            return set(self)
+        if not isinstance(other, RegisterImage) or other.layout is not self.layout:
+            return {
+                addr
+                for addr in self.keys() | other.keys()
+                if self.get(addr) != other.get(addr)
+            }
+
+        flipped = self._valid ^ other._valid
+        if not flipped and self._values == other._values:
+            return set()
+
+        addresses = self.layout.addresses
+        changed = {
+            addresses[offset]
+            for offset in range(flipped.bit_length())
+            if flipped >> offset & 1
+        }
+        mine, theirs = self._values, other._values
+        for start, count in self.layout.windows:
+            end = start + count
+            if mine[start:end] != theirs[start:end]:
+                changed.update(
+                    addresses[offset]
+                    for offset in range(start, end)
+                    if mine[offset] != theirs[offset]
+                )
+        return changed
@@ -0,0 +1,137 @@
+"""Priority queue that orders Modbus transactions on one connection."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+from typing import Any
+
+# Lower value is served first
+PRIORITY_WRITE = 0
+# Reads something waits on: identity and write verification
+PRIORITY_READ = 1
+PRIORITY_POLL = 2
+
+# Weight of the newest sample in the moving wait-time average
+_WAIT_SMOOTHING = 0.2
+
+
+class RequestQueue:
+    """Grant transaction slots by priority, then fairly across owners.
+
+    At most ``slots`` transactions run at once. When a slot frees up, the
+    waiting request with the lowest priority value gets it, so writes jump
+    ahead of queued background polls.
+
+    Devices sharing a connection pass their slave ID as the owner. Within a
+    priority, requests are served in order of a per-owner turn number, so
+    a device queueing a long poll plan interleaves with the others instead
+    of holding the connection until its plan is done.
+    """
+
+    def __init__(self, slots: int = 1) -> None:
+        self._slots = max(1, slots)
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        # Turn of the last granted request, and the last turn of each owner
+        self._turn = 0
+        self._owner_turns: dict[Hashable, int] = {}
+        self._owner_granted: dict[Hashable, int] = {}
+        self._max_depth = 0
+        self._last_wait = 0.0
+        self._avg_wait = 0.0
+        self._max_wait = 0.0
+        self._granted = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently holding a slot."""
+        return self._in_flight
+
+    def resize(self, slots: int) -> None:
+        """Change how many transactions may run at once."""
+        self._slots = max(1, slots)
+        self._wake()
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and wait time statistics."""
+        return {
+            "slots": self._slots,
+            "in_flight": self._in_flight,
+            "depth": self.depth,
+            "max_depth": self._max_depth,
+            "granted": self._granted,
+            "last_wait_ms": round(self._last_wait * 1000, 1),
+            "avg_wait_ms": round(self._avg_wait * 1000, 1),
+            "max_wait_ms": round(self._max_wait * 1000, 1),
+            "granted_by_owner": dict(self._owner_granted),
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: int = PRIORITY_POLL, owner: Hashable = None
+    ) -> AsyncIterator[None]:
+        """Hold a transaction slot for the duration of the block."""
+        await self._acquire(priority, owner)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int, owner: Hashable) -> None:
+        """Wait until a slot is granted to this request."""
+        queued_at = time.monotonic()
+        if self._in_flight < self._slots and not self._waiters:
+            self._in_flight += 1
+            self._record_wait(owner, 0.0)
+            return
+
+        # An owner's requests take consecutive turns starting no earlier
+        # than the turn being served, so owners alternate
+        turn = max(self._turn, self._owner_turns.get(owner, 0)) + 1
+        self._owner_turns[owner] = turn
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, turn, next(self._sequence), future))
+        self._max_depth = max(self._max_depth, len(self._waiters))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before the cancellation landed
+                self._release()
+            raise
+        self._record_wait(owner, time.monotonic() - queued_at)
+
+    def _release(self) -> None:
+        """Return a slot and hand it to the next waiter."""
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Grant free slots to waiters in priority order."""
+        while self._waiters and self._in_flight < self._slots:
+            _priority, turn, _sequence, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._in_flight += 1
+            self._turn = max(self._turn, turn)
+            future.set_result(None)
+
+    def _record_wait(self, owner: Hashable, wait: float) -> None:
+        """Update the wait time statistics."""
+        self._granted += 1
+        self._owner_granted[owner] = self._owner_granted.get(owner, 0) + 1
+        self._last_wait = wait
+        self._max_wait = max(self._max_wait, wait)
+        self._avg_wait += (wait - self._avg_wait) * _WAIT_SMOOTHING
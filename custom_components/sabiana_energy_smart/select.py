@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,7 +7,9 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, SELECT_DEFINITIONS, get_device_info
+from .catalog import KIND_SELECT, RegisterRecord
+from .const import DOMAIN, LOGGER
+from .entity import SabianaEntity
 
 
 async def async_setup_entry(
@@ -20,48 +20,39 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     selects = []
 
-    for addr, reg in SELECT_DEFINITIONS.items():
-        if (
-            reg.get("options")
-            and reg.get("writable")
-            and (
-                not reg.get("entity_type") == "switch"
-                and not reg.get("entity_type") == "button"
-            )
-        ):
-            coordinator.register_address(addr)
-            selects.append(
-                SabianaModbusSelect(
-                    coordinator=coordinator,
-                    reg=reg,
-                    address=addr,
-                    entry_id=entry.entry_id,
-                )
+    for record in coordinator.catalog.kind(KIND_SELECT):
+        coordinator.register_address(record.address, record.poll_class)
+        selects.append(
+            SabianaModbusSelect(
+                coordinator=coordinator,
+                record=record,
+                entry_id=entry.entry_id,
             )
+        )
 
     LOGGER.debug("Adding %d Modbus select entities", len(selects))
     async_add_entities(selects)
 
 
-class SabianaModbusSelect(CoordinatorEntity, SelectEntity):
+class SabianaModbusSelect(SabianaEntity, SelectEntity):
     """Select entity that maps values from Modbus register options."""
 
     def __init__(
         self,
         coordinator: CoordinatorEntity,
-        reg: dict[str, Any],
-        address: int,
+        record: RegisterRecord,
         entry_id: str,
     ):
-        super().__init__(coordinator)
-        self._address = address
-        self._options_map = reg["options"]
+        super().__init__(coordinator, context=frozenset({record.address}))
+        self._address = record.address
+        self._key = record.key
+        self._options_map = record.options
         self._reverse_map = {v: k for k, v in self._options_map.items()}
 
-        self._attr_name = reg["name"]
-        self._attr_unique_id = f"sabiana_select_{reg['key']}"
+        self._attr_name = record.name
+        self._attr_unique_id = f"{entry_id}_select_{record.key}"
         self._attr_options = list(self._reverse_map.keys())
-        self._attr_device_info = DeviceInfo(**get_device_info(entry_id))
+        self._attr_device_info = DeviceInfo(**coordinator.device_info())
 
         LOGGER.debug(
             "Initialized select '%s' with options: %s",
@@ -71,15 +62,10 @@ class SabianaModbusSelect(CoordinatorEntity, SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        raw = self.coordinator.data.get(self._address)
-        if raw is None:
-            LOGGER.debug("No data at 0x%04X for select %s", self._address, self.name)
+        value = self.coordinator.values.get(self._key)
+        if value is None:
             return None
-
-        val = raw[0] if isinstance(raw, list) else raw
-        label = self._options_map.get(val)
-        LOGGER.debug("%s: raw=%s → mapped='%s'", self.name, val, label)
-        return label
+        return self._options_map.get(value)
 
     async def async_select_option(self, option: str) -> None:
         if option not in self._reverse_map:
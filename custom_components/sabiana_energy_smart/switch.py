@@ -5,34 +5,28 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER, SWITCH_DEFINITIONS, get_device_info
+from .catalog import KIND_SWITCH, RegisterRecord
+from .const import DOMAIN, LOGGER
+from .entity import SabianaEntity
 
 
-class SabianaSwitch(CoordinatorEntity, SwitchEntity):
+class SabianaSwitch(SabianaEntity, SwitchEntity):
     """Modbus-based switch entity for Sabiana."""
 
-    def __init__(self, coordinator, props: dict, entry_id: str):
-        super().__init__(coordinator)
-        self._address = props["address"]
-        self._bit = props.get("bit")
-        self._key = props["key"]
+    def __init__(self, coordinator, record: RegisterRecord, entry_id: str):
+        super().__init__(coordinator, context=frozenset({record.address}))
+        self._address = record.address
+        self._key = record.key
 
-        self._attr_name = props["name"]
-        self._attr_unique_id = f"sabiana_switch_{self._key}"
+        self._attr_name = record.name
+        self._attr_unique_id = f"{entry_id}_switch_{self._key}"
         # self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_device_info = DeviceInfo(**get_device_info(entry_id))
+        self._attr_device_info = DeviceInfo(**coordinator.device_info())
 
     @property
     def is_on(self) -> bool | None:
-        raw = self.coordinator.data.get(self._address)
-        if raw is None:
-            return None
-
-        if self._bit is not None:
-            return bool((raw >> self._bit) & 1)
-        return bool(raw)
+        return self.coordinator.values.get(self._key)
 
     async def async_turn_on(self, **kwargs):
         try:
@@ -61,14 +55,9 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     switches = []
 
-    for address, props in SWITCH_DEFINITIONS.items():
-        if props.get("entity_type") == "switch":
-            coordinator.register_address(address)
-            switches.append(
-                SabianaSwitch(
-                    coordinator, {**props, "address": address}, entry.entry_id
-                )
-            )
+    for record in coordinator.catalog.kind(KIND_SWITCH):
+        coordinator.register_address(record.address, record.poll_class)
+        switches.append(SabianaSwitch(coordinator, record, entry.entry_id))
 
     LOGGER.debug("Adding %d switches", len(switches))
     async_add_entities(switches)
@@ -1,7 +1,43 @@
 """Test configuration and pytest fixtures for Sabiana Energy Smart integration."""
 
+import importlib
+import os
+import sys
+import types
+
 import pytest
 
+try:
+    import pytest_homeassistant_custom_component  # noqa: F401
+except ImportError:
+    # These tests run inside a Home Assistant test instance
+    collect_ignore = [
+        "test_connection_manager.py",
+        "test_coordinator.py",
+        "test_init.py",
+    ]
+
+COMPONENT_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "custom_components", "sabiana_energy_smart"
+)
+# Bare package holding the standalone modules, so their relative imports
+# resolve without running the integration's __init__
+STANDALONE_PACKAGE = "sabiana_energy_smart_standalone"
+
+
+@pytest.fixture
+def load_component_module():
+    """Load a standalone integration module without importing Home Assistant."""
+
+    def _load(name: str):
+        if STANDALONE_PACKAGE not in sys.modules:
+            package = types.ModuleType(STANDALONE_PACKAGE)
+            package.__path__ = [COMPONENT_DIR]
+            sys.modules[STANDALONE_PACKAGE] = package
+        return importlib.import_module(f"{STANDALONE_PACKAGE}.{name}")
+
+    return _load
+
 
 @pytest.fixture
 def mock_entry_data():
@@ -0,0 +1,95 @@
+"""Tests for the poll turns shared by devices on one gateway."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def scheduler_module(load_component_module):
+    """Return the bus_scheduler module."""
+    return load_component_module("bus_scheduler")
+
+
+def test_budget_is_an_equal_share_of_the_cycle(scheduler_module):
+    """Test that the per-turn budget shrinks as devices join."""
+    scheduler = scheduler_module.BusScheduler(cycle=3.0)
+    scheduler.register(1)
+    assert scheduler.budget == 3.0
+
+    for slave in range(2, 31):
+        scheduler.register(slave)
+    assert scheduler.budget == scheduler_module.MIN_POLL_BUDGET
+
+    for slave in range(2, 31):
+        scheduler.unregister(slave)
+    scheduler.register(2)
+    assert scheduler.budget == 1.5
+
+
+@pytest.mark.asyncio
+async def test_poll_turns_do_not_overlap(scheduler_module):
+    """Test that devices poll one after another in request order."""
+    scheduler = scheduler_module.BusScheduler(cycle=3.0)
+    for slave in (1, 2, 3):
+        scheduler.register(slave)
+    events = []
+
+    async def poll(slave):
+        async with scheduler.poll_turn(slave) as turn:
+            events.append(("start", slave))
+            assert not turn.expired
+            await asyncio.sleep(0.01)
+            events.append(("end", slave))
+
+    await asyncio.gather(poll(1), poll(2), poll(3))
+
+    assert events == [
+        ("start", 1),
+        ("end", 1),
+        ("start", 2),
+        ("end", 2),
+        ("start", 3),
+        ("end", 3),
+    ]
+    stats = scheduler.stats()
+    assert stats["devices"] == 3
+    assert 0 < stats["utilization"] <= 1
+    assert stats["per_device"][3]["turns"] == 1
+    assert stats["per_device"][3]["max_wait_ms"] > 0
+
+
+def test_deferred_blocks_and_write_latency_metrics(scheduler_module):
+    """Test the per-device metrics recorded by the coordinator."""
+    scheduler = scheduler_module.BusScheduler(cycle=3.0)
+    scheduler.register(1)
+    scheduler.record_deferred(1, 2)
+    scheduler.record_write(1, 0.3)
+    scheduler.record_write(1, 0.1)
+    scheduler.record_write(9, 5.0)
+
+    device = scheduler.stats()["per_device"][1]
+    assert device["deferred_blocks"] == 2
+    assert device["last_write_latency_ms"] == 100.0
+    assert device["max_write_latency_ms"] == 300.0
+    assert 9 not in scheduler.stats()["per_device"]
+
+
+def test_cycle_follows_the_poll_intervals_in_use(scheduler_module):
+    """Test that budgets track the adaptive intervals of the devices."""
+    scheduler = scheduler_module.BusScheduler(cycle=3.0)
+    scheduler.register(1)
+    scheduler.register(2)
+    assert scheduler.budget == 1.5
+
+    scheduler.set_interval(1, 10.0)
+    assert scheduler.cycle == 10.0
+    assert scheduler.budget == 5.0
+
+    # The device polling most often sets the pace
+    scheduler.set_interval(2, 4.0)
+    assert scheduler.budget == 2.0
+    assert scheduler.stats()["per_device"][2]["interval_s"] == 4.0
+
+    scheduler.unregister(2)
+    assert scheduler.budget == 10.0
@@ -0,0 +1,46 @@
+"""Tests for capability detection from the configuration bits."""
+
+CAPABILITY_BITS = {
+    "co2_sensor": {"address": 0x011F, "bit": 12, "registers": (0x0113, 0x0222)},
+    "rh_sensor": {"address": 0x011F, "bit": 14, "registers": (0x0229,)},
+    "preheating": {"address": 0x0104, "bit": 1, "registers": (0x010F,)},
+}
+
+
+def test_capabilities_are_read_from_their_bits(load_component_module):
+    """Test that set bits mean installed and unread registers mean unknown."""
+    module = load_component_module("capabilities")
+    capabilities = module.build_capabilities(CAPABILITY_BITS)
+
+    assert module.capability_addresses(capabilities) == {0x011F, 0x0104}
+    assert module.detect_capabilities(capabilities, {0x011F: 1 << 14}) == {
+        "co2_sensor": False,
+        "rh_sensor": True,
+    }
+    assert module.detect_capabilities(capabilities, {0x011F: None}) == {}
+
+
+def test_only_missing_features_are_pruned(load_component_module):
+    """Test that registers are dropped only for features reported absent."""
+    module = load_component_module("capabilities")
+    catalog = load_component_module("catalog")
+    capabilities = module.build_capabilities(CAPABILITY_BITS)
+    absent = module.absent_registers(
+        capabilities, {"co2_sensor": False, "rh_sensor": True}
+    )
+    records = [
+        catalog.RegisterRecord("co2_level", 0x0113, catalog.KIND_SENSOR),
+        catalog.RegisterRecord("co2_min_set", 0x0222, catalog.KIND_NUMBER),
+        catalog.RegisterRecord("rh_low", 0x0229, catalog.KIND_NUMBER),
+        catalog.RegisterRecord("preheater", 0x010F, catalog.KIND_SENSOR),
+        catalog.RegisterRecord("opt_co2", 0x011F, catalog.KIND_BINARY_SENSOR, bit=12),
+    ]
+
+    # Preheating was never read, so its register is kept
+    assert absent == {0x0113, 0x0222}
+    assert [record.key for record in module.prune_records(records, absent)] == [
+        "rh_low",
+        "preheater",
+        "opt_co2",
+    ]
+    assert module.absent_registers(capabilities, {}) == frozenset()
@@ -0,0 +1,136 @@
+"""Tests for the typed register catalog."""
+
+import dataclasses
+
+import pytest
+
+SENSORS = {
+    0x0100: {"key": "temp", "name": "Temp", "type": "int16", "scale": 0.1},
+    0x0101: {"key": "rho", "name": "Rho", "type": "float32", "precision": 1},
+}
+REGISTERS = {
+    0x0200: {
+        "key": "setpoint",
+        "name": "Setpoint",
+        "min": -10,
+        "max": 40,
+        "scale": 0.1,
+        "precision": 1,
+        "readable": True,
+        "writable": True,
+    },
+    0x0201: {"key": "readonly", "name": "Read only"},
+    0x030B: {"key": "co2_input", "name": "CO2 input", "writable": True},
+}
+SELECTS = {
+    0x0212: {
+        "key": "speed",
+        "name": "Speed",
+        "writable": True,
+        "options": {0: "Low", 1: "High"},
+    },
+    0x0213: {"key": "unused", "name": "Unused", "writable": True},
+}
+DIAGNOSTICS = {
+    0x0104: {
+        "bits": {
+            0: {"key": "inverted", "name": "Inverted"},
+            1: {"key": "preheat", "name": "Preheat"},
+        }
+    },
+}
+FIRMWARE = {
+    0x0000: {"key": "serial", "name": "Serial", "type": "char", "dataLength": 4},
+    0x0002: {"key": "model", "name": "Model", "type": "uns16", "dataLength": 2},
+}
+
+
+def _with_poll_class(definitions):
+    return {addr: {**reg, "poll_class": "live"} for addr, reg in definitions.items()}
+
+
+def _catalog(catalog_module):
+    firmware = {
+        addr: {**reg, "readable": True}
+        for addr, reg in _with_poll_class(FIRMWARE).items()
+    }
+    return catalog_module.RegisterCatalog(
+        catalog_module.build_records(
+            sensors=_with_poll_class(SENSORS),
+            registers=_with_poll_class(REGISTERS),
+            switches=_with_poll_class(
+                {0x0300: {"key": "on", "name": "On", "entity_type": "switch"}}
+            ),
+            buttons={
+                0x0310: {"key": "reset", "name": "Reset", "entity_type": "button"}
+            },
+            selects=_with_poll_class(SELECTS),
+            diagnostics=_with_poll_class(DIAGNOSTICS),
+            firmware=firmware,
+        )
+    )
+
+
+def test_records_are_indexed_by_kind_key_and_address(load_component_module):
+    """Test that each entity kind gets only its own records."""
+    module = load_component_module("catalog")
+    catalog = _catalog(module)
+
+    def keys(kind):
+        return [record.key for record in catalog.kind(kind)]
+
+    assert keys(module.KIND_SENSOR) == ["temp", "rho"]
+    assert keys(module.KIND_NUMBER) == ["setpoint", "co2_input"]
+    assert keys(module.KIND_SELECT) == ["speed"]
+    assert keys(module.KIND_BINARY_SENSOR) == ["inverted", "preheat"]
+    assert keys(module.KIND_SWITCH) == ["on"]
+    assert keys(module.KIND_BUTTON) == ["reset"]
+    assert catalog.kind("climate") == ()
+
+    assert catalog.by_key["setpoint"].readable
+    assert not catalog.by_key["co2_input"].readable
+    assert not catalog.by_key["reset"].readable
+    assert catalog.by_key["setpoint"].minimum == -10
+    assert catalog.by_key["setpoint"].signed
+    assert [r.key for r in catalog.by_address[0x0102]] == ["rho"]
+    assert catalog.by_key["serial"].length == 2
+    assert catalog.identity_addresses == {0x0000, 0x0001, 0x0002}
+
+
+def test_records_are_frozen(load_component_module):
+    """Test that records and the catalog indexes cannot be modified."""
+    catalog = _catalog(load_component_module("catalog"))
+    record = catalog.by_key["speed"]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.address = 0
+    with pytest.raises(TypeError):
+        record.options[2] = "Max"
+    with pytest.raises(TypeError):
+        catalog.codecs["temp"] = None
+    assert not hasattr(record, "__dict__")
+
+
+def test_codecs_are_compiled_from_records(load_component_module):
+    """Test that decoders follow the record types."""
+    catalog = _catalog(load_component_module("catalog"))
+
+    assert "reset" not in catalog.codecs
+    assert catalog.codecs["setpoint"].decode({0x0200: 0xFFF6}) == -1.0
+    assert catalog.codecs["preheat"].decode({0x0104: 0b10}) is True
+    assert catalog.codecs["serial"].decode({0x0000: 0x5652, 0x0001: 0x0055}) == "RVU"
+    assert [c.key for c in catalog.codecs_by_address[0x0104]] == [
+        "inverted",
+        "preheat",
+    ]
+    layout = catalog.block_layouts[0]
+    assert (layout.start, layout.count) == (0x0100, 3)
+
+
+def test_duplicate_keys_are_rejected(load_component_module):
+    """Test that two records may not share an entity key."""
+    module = load_component_module("catalog")
+    record = module.RegisterRecord("temp", 0x0100, module.KIND_SENSOR)
+
+    with pytest.raises(ValueError):
+        module.RegisterCatalog([record, dataclasses.replace(record, address=1)])
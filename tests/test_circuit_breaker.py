@@ -0,0 +1,45 @@
+"""Tests for the connection circuit breaker."""
+
+import pytest
+
+
+@pytest.fixture
+def breaker_module(load_component_module):
+    """Return the circuit_breaker module."""
+    return load_component_module("circuit_breaker")
+
+
+def test_failure_opens_and_probe_half_opens(breaker_module, monkeypatch):
+    """Test the closed → open → half-open → closed cycle."""
+    now = [100.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    breaker = breaker_module.CircuitBreaker(initial=2.0, maximum=60.0)
+    assert breaker.allow()
+
+    delay = breaker.record_failure()
+    assert breaker.state == breaker_module.STATE_OPEN
+    assert 1.0 <= delay <= 2.0
+    assert not breaker.allow()
+
+    now[0] += delay
+    assert breaker.allow()
+    assert breaker.state == breaker_module.STATE_HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == breaker_module.STATE_CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_backoff_doubles_up_to_the_maximum(breaker_module):
+    """Test exponential backoff with jitter bounded by the maximum."""
+    breaker = breaker_module.CircuitBreaker(initial=2.0, maximum=16.0)
+
+    delays = [breaker.record_failure() for _ in range(6)]
+
+    for failures, delay in enumerate(delays, start=1):
+        ceiling = min(16.0, 2.0 * 2 ** (failures - 1))
+        assert ceiling / 2 <= delay <= ceiling
+    assert breaker.as_dict()["failures"] == 6
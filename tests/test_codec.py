@@ -0,0 +1,39 @@
+"""Tests for the precompiled register codecs."""
+
+import struct
+
+
+def test_float32_decodes_register_pair(load_component_module):
+    """Test that float32 values span two big-endian registers."""
+    codec = load_component_module("codec")
+    hi, lo = struct.unpack(">HH", struct.pack(">f", 1.25))
+    rho = codec.compile_codec("rho1", 0x0115, "float32", precision=2)
+
+    assert list(rho.addresses) == [0x0115, 0x0116]
+    assert rho.decode({0x0115: hi, 0x0116: lo}) == 1.25
+    assert rho.decode({0x0115: hi}) is None
+
+
+def test_uint32_and_char_decode(load_component_module):
+    """Test multi-register integer and text decoding."""
+    codec = load_component_module("codec")
+    hours = codec.compile_codec("hours", 0x0010, "uns32")
+    name = codec.compile_codec("name", 0x0000, "char", data_length=4)
+
+    assert hours.decode({0x0010: 0x0001, 0x0011: 0x0002}) == 0x00010002
+    assert name.decode({0x0000: 0x5652, 0x0001: 0x0055}) == "RVU"
+    assert name.decode({0x0000: 0x5652}) is None
+
+
+def test_bit_codecs_and_address_index(load_component_module):
+    """Test bitfield decoding and the address index."""
+    codec = load_component_module("codec")
+    table = {
+        "inverted": codec.compile_codec("inverted", 0x0104, bit=0),
+        "preheat": codec.compile_codec("preheat", 0x0104, bit=1),
+    }
+
+    assert table["inverted"].decode({0x0104: 0b10}) is False
+    assert table["preheat"].decode({0x0104: 0b10}) is True
+    index = codec.index_by_address(table.values())
+    assert {c.key for c in index[0x0104]} == {"inverted", "preheat"}
@@ -43,6 +43,28 @@ def test_config_flow_class_defined():
     assert "VERSION = 1" in content
 
 
+def test_options_flow_defined():
+    """Test that the polling options can be changed after setup."""
+    config_flow_path = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "custom_components",
+        "sabiana_energy_smart",
+        "config_flow.py",
+    )
+
+    with open(config_flow_path, encoding="utf-8") as f:
+        content = f.read()
+
+    assert "def async_get_options_flow" in content
+    assert "class SabianaOptionsFlow(config_entries.OptionsFlowWithReload)" in content
+    assert "CONF_PIPELINE_WINDOW" in content
+    assert "CONF_MAX_READ_GAP" in content
+    assert "CONF_MIN_SCAN_INTERVAL" in content
+    assert "CONF_MAX_SCAN_INTERVAL" in content
+    assert "CONF_STALE_TTL" in content
+
+
 def test_config_schema_validation():
     """Test that the config schema validates expected input."""
     # Test basic voluptuous validation patterns similar to config flow
@@ -0,0 +1,39 @@
+"""Tests for sharing one Modbus connection between entries on a gateway."""
+
+from custom_components.sabiana_energy_smart import connection_manager
+
+
+class FakeModbusClient:
+    """Client recording whether it was closed."""
+
+    def __init__(self, host: str, port: int, pipeline_window: int = 1) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def test_entries_on_one_gateway_share_a_client(monkeypatch):
+    """Test that the client is shared by (host, port) and closed after its last user."""
+    monkeypatch.setattr(connection_manager, "SabianaModbusClient", FakeModbusClient)
+    manager = connection_manager.SabianaConnectionManager()
+
+    first = manager.acquire("192.168.1.100", 502, 1)
+    second = manager.acquire("192.168.1.100", 502, 2)
+    other = manager.acquire("192.168.1.101", 502, 1)
+    assert first is second
+    assert other is not first
+    assert manager.users("192.168.1.100", 502) == 2
+    assert manager.scheduler("192.168.1.100", 502) is not manager.scheduler(
+        "192.168.1.101", 502
+    )
+
+    await manager.release("192.168.1.100", 502, 1)
+    assert not first.closed
+    await manager.release("192.168.1.100", 502, 2)
+    assert first.closed
+    assert not other.closed
+    assert manager.users("192.168.1.100", 502) == 0
+
+    # The next entry on the gateway opens a fresh connection
+    assert manager.acquire("192.168.1.100", 502, 1) is not first
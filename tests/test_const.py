@@ -126,3 +126,99 @@ def test_register_definitions_structure():
         assert def_name in found_definitions, (
             f"Definition {def_name} not found as dictionary or list"
         )
+
+
+def test_register_definitions_have_poll_class():
+    """Test that every register definition declares how often it is polled."""
+    const_path = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "custom_components",
+        "sabiana_energy_smart",
+        "const.py",
+    )
+
+    with open(const_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), const_path)
+
+    poll_classes = {"POLL_LIVE", "POLL_SLOW", "POLL_STATIC"}
+    checked = 0
+    write_only = 0
+    for node in tree.body:
+        if not (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Dict)
+            and (
+                node.targets[0].id.endswith("_DEFINITIONS")
+                or node.targets[0].id in ("SENSOR_DEFINITIONS_NEW", "FIRMWARE_INFO")
+            )
+        ):
+            continue
+        for address, entry in zip(node.value.keys, node.value.values, strict=True):
+            fields = {
+                key.value: value
+                for key, value in zip(entry.keys, entry.values, strict=True)
+            }
+            # Buttons and write-only inputs are never polled
+            if node.targets[0].id == "BUTTON_DEFINITIONS" or (
+                node.targets[0].id == "REGISTER_DEFINITIONS"
+                and "readable" not in fields
+            ):
+                assert "poll_class" not in fields, (
+                    f"{node.targets[0].id}[{ast.unparse(address)}] is never polled"
+                )
+                write_only += 1
+                continue
+            assert "poll_class" in fields, (
+                f"{node.targets[0].id}[{ast.unparse(address)}] has no poll_class"
+            )
+            assert ast.unparse(fields["poll_class"]) in poll_classes
+            checked += 1
+
+    assert checked > 0
+    assert write_only > 0
+
+
+def test_capability_bits_match_the_register_map():
+    """Test that capabilities point at defined diagnostic bits and registers."""
+    const_path = os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "custom_components",
+        "sabiana_energy_smart",
+        "const.py",
+    )
+
+    with open(const_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), const_path)
+
+    tables = {
+        node.targets[0].id: node.value
+        for node in tree.body
+        if isinstance(node, ast.Assign)
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value, ast.Dict)
+    }
+    diagnostic_bits = {}
+    for address, entry in zip(
+        tables["DIAGNOSTIC_DEFINITIONS"].keys,
+        tables["DIAGNOSTIC_DEFINITIONS"].values,
+        strict=True,
+    ):
+        fields = dict(zip(entry.keys, entry.values, strict=True))
+        bits = next(v for k, v in fields.items() if k.value == "bits")
+        diagnostic_bits[ast.literal_eval(address)] = {
+            ast.literal_eval(bit) for bit in bits.keys
+        }
+    defined = {
+        ast.literal_eval(address)
+        for name in ("SENSOR_DEFINITIONS_NEW", "REGISTER_DEFINITIONS")
+        for address in tables[name].keys
+    }
+
+    capabilities = ast.literal_eval(tables["CAPABILITY_BITS"])
+    assert capabilities
+    for key, capability in capabilities.items():
+        assert capability["bit"] in diagnostic_bits[capability["address"]], key
+        assert set(capability["registers"]) <= defined, key
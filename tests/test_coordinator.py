@@ -0,0 +1,456 @@
+"""Tests for the polling coordinator against a fake Modbus client."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.sabiana_energy_smart import connection_manager
+from custom_components.sabiana_energy_smart.const import (
+    DOMAIN,
+    WRITE_COALESCE_DELAY,
+    WRITE_VERIFY_DELAY,
+)
+from custom_components.sabiana_energy_smart.modbus_client import (
+    SabianaExceptionResponse,
+    SabianaTransportError,
+)
+from custom_components.sabiana_energy_smart.modbus_coordinator import (
+    SabianaModbusCoordinator,
+)
+from custom_components.sabiana_energy_smart.request_queue import (
+    PRIORITY_POLL,
+    PRIORITY_READ,
+)
+
+ENTRY_DATA = {"host": "192.168.1.100", "port": 502, "slave": 1}
+
+TEMPERATURE = 0x0100
+SPEED = 0x0212
+SPEED_BOOST = 0x0213
+PARTY = 0x0301
+MANUAL = 0x0302
+# Past an undefined register the default read gap bridges
+BEYOND_HOLE = 0x0215
+HOLE = 0x0214
+SUBSCRIBED = frozenset({TEMPERATURE, SPEED, SPEED_BOOST})
+CONTROLLER_MODEL = 0x000A
+FIRMWARE_RELEASE = 0x000B
+# Configuration bits reporting every optional feature as installed
+OPTIONS = {0x011F: 0b0111_1000_0000_0000, 0x0104: 0b10}
+CO2_BIT = 1 << 12
+CO2_LEVEL = 0x0113
+IDENTITY_KEY = f"{DOMAIN}.identity.test_entry"
+
+
+class FakeModbusClient:
+    """Serve reads from a register map and record the writes."""
+
+    pipeline_window = 1
+
+    def __init__(self, registers: dict[int, int]) -> None:
+        self.registers = dict(registers)
+        self.offline = False
+        self.reject_writes = False
+        # Reads wait on this event while it is set up
+        self.gate: asyncio.Event | None = None
+        # address → exception code answered for any block covering it
+        self.exception_codes: dict[int, int] = {}
+        self.reads: list[tuple[int, int, int]] = []
+        self.writes: list[tuple[int, list[int]]] = []
+
+    def queue_stats(self) -> dict:
+        return {}
+
+    def connection_state(self) -> dict:
+        return {}
+
+    async def read_block(
+        self, address: int, count: int = 1, slave: int = 1, priority=PRIORITY_POLL
+    ) -> list[int]:
+        self.reads.append((address, count, priority))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.offline:
+            raise SabianaTransportError(address, "offline")
+        for addr in range(address, address + count):
+            if addr in self.exception_codes:
+                raise SabianaExceptionResponse(
+                    address, count, self.exception_codes[addr]
+                )
+        return [self.registers.get(addr, 0) for addr in range(address, address + count)]
+
+    async def write_registers(
+        self, address: int, values: list[int], slave: int = 1
+    ) -> bool:
+        self.writes.append((address, list(values)))
+        if self.offline or self.reject_writes:
+            return False
+        self.registers.update(
+            (address + offset, value) for offset, value in enumerate(values)
+        )
+        return True
+
+    async def write_register(self, address: int, value: int, slave: int = 1) -> bool:
+        return await self.write_registers(address, [value], slave)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Fake client every coordinator of the test connects through."""
+    client = FakeModbusClient({TEMPERATURE: 215, SPEED: 1, SPEED_BOOST: 4})
+    monkeypatch.setattr(
+        connection_manager, "SabianaModbusClient", lambda *args, **kwargs: client
+    )
+    return client
+
+
+@pytest.fixture
+async def make_coordinator(hass: HomeAssistant, client):
+    """Create coordinators subscribed to a few registers, closed on teardown."""
+    created = []
+
+    def _make(addresses=SUBSCRIBED, **config) -> SabianaModbusCoordinator:
+        coordinator = SabianaModbusCoordinator(
+            hass, {**ENTRY_DATA, **config}, "test_entry"
+        )
+        remove = coordinator.async_add_listener(lambda: None, frozenset(addresses))
+        created.append((coordinator, remove))
+        return coordinator
+
+    yield _make
+    for coordinator, remove in created:
+        remove()
+        await coordinator.async_shutdown()
+        await coordinator.async_close()
+
+
+@pytest.fixture
+async def coordinator(make_coordinator):
+    """Coordinator holding the values of a first successful poll."""
+    coordinator = make_coordinator()
+    await coordinator.async_refresh()
+    return coordinator
+
+
+def _count_updates(coordinator, context=None) -> list[None]:
+    """Add a listener and return the list it appends to on every call."""
+    calls: list[None] = []
+    coordinator.async_add_listener(lambda: calls.append(None), context)
+    return calls
+
+
+async def _advance(hass: HomeAssistant, seconds: float) -> None:
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+async def test_write_is_shown_once_the_unit_accepts_it(hass, coordinator, client):
+    """Test that a buffered write reaches coordinator.data only on success."""
+    coordinator.last_update_success = False
+    write = hass.async_create_task(coordinator.async_write_register(SPEED, 3))
+    await asyncio.sleep(0)
+
+    # Still buffered: nothing sent, nothing shown
+    assert not write.done()
+    assert client.writes == []
+    assert coordinator.data[SPEED] == 1
+
+    await _advance(hass, WRITE_COALESCE_DELAY)
+    assert write.result() is True
+    assert client.writes == [(SPEED, [3])]
+    assert coordinator.data[SPEED] == 3
+    # Writing says nothing about whether the last poll succeeded
+    assert coordinator.last_update_success is False
+
+
+async def test_rejected_write_is_never_shown(hass, coordinator, client):
+    """Test that a write the unit refused leaves the polled value in place."""
+    client.reject_writes = True
+    write = hass.async_create_task(coordinator.async_write_register(SPEED, 3))
+    await _advance(hass, WRITE_COALESCE_DELAY)
+
+    assert write.result() is False
+    assert coordinator.data[SPEED] == 1
+    assert coordinator.last_update_success is True
+
+
+async def test_writes_are_coalesced_and_commands_keep_their_order(
+    hass, coordinator, client
+):
+    """Test that settings go out as one block, then commands as requested."""
+    writes = [
+        hass.async_create_task(coordinator.async_write_register(address, value))
+        for address, value in (
+            (SPEED_BOOST, 5),
+            (MANUAL, 1),
+            (SPEED, 2),
+            (PARTY, 1),
+            (SPEED, 3),
+        )
+    ]
+    await _advance(hass, WRITE_COALESCE_DELAY)
+
+    assert [write.result() for write in writes] == [True] * 5
+    assert client.writes == [(SPEED, [3, 5]), (MANUAL, [1]), (PARTY, [1])]
+    assert (coordinator.data[SPEED], coordinator.data[SPEED_BOOST]) == (3, 5)
+
+
+async def test_verify_reads_back_the_value_the_unit_kept(hass, coordinator, client):
+    """Test that the re-read after a write shows what the unit stored."""
+    write = hass.async_create_task(coordinator.async_write_register(SPEED, 9))
+    await _advance(hass, WRITE_COALESCE_DELAY)
+    assert write.result() is True
+    # The unit clamps the setpoint to its own limit
+    client.registers[SPEED] = 4
+    client.reads.clear()
+
+    await _advance(hass, WRITE_VERIFY_DELAY)
+    assert client.reads == [(SPEED, 1, PRIORITY_READ)]
+    assert coordinator.data[SPEED] == 4
+
+
+async def test_failed_verify_keeps_the_written_value(hass, coordinator, client):
+    """Test that an unreachable unit during verification changes nothing."""
+    write = hass.async_create_task(coordinator.async_write_register(SPEED, 3))
+    await _advance(hass, WRITE_COALESCE_DELAY)
+    assert write.result() is True
+    client.offline = True
+
+    await _advance(hass, WRITE_VERIFY_DELAY)
+    assert coordinator.data[SPEED] == 3
+    assert coordinator.last_update_success is True
+
+
+async def test_last_values_are_served_until_the_stale_ttl(make_coordinator, client):
+    """Test that failed polls serve cached values, then go unavailable."""
+    coordinator = make_coordinator(stale_ttl=0.5)
+    await coordinator.async_refresh()
+    client.offline = True
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is True
+    assert coordinator.stale_since is not None
+    assert coordinator.data[SPEED] == 1
+    assert coordinator.cache_attributes({SPEED}) == {"data_age_s": 0}
+
+    await asyncio.sleep(0.6)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is False
+
+    client.offline = False
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is True
+    assert coordinator.stale_since is None
+    assert coordinator.cache_attributes({SPEED}) == {}
+
+
+async def test_identity_is_read_once_and_then_loaded_from_disk(
+    hass, hass_storage, make_coordinator, client
+):
+    """Test that a restarted coordinator gets the identity without the bus."""
+    client.registers.update({CONTROLLER_MODEL: 3, FIRMWARE_RELEASE: 0x0104, **OPTIONS})
+    coordinator = make_coordinator()
+    await coordinator.async_setup()
+    assert coordinator.identity.values == {}
+
+    await coordinator._async_refresh_identity()
+    values = coordinator.identity.values
+    assert values["controller_model"] == 3
+    assert all(values["capabilities"].values())
+    assert hass_storage[f"{DOMAIN}.identity.test_entry"]["data"] == values
+
+    client.reads.clear()
+    restarted = make_coordinator()
+    await restarted.async_setup()
+    assert restarted.identity.values == values
+    assert restarted.profile.name == coordinator.profile.name
+    assert client.reads == []
+
+
+async def test_setup_does_not_wait_for_the_unit(
+    hass, enable_custom_integrations, client
+):
+    """Test that the entry loads while the first poll is still on the bus."""
+    client.registers.update(OPTIONS)
+    client.gate = asyncio.Event()
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, minor_version=2)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.data is None
+
+    client.gate.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert coordinator.last_update_success is True
+    assert coordinator.data is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_rejected_span_learns_only_the_bridged_hole(make_coordinator, client):
+    """Test that bisecting a rejected block blacklists just the hole."""
+    client.registers[BEYOND_HOLE] = 7
+    client.exception_codes = {HOLE: 2}
+    coordinator = make_coordinator(addresses={SPEED, SPEED_BOOST, BEYOND_HOLE})
+
+    await coordinator.async_refresh()
+    assert coordinator._unreadable == {HOLE}
+    assert (coordinator.data[SPEED], coordinator.data[BEYOND_HOLE]) == (1, 7)
+
+    # The next poll plans around the hole instead of bisecting again
+    client.reads.clear()
+    await coordinator.async_refresh()
+    assert sorted(client.reads) == [
+        (SPEED, 2, PRIORITY_POLL),
+        (BEYOND_HOLE, 1, PRIORITY_POLL),
+    ]
+
+
+async def test_busy_unit_is_not_taken_for_missing_registers(make_coordinator, client):
+    """Test that a transient exception code leaves the block for next poll."""
+    client.exception_codes = {SPEED: 6}
+    coordinator = make_coordinator()
+
+    await coordinator.async_refresh()
+    assert coordinator._unreadable == set()
+    # One read per planned block, none of them bisected
+    assert sorted(client.reads) == [
+        (TEMPERATURE, 1, PRIORITY_POLL),
+        (SPEED, 2, PRIORITY_POLL),
+    ]
+    assert coordinator.data[SPEED] is None
+    assert coordinator.data[TEMPERATURE] == 215
+
+
+async def test_only_listeners_of_changed_addresses_are_called(make_coordinator, client):
+    """Test that a refresh notifies the subscribers of what changed."""
+    coordinator = make_coordinator(stale_ttl=0)
+    temperature = _count_updates(coordinator, frozenset({TEMPERATURE}))
+    speed = _count_updates(coordinator, frozenset({SPEED}))
+    everything = _count_updates(coordinator)
+    await coordinator.async_refresh()
+    assert (len(temperature), len(speed), len(everything)) == (1, 1, 1)
+
+    # Nothing changed: only the listener without a context hears about it
+    await coordinator.async_refresh()
+    assert (len(temperature), len(speed), len(everything)) == (1, 1, 2)
+
+    client.registers[SPEED] = 2
+    await coordinator.async_refresh()
+    assert (len(temperature), len(speed), len(everything)) == (1, 2, 3)
+    assert coordinator.data[SPEED] == 2
+
+    # Going unavailable, and back, reaches every listener
+    client.offline = True
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success is False
+    assert (len(temperature), len(speed), len(everything)) == (2, 3, 4)
+    client.offline = False
+    await coordinator.async_refresh()
+    assert (len(temperature), len(speed), len(everything)) == (3, 4, 5)
+
+
+async def test_listeners_of_cached_addresses_are_refreshed(make_coordinator, client):
+    """Test that values served from the cache update their age attribute."""
+    coordinator = make_coordinator()
+    temperature = _count_updates(coordinator, frozenset({TEMPERATURE}))
+    await coordinator.async_refresh()
+    client.offline = True
+
+    for calls in (2, 3):
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success is True
+        assert len(temperature) == calls
+
+
+async def test_removed_listener_drops_its_address_from_the_plan(
+    make_coordinator, client
+):
+    """Test that an address is polled only while an entity reads it."""
+    coordinator = make_coordinator(addresses={TEMPERATURE})
+    remove_first = coordinator.async_add_listener(lambda: None, frozenset({SPEED}))
+    remove_second = coordinator.async_add_listener(lambda: None, frozenset({SPEED}))
+    assert set(coordinator._polled_addresses()) == {TEMPERATURE, SPEED}
+
+    # Still read by the other entity
+    remove_first()
+    assert set(coordinator._polled_addresses()) == {TEMPERATURE, SPEED}
+
+    remove_second()
+    assert set(coordinator._polled_addresses()) == {TEMPERATURE}
+    await coordinator.async_refresh()
+    assert client.reads == [(TEMPERATURE, 1, PRIORITY_POLL)]
+
+
+async def test_transport_error_aborts_the_rest_of_the_poll(make_coordinator, client):
+    """Test that the first lost block stops the cycle and fails the update."""
+    coordinator = make_coordinator(stale_ttl=0)
+    client.offline = True
+
+    await coordinator.async_refresh()
+    # Two blocks were planned; the second is never sent
+    assert client.reads == [(TEMPERATURE, 1, PRIORITY_POLL)]
+    # Everything due is read first thing once the unit answers again
+    assert coordinator._force_read == SUBSCRIBED
+    assert coordinator.last_update_success is False
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+
+
+def _save_identity(hass_storage, values) -> None:
+    """Store an identity as if read by an earlier run."""
+    hass_storage[IDENTITY_KEY] = {"version": 1, "key": IDENTITY_KEY, "data": values}
+
+
+async def test_saved_identity_prunes_missing_hardware(
+    hass_storage, make_coordinator, client
+):
+    """Test that registers of features the unit lacks get no entities."""
+    _save_identity(
+        hass_storage, {"capabilities": {"co2_sensor": False, "rh_sensor": True}}
+    )
+    coordinator = make_coordinator()
+
+    await coordinator.async_setup()
+    assert CO2_LEVEL in coordinator.absent
+    addresses = {
+        addr for record in coordinator.catalog.records for addr in record.addresses
+    }
+    assert addresses.isdisjoint(coordinator.absent)
+    assert 0x0229 in addresses
+    assert client.reads == []
+
+
+async def test_changed_capability_bits_reload_the_entry(
+    hass, hass_storage, make_coordinator, client
+):
+    """Test that hardware removed since the last run rebuilds the entities."""
+    _save_identity(
+        hass_storage,
+        {"capabilities": dict.fromkeys(("co2_sensor", "rh_sensor"), True)},
+    )
+    client.registers.update(OPTIONS)
+    client.registers[0x011F] &= ~CO2_BIT
+    coordinator = make_coordinator()
+    await coordinator.async_setup()
+
+    with patch.object(hass.config_entries, "async_schedule_reload") as reload:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    reload.assert_called_once_with("test_entry")
+    assert coordinator.identity.values["capabilities"]["co2_sensor"] is False
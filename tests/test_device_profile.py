@@ -0,0 +1,108 @@
+"""Tests for device profile loading and selection."""
+
+import json
+import logging
+
+import pytest
+
+
+def _write(directory, filename, **profile):
+    (directory / filename).write_text(
+        json.dumps({"profile_version": 1, **profile}), encoding="utf-8"
+    )
+
+
+def test_most_specific_profile_wins(load_component_module):
+    """Test that model and firmware bounds narrow the match."""
+    module = load_component_module("device_profile")
+    generic = module.DeviceProfile("Generic")
+    model = module.DeviceProfile("Model 3", models=frozenset({3}))
+    old = module.DeviceProfile(
+        "Model 3 old", models=frozenset({3}), max_firmware=0x0103
+    )
+    profiles = [generic, model, old]
+
+    assert module.select_profile(profiles, 3, 0x0102) is old
+    assert module.select_profile(profiles, 3, 0x0104) is model
+    assert module.select_profile(profiles, 3, None) is model
+    assert module.select_profile(profiles, 4, 0x0102) is generic
+    assert module.select_profile([model], 4, 0x0102) is module.DEFAULT_PROFILE
+
+
+def test_profile_excludes_missing_registers(load_component_module):
+    """Test that excluded keys and addresses drop their records."""
+    module = load_component_module("device_profile")
+    catalog = load_component_module("catalog")
+    records = [
+        catalog.RegisterRecord("co2", 0x0113, catalog.KIND_SENSOR),
+        catalog.RegisterRecord("rho1", 0x0115, catalog.KIND_SENSOR, type="float32"),
+        catalog.RegisterRecord("temp", 0x0100, catalog.KIND_SENSOR),
+    ]
+    profile = module.parse_profile(
+        {
+            "profile_version": 1,
+            "name": "No sensors",
+            "exclude": {"keys": ["co2"], "addresses": ["0x0116"]},
+        }
+    )
+
+    assert [record.key for record in profile.select(records)] == ["temp"]
+
+
+def test_invalid_profiles_are_rejected(load_component_module):
+    """Test that malformed profile content raises ProfileError."""
+    module = load_component_module("device_profile")
+
+    with pytest.raises(module.ProfileError):
+        module.parse_profile({"profile_version": 2, "name": "Future"})
+    with pytest.raises(module.ProfileError):
+        module.parse_profile({"profile_version": 1})
+    with pytest.raises(module.ProfileError):
+        module.parse_profile({"profile_version": 1, "name": "x", "models": ["a"]})
+
+
+def test_profiles_are_loaded_and_applied(load_component_module, tmp_path, caplog):
+    """Test that a variant profile on disk narrows the map of its units only."""
+    module = load_component_module("device_profile")
+    catalog = load_component_module("catalog")
+    _write(tmp_path, "a_default.json", name="Smart Pro")
+    _write(
+        tmp_path,
+        "b_basic.json",
+        name="Smart Basic",
+        models=[7],
+        firmware={"max": "0x0200"},
+        exclude={"keys": ["co2_level"], "addresses": ["0x0111", 274]},
+    )
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    records = [
+        catalog.RegisterRecord("temp", 0x0100, catalog.KIND_SENSOR),
+        catalog.RegisterRecord("press1", 0x0111, catalog.KIND_SENSOR),
+        catalog.RegisterRecord("press2", 0x0112, catalog.KIND_SENSOR),
+        catalog.RegisterRecord("co2_level", 0x0113, catalog.KIND_SENSOR),
+    ]
+
+    with caplog.at_level(logging.WARNING):
+        profiles = module.load_profiles(tmp_path)
+    assert [profile.name for profile in profiles] == ["Smart Pro", "Smart Basic"]
+    assert "broken.json" in caplog.text
+
+    basic = module.select_profile(profiles, 7, 0x0104)
+    assert basic.name == "Smart Basic"
+    assert basic.source == "b_basic.json"
+    assert [record.key for record in basic.select(records)] == ["temp"]
+    # Newer firmware and other models keep the full map
+    for model, firmware in ((7, 0x0201), (3, 0x0104)):
+        profile = module.select_profile(profiles, model, firmware)
+        assert profile.name == "Smart Pro"
+        assert not profile.excludes
+
+
+def test_bundled_profiles_are_valid(load_component_module):
+    """Test that every profile shipped with the integration parses."""
+    module = load_component_module("device_profile")
+    sources = sorted(module.PROFILE_DIR.glob("*.json"))
+
+    assert sources
+    for path in sources:
+        module.parse_profile(json.loads(path.read_text(encoding="utf-8")))
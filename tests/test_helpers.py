@@ -0,0 +1,83 @@
+"""Tests for the batch register block decoder."""
+
+import struct
+
+import pytest
+
+DEFINITIONS = {
+    0x0100: {"key": "probe_temp1", "type": "int16", "scale": 0.1, "precision": 1},
+    0x0103: {"key": "airflow", "scale": 0.01, "precision": 2},
+    0x0104: {"key": "hours", "type": "uns32"},
+    0x0106: {"key": "rho1", "type": "float32", "scale": 0.1, "precision": 1},
+}
+
+
+@pytest.fixture
+def records(load_component_module):
+    """Return sensor records for DEFINITIONS, in no particular order."""
+    catalog = load_component_module("catalog")
+    return [
+        catalog.RegisterRecord(
+            reg["key"],
+            address,
+            catalog.KIND_SENSOR,
+            type=reg.get("type", "uint16"),
+            scale=reg.get("scale", 1),
+            precision=reg.get("precision", 0),
+        )
+        for address, reg in reversed(DEFINITIONS.items())
+    ]
+
+
+def test_decode_block_matches_per_register_codecs(load_component_module, records):
+    """Test that a block decodes to the same values as the single codecs."""
+    helpers = load_component_module("helpers")
+    codec = load_component_module("codec")
+    rho_hi, rho_lo = struct.unpack(">HH", struct.pack(">f", 2.5))
+    registers = [0xFF9C, 0x1234, 0x9999, 150, 0x0001, 0x0002, rho_hi, rho_lo]
+
+    layout = helpers.compile_block_layout(records)
+    values = layout.decode(registers)
+
+    data = {0x0100 + offset: raw for offset, raw in enumerate(registers)}
+    for address, reg in DEFINITIONS.items():
+        single = codec.compile_codec(
+            reg["key"],
+            address,
+            reg.get("type", "uint16"),
+            scale=reg.get("scale", 1),
+            precision=reg.get("precision", 0),
+        )
+        assert values[reg["key"]] == single.decode(data)
+    assert values["probe_temp1"] == -10.0
+    assert values["rho1"] == 2.5
+
+
+def test_decode_mapping_skips_gaps_but_not_missing_values(
+    load_component_module, records
+):
+    """Test that only registers holding a value must be present."""
+    helpers = load_component_module("helpers")
+    layout = helpers.compile_block_layout(records)
+    data = {0x0100: 0xFFFF, 0x0103: 2, 0x0104: 0, 0x0105: 3, 0x0106: 0, 0x0107: 0}
+
+    assert layout.count == 8
+    assert layout.decode_mapping(data) == {
+        "probe_temp1": -0.1,
+        "airflow": 0.02,
+        "hours": 3,
+        "rho1": 0.0,
+    }
+    assert layout.decode_mapping({**data, 0x0107: None}) is None
+
+
+def test_compile_block_layout_rejects_text(load_component_module):
+    """Test that char registers cannot be part of a block layout."""
+    helpers = load_component_module("helpers")
+    catalog = load_component_module("catalog")
+    name = catalog.RegisterRecord(
+        "name", 0x0000, catalog.KIND_IDENTITY, type="char", data_length=20
+    )
+
+    with pytest.raises(ValueError):
+        helpers.compile_block_layout([name])
@@ -0,0 +1,46 @@
+"""Tests for setting up and migrating config entries."""
+
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.sabiana_energy_smart import async_migrate_entry
+from custom_components.sabiana_energy_smart.const import DOMAIN
+
+ENTRY_DATA = {"name": "Sabiana HRV", "host": "192.168.1.100", "port": 502, "slave": 1}
+
+
+async def test_unique_ids_are_scoped_to_the_entry(hass):
+    """Test that version 1.1 unique IDs get the entry ID as prefix."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, version=1, minor_version=1)
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    sensor = registry.async_get_or_create(
+        "sensor", DOMAIN, "sabiana_sensor_probe_temp1", config_entry=entry
+    )
+    switch = registry.async_get_or_create(
+        "switch", DOMAIN, "sabiana_switch_holiday_mode", config_entry=entry
+    )
+    foreign = registry.async_get_or_create(
+        "sensor", DOMAIN, "probe_temp2", config_entry=entry
+    )
+
+    assert await async_migrate_entry(hass, entry)
+    assert entry.minor_version == 2
+    assert (
+        registry.async_get(sensor.entity_id).unique_id
+        == f"{entry.entry_id}_sensor_probe_temp1"
+    )
+    assert (
+        registry.async_get(switch.entity_id).unique_id
+        == f"{entry.entry_id}_switch_holiday_mode"
+    )
+    # Only IDs in the old format are touched
+    assert registry.async_get(foreign.entity_id).unique_id == "probe_temp2"
+
+
+async def test_future_entry_versions_are_not_migrated(hass):
+    """Test that an entry from a newer release is refused."""
+    entry = MockConfigEntry(domain=DOMAIN, data=ENTRY_DATA, version=2)
+    entry.add_to_hass(hass)
+
+    assert not await async_migrate_entry(hass, entry)
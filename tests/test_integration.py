@@ -135,3 +135,30 @@ def test_no_obvious_syntax_issues():
             # This is commented out as it might be too strict
             # if line.endswith(' '):
             #     assert False, f"Trailing whitespace in {filepath}:{i}"
+
+
+def test_entity_unique_ids_are_scoped_to_the_config_entry():
+    """Test that entities of several units do not share unique IDs."""
+    component_dir = os.path.join(
+        os.path.dirname(__file__), "..", "custom_components", "sabiana_energy_smart"
+    )
+
+    checked = 0
+    for file in sorted(os.listdir(component_dir)):
+        if not file.endswith(".py"):
+            continue
+        with open(os.path.join(component_dir, file), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), file)
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Assign)
+                and isinstance(node.targets[0], ast.Attribute)
+                and node.targets[0].attr == "_attr_unique_id"
+            ):
+                continue
+            assert ast.unparse(node.value).startswith("f'{entry_id}_"), (
+                f"{file}: {ast.unparse(node.value)} is not scoped to the entry"
+            )
+            checked += 1
+
+    assert checked > 0
@@ -0,0 +1,50 @@
+"""Tests for the Sabiana Modbus client."""
+
+import asyncio
+
+import pytest
+
+
+def test_only_illegal_address_codes_name_missing_registers(load_component_module):
+    """Test that busy and failing devices are not taken for missing registers."""
+    module = load_component_module("modbus_client")
+
+    def response(code):
+        return module.SabianaExceptionResponse(0x0100, 4, code)
+
+    assert response(2).illegal_address
+    assert response(3).illegal_address
+    # Device failure, acknowledge, slave busy, gateway errors, unknown
+    for code in (4, 5, 6, 0x0A, 0x0B, None):
+        assert not response(code).illegal_address
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_leave_the_breaker_half_open(
+    load_component_module,
+):
+    """Test that a connect cancelled mid-probe still lets later probes through."""
+    module = load_component_module("modbus_client")
+    breaker_module = load_component_module("circuit_breaker")
+
+    class HangingClient:
+        connected = False
+
+        async def connect(self):
+            await asyncio.Event().wait()
+
+    client = module.SabianaModbusClient("127.0.0.1", 502)
+    client.client = HangingClient()
+    breaker = breaker_module.CircuitBreaker(initial=0.0, maximum=0.0)
+    breaker.record_failure()
+    client._breaker = breaker
+
+    probe = asyncio.ensure_future(client.ensure_connected())
+    await asyncio.sleep(0)
+    assert breaker.state == breaker_module.STATE_HALF_OPEN
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert breaker.state == breaker_module.STATE_OPEN
+    assert breaker.allow()
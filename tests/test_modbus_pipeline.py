@@ -0,0 +1,168 @@
+"""Tests for the pipelined Modbus TCP read transport."""
+
+import asyncio
+import struct
+
+import pytest
+
+
+@pytest.fixture
+def pipeline_module(load_component_module):
+    """Return the modbus_pipeline module."""
+    return load_component_module("modbus_pipeline")
+
+
+async def _start_server(handle_batch, batch_size):
+    """Start a Modbus TCP server answering requests in batches."""
+
+    async def _client_connected(reader, writer):
+        try:
+            while True:
+                batch = []
+                for _ in range(batch_size):
+                    tid, _proto, length, unit = struct.unpack(
+                        ">HHHB", await reader.readexactly(7)
+                    )
+                    function, address, count = struct.unpack(
+                        ">BHH", await reader.readexactly(length - 1)
+                    )
+                    batch.append((tid, unit, address, count))
+                for tid, unit, pdu in handle_batch(batch):
+                    writer.write(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    server = await asyncio.start_server(_client_connected, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _registers(address, count):
+    """Return fake register contents: each register holds its address."""
+    return struct.pack(f">B{count}H", count * 2, *range(address, address + count))
+
+
+@pytest.mark.asyncio
+async def test_responses_matched_by_transaction_id(pipeline_module):
+    """Test that out-of-order responses reach the right requests."""
+
+    def handle(batch):
+        # Answer in reverse order to prove transaction ID matching
+        return [
+            (tid, unit, b"\x03" + _registers(address, count))
+            for tid, unit, address, count in reversed(batch)
+        ]
+
+    server, port = await _start_server(handle, batch_size=2)
+    pipeline = pipeline_module.ModbusTcpPipeline("127.0.0.1", port, window=2)
+    try:
+        await pipeline.connect()
+        first, second = await asyncio.gather(
+            pipeline.read_holding_registers(0x0100, 3, 1),
+            pipeline.read_holding_registers(0x0200, 2, 1),
+        )
+    finally:
+        await pipeline.close()
+        server.close()
+
+    assert first == [0x0100, 0x0101, 0x0102]
+    assert second == [0x0200, 0x0201]
+
+
+@pytest.mark.asyncio
+async def test_exception_response(pipeline_module):
+    """Test that exception responses raise with their code."""
+
+    def handle(batch):
+        return [(tid, unit, b"\x83\x02") for tid, unit, _address, _count in batch]
+
+    server, port = await _start_server(handle, batch_size=1)
+    pipeline = pipeline_module.ModbusTcpPipeline("127.0.0.1", port)
+    try:
+        await pipeline.connect()
+        with pytest.raises(pipeline_module.PipelineExceptionResponse) as err:
+            await pipeline.read_holding_registers(0x0226, 1, 1)
+    finally:
+        await pipeline.close()
+        server.close()
+
+    assert err.value.code == 2
+
+
+@pytest.mark.asyncio
+async def test_read_without_connection(pipeline_module):
+    """Test that reads fail fast when the pipeline is not connected."""
+    pipeline = pipeline_module.ModbusTcpPipeline("127.0.0.1", 1)
+
+    with pytest.raises(ConnectionError):
+        await pipeline.read_holding_registers(0x0100, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_offline_gateway_does_not_disable_pipelining(load_component_module):
+    """Test that a gateway down at the first poll keeps its pipeline window."""
+    client_module = load_component_module("modbus_client")
+    # A port nothing listens on refuses the connection
+    server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+    client = client_module.SabianaModbusClient("127.0.0.1", port, pipeline_window=4)
+    try:
+        with pytest.raises(client_module.SabianaTransportError):
+            await client.read_block(0x0100, 2)
+        assert client.pipeline_window == 4
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_pipelining_stops_after_repeated_serialized_answers(
+    load_component_module, monkeypatch
+):
+    """Test that only a run of dropped pipelined reads disables the pipeline."""
+    client_module = load_component_module("modbus_client")
+
+    class LossyPipeline:
+        """Pipeline whose reads time out while ``lossy`` is set."""
+
+        lossy = True
+        connected = True
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def read_holding_registers(self, address, count, unit):
+            if LossyPipeline.lossy:
+                raise TimeoutError
+            return [address] * count
+
+        async def close(self):
+            pass
+
+    async def connected():
+        return True
+
+    async def read_serialized(address, count, slave):
+        return [address] * count
+
+    monkeypatch.setattr(client_module, "ModbusTcpPipeline", LossyPipeline)
+    client = client_module.SabianaModbusClient("127.0.0.1", 502, pipeline_window=4)
+    monkeypatch.setattr(client, "ensure_connected", connected)
+    monkeypatch.setattr(client, "_read_serialized", read_serialized)
+    fallback_after = client_module.PIPELINE_FALLBACK_AFTER
+
+    # Lost frames interrupted by a pipelined answer start counting again
+    for _ in range(fallback_after - 1):
+        assert await client.read_block(0x0100, 2) == [0x0100, 0x0100]
+    LossyPipeline.lossy = False
+    assert await client.read_block(0x0100, 1) == [0x0100]
+    LossyPipeline.lossy = True
+    for _ in range(fallback_after - 1):
+        await client.read_block(0x0100, 1)
+    assert client.pipeline_window == 4
+
+    await client.read_block(0x0100, 1)
+    assert client.pipeline_window == 1
+    assert client._pipeline is None
@@ -0,0 +1,51 @@
+"""Tests for the adaptive poll interval."""
+
+import pytest
+
+
+@pytest.fixture
+def interval_module(load_component_module):
+    """Return the poll_interval module."""
+    return load_component_module("poll_interval")
+
+
+def test_stable_values_lengthen_up_to_the_maximum(interval_module):
+    """Test that registers that never change slow polling down."""
+    adaptive = interval_module.AdaptivePollInterval(3.0, 1.0, 10.0)
+
+    for _ in range(20):
+        adaptive.record_cycle(0.1, range(10), set(), utilization=0.05)
+
+    assert adaptive.interval == 10.0
+    assert "limited by maximum interval" in adaptive.reasons
+
+
+def test_volatile_values_shorten_but_respect_cycle_time(interval_module):
+    """Test that changing registers speed polling up to twice the cycle."""
+    adaptive = interval_module.AdaptivePollInterval(3.0, 0.5, 10.0)
+
+    for _ in range(20):
+        adaptive.record_cycle(0.6, range(10), range(10), utilization=0.2)
+
+    assert adaptive.interval == pytest.approx(1.2)
+    assert adaptive.reasons[-1] == "limited by cycle time"
+    assert adaptive.as_dict()["most_volatile"]
+
+
+def test_saturated_bus_backs_off(interval_module):
+    """Test that a busy bus lengthens the interval despite volatile data."""
+    adaptive = interval_module.AdaptivePollInterval(2.0, 1.0, 30.0)
+
+    interval = adaptive.record_cycle(0.1, range(10), range(10), utilization=0.9)
+
+    assert interval == 3.0
+    assert adaptive.reasons[0].startswith("bus saturated")
+
+
+def test_slow_gateway_exceeds_the_maximum(interval_module):
+    """Test that the interval never drops below the measured cycle time."""
+    adaptive = interval_module.AdaptivePollInterval(3.0, 1.0, 5.0)
+
+    interval = adaptive.record_cycle(4.0, range(10), set(), utilization=0.1)
+
+    assert interval == 8.0
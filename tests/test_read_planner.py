@@ -0,0 +1,80 @@
+"""Tests for the Modbus block read planner."""
+
+import pytest
+
+
+@pytest.fixture
+def planner(load_component_module):
+    """Return the read_planner module."""
+    return load_component_module("read_planner")
+
+
+def test_plan_reads_merges_contiguous_addresses(planner):
+    """Test that consecutive addresses collapse into a single block."""
+    addresses = [*range(0x0100, 0x0114), *range(0x0115, 0x0121), 0x0300, 0x0301]
+
+    assert planner.plan_reads(addresses) == [
+        (0x0100, 0x14),
+        (0x0115, 0x0C),
+        (0x0300, 2),
+    ]
+
+
+def test_plan_reads_respects_max_count(planner):
+    """Test that blocks never exceed the Modbus register limit."""
+    blocks = planner.plan_reads(range(300))
+
+    assert blocks == [(0, 125), (125, 125), (250, 50)]
+    assert planner.plan_reads(range(10), max_count=4) == [(0, 4), (4, 4), (8, 2)]
+
+
+def test_plan_reads_empty(planner):
+    """Test that no addresses produce no reads."""
+    assert planner.plan_reads([]) == []
+
+
+def test_split_block(planner):
+    """Test that block results map back to their addresses."""
+    assert planner.split_block(0x0200, 3, [1, 2, 3]) == {
+        0x0200: 1,
+        0x0201: 2,
+        0x0202: 3,
+    }
+    assert planner.split_block(0x0200, 2, None) == {0x0200: None, 0x0201: None}
+    assert planner.split_block(0x0200, 2, [7]) == {0x0200: 7, 0x0201: None}
+
+
+def test_plan_reads_bridges_small_gaps(planner):
+    """Test that holes up to max_gap are read through."""
+    addresses = [*range(0x0100, 0x0114), *range(0x0115, 0x0121)]
+
+    assert planner.plan_reads(addresses, max_gap=1) == [(0x0100, 0x21)]
+    assert planner.plan_reads([0x0200, 0x0204], max_gap=2) == [
+        (0x0200, 1),
+        (0x0204, 1),
+    ]
+    assert planner.plan_reads([0x0200, 0x0204], max_gap=3) == [(0x0200, 5)]
+
+
+def test_plan_reads_never_bridges_skipped_addresses(planner):
+    """Test that learned unreadable addresses split blocks."""
+    addresses = [0x0225, 0x0227, 0x0228]
+
+    assert planner.plan_reads(addresses, max_gap=2) == [(0x0225, 4)]
+    assert planner.plan_reads(addresses, max_gap=2, skip={0x0226}) == [
+        (0x0225, 1),
+        (0x0227, 2),
+    ]
+    assert planner.plan_reads(addresses, max_gap=2, skip={0x0227}) == [
+        (0x0225, 1),
+        (0x0228, 1),
+    ]
+
+
+def test_plan_writes_groups_adjacent_registers_only(planner):
+    """Test that writes group adjacent registers and never bridge holes."""
+    assert planner.plan_writes([0x0218, 0x0213, 0x0219, 0x0214, 0x0215]) == [
+        (0x0213, 3),
+        (0x0218, 2),
+    ]
+    assert planner.plan_writes(range(200)) == [(0, 123), (123, 77)]
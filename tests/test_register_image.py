@@ -0,0 +1,43 @@
+"""Tests for the array-backed register snapshots."""
+
+
+def test_image_reads_like_a_dict(load_component_module):
+    """Test that missing readings read as None and unknown keys as absent."""
+    module = load_component_module("register_image")
+    layout = module.RegisterLayout([0x0102, 0x0100, 0x0101, 0x0200])
+    image = module.RegisterImage.from_mapping(
+        layout, {0x0100: 5, 0x0101: None, 0x0200: 0xFFFF}
+    )
+
+    assert layout.windows == ((0, 3), (3, 1))
+    assert dict(image) == {0x0100: 5, 0x0101: None, 0x0102: None, 0x0200: 0xFFFF}
+    assert image.get(0x0300) is None
+    assert 0x0300 not in image
+    assert 0x0101 in image
+
+
+def test_evolve_leaves_the_original_untouched(load_component_module):
+    """Test copy-on-write updates, including addresses outside the layout."""
+    module = load_component_module("register_image")
+    layout = module.RegisterLayout([0x0100, 0x0101])
+    image = module.RegisterImage.from_mapping(layout, {0x0100: 1, 0x0101: 2})
+
+    updated = image.evolve({0x0100: 10, 0x0101: None})
+    extended = image.evolve({0x0300: 7})
+
+    assert dict(image) == {0x0100: 1, 0x0101: 2}
+    assert dict(updated) == {0x0100: 10, 0x0101: None}
+    assert updated.layout is layout
+    assert dict(extended) == {0x0100: 1, 0x0101: 2, 0x0300: 7}
+
+
+def test_diff_reports_value_and_validity_changes(load_component_module):
+    """Test diffing images with the same and with different layouts."""
+    module = load_component_module("register_image")
+    layout = module.RegisterLayout([0x0100, 0x0101, 0x0105])
+    image = module.RegisterImage.from_mapping(layout, {0x0100: 0, 0x0101: 2, 0x0105: 3})
+
+    assert image.diff(image.evolve({})) == set()
+    assert image.diff(image.evolve({0x0100: None, 0x0105: 4})) == {0x0100, 0x0105}
+    assert image.diff(None) == {0x0100, 0x0101, 0x0105}
+    assert image.diff({0x0100: 0, 0x0101: 2}) == {0x0105}
@@ -0,0 +1,117 @@
+"""Tests for the per-device Modbus request queue."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def queue_module(load_component_module):
+    """Return the request_queue module."""
+    return load_component_module("request_queue")
+
+
+@pytest.mark.asyncio
+async def test_writes_jump_ahead_of_queued_polls(queue_module):
+    """Test that a queued write is served before earlier queued polls."""
+    queue = queue_module.RequestQueue(slots=1)
+    order = []
+    release = asyncio.Event()
+
+    async def request(name, priority, hold=None):
+        async with queue.slot(priority):
+            order.append(name)
+            if hold is not None:
+                await hold.wait()
+
+    first = asyncio.create_task(request("poll-1", queue_module.PRIORITY_POLL, release))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(request("poll-2", queue_module.PRIORITY_POLL)),
+        asyncio.create_task(request("poll-3", queue_module.PRIORITY_POLL)),
+        asyncio.create_task(request("write", queue_module.PRIORITY_WRITE)),
+    ]
+    await asyncio.sleep(0)
+    assert queue.depth == 3
+    assert queue.in_flight == 1
+
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    assert order == ["poll-1", "write", "poll-2", "poll-3"]
+    stats = queue.stats()
+    assert stats["depth"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["max_depth"] == 3
+    assert stats["granted"] == 4
+
+
+@pytest.mark.asyncio
+async def test_slots_bound_concurrency(queue_module):
+    """Test that no more than the configured slots run at once."""
+    queue = queue_module.RequestQueue(slots=2)
+    running = 0
+    peak = 0
+
+    async def request():
+        nonlocal running, peak
+        async with queue.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot(queue_module):
+    """Test that cancelling a queued request keeps the queue usable."""
+    queue = queue_module.RequestQueue(slots=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with queue.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    async with queue.slot():
+        assert queue.in_flight == 1
+    assert queue.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_owners_sharing_a_connection_interleave(queue_module):
+    """Test that queued polls of several devices alternate between them."""
+    queue = queue_module.RequestQueue(slots=1)
+    order = []
+    release = asyncio.Event()
+
+    async def request(owner, hold=None):
+        async with queue.slot(queue_module.PRIORITY_POLL, owner=owner):
+            order.append(owner)
+            if hold is not None:
+                await hold.wait()
+
+    first = asyncio.create_task(request(1, release))
+    await asyncio.sleep(0)
+    waiting = [asyncio.create_task(request(1)) for _ in range(3)]
+    waiting += [asyncio.create_task(request(2)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    assert order == [1, 1, 2, 1, 2, 1, 2]
+    assert queue.stats()["granted_by_owner"] == {1: 4, 2: 3}
@@ -138,56 +138,31 @@ def test_temperature_sensors_have_int16_type():
         )
 
 
-def test_sensor_handles_int16_type():
-    """Test that sensor.py code handles int16 and sig16 types."""
-    sensor_path = os.path.join(
-        os.path.dirname(__file__),
-        "..",
-        "custom_components",
-        "sabiana_energy_smart",
-        "sensor.py",
-    )
-
-    with open(sensor_path, encoding="utf-8") as f:
-        content = f.read()
-
-    # Check that the code handles int16 and sig16 types
-    assert 'if self._type in ("int16", "sig16")' in content, (
-        "sensor.py does not check for int16/sig16 types"
-    )
-
-    # Check that it performs two's complement conversion
-    assert "if raw > 0x7FFF:" in content, "sensor.py does not check for negative values"
-    assert "raw = raw - 0x10000" in content, (
-        "sensor.py does not perform two's complement conversion"
-    )
-
-
-def test_number_handles_negative_values():
-    """Test that number.py handles negative values for reading."""
-    number_path = os.path.join(
-        os.path.dirname(__file__),
-        "..",
-        "custom_components",
-        "sabiana_energy_smart",
-        "number.py",
-    )
-
-    with open(number_path, encoding="utf-8") as f:
-        content = f.read()
-
-    # Check that it checks for negative min values
-    assert "if self._attr_native_min_value < 0:" in content, (
-        "number.py does not check for negative min values"
-    )
-
-    # Check that it performs two's complement conversion for reading
-    assert "if raw > 0x7FFF:" in content, (
-        "number.py does not check for negative values when reading"
-    )
-    assert "raw = raw - 0x10000" in content, (
-        "number.py does not perform two's complement conversion for reading"
-    )
+def test_sensor_handles_int16_type(load_component_module):
+    """Test that int16 and sig16 sensors decode as two's complement."""
+    codec = load_component_module("codec")
+
+    for type_ in ("int16", "sig16"):
+        temp = codec.compile_codec("temp", 0x0100, type_, scale=0.1, precision=1)
+        assert temp.decode({0x0100: 0xFFF6}) == -1.0
+        assert temp.decode({0x0100: 0x00FA}) == 25.0
+
+    unsigned = codec.compile_codec("airflow", 0x0100, "uint16")
+    assert unsigned.decode({0x0100: 0xFFF6}) == 0xFFF6
+
+
+def test_number_handles_negative_values(load_component_module):
+    """Test that numbers with a negative minimum decode as two's complement."""
+    catalog = load_component_module("catalog")
+    number = {"name": "Number", "writable": True, "poll_class": "slow"}
+    registers = {
+        0x0300: {**number, "key": "offset", "scale": 0.1, "precision": 1, "min": -5},
+        0x0301: {**number, "key": "setpoint", "scale": 1, "precision": 0, "min": 0},
+    }
+    table = catalog.RegisterCatalog(catalog.build_records(registers=registers)).codecs
+
+    assert table["offset"].decode({0x0300: 0xFFEC}) == -2.0
+    assert table["setpoint"].decode({0x0301: 0xFFEC}) == 0xFFEC
 
 
 def test_number_handles_negative_values_for_writing():